@@ -4,30 +4,87 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import CosaAPI, CosaAPIError
-from .const import DOMAIN
+from .api import CosaAPI, CosaAPIError, CosaConnectionError
+from .const import (
+    ANALYTICS_BASE_TEMPERATURE,
+    ANALYTICS_WINDOW,
+    CONF_BOILER_POWER,
+    CONF_OPEN_WINDOW_FROST,
+    DOMAIN,
+    EVENT_CHANGE_FIELDS,
+    EVENT_ENDPOINT_CHANGED,
+    HISTORY_DIRECTORY,
+    JOURNAL_SETTING_DEVICE_SETTINGS,
+    JOURNAL_SETTING_TARGET_TEMPERATURES,
+    JOURNAL_STORAGE_VERSION,
+    MODE_MANUAL,
+    MODE_SCHEDULE,
+    OBSERVATION_DIRECTORY,
+    OBSERVATION_INTERVAL,
+    OPTIMISTIC_JOURNAL_FIELDS,
+    OPTION_FROZEN,
+    RUNTIME_STORAGE_VERSION,
+    SCHEDULE_PREFETCH_DELAY,
+    SCHEDULE_SLOW_INTERVAL,
+)
+from .analytics import compute_analytics
+from .detector import CosaOpenWindowDetector
+from .forecast import async_get_forecast_cache
+from .history import OBSERVATION_COLUMNS, CosaHistoryStore, CosaSampleCollector
+from .journal import CosaCommandJournal, CosaWriteResult, journal_storage_key
+from .metrics import CosaRefreshMetrics
+from .models import CosaSnapshot
+from .optimistic import CosaOptimisticState
+from .projection import project_endpoint, project_reports
+from .ring import CosaSampleRing
+from .runtime import CosaRuntimeIntegrator, runtime_storage_key
+from .prometheus import async_register_metrics_view
+from .schedule import OPTION_CODES, WEEKDAYS, CosaSchedule, CosaScheduleError
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
 # Stabil polling - WebSocket problemi çözülünce eklenecek
 UPDATE_INTERVAL = timedelta(seconds=15)  # 15 saniye optimal
 
-PLATFORMS = [Platform.CLIMATE, Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SWITCH, Platform.NUMBER]
+PLATFORMS = [
+    Platform.CLIMATE,
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.SWITCH,
+    Platform.NUMBER,
+    Platform.WEATHER,
+]
+
+
+def _startup_phase(metrics: CosaRefreshMetrics, phase: str, started: float) -> float:
+    """Başlangıç aşamasının süresini kaydet; bir sonraki aşamanın başlangıcını döndür."""
+    now = time.monotonic()
+    metrics.startup[phase] = round(now - started, 3)
+    _LOGGER.debug("⏱️ Başlangıç aşaması %s: %.0f ms", phase, (now - started) * 1000)
+    return now
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Entegrasyonu kur."""
     hass.data.setdefault(DOMAIN, {})
     
+    metrics = CosaRefreshMetrics()
+    phase_started = time.monotonic()
+    
     session = async_get_clientsession(hass)
     api = CosaAPI(session)
     
@@ -42,26 +99,173 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     token = login_result.get("token")
     endpoint_id = entry.data.get("endpoint_id")
+    phase_started = _startup_phase(metrics, "login", phase_started)
+    
+    # Çevrimdışıyken gönderilemeyen komutlar
+    journal = CosaCommandJournal(hass, entry.entry_id)
+    await journal.async_load()
+    history = CosaHistoryStore(hass.config.path(STORAGE_DIR, HISTORY_DIRECTORY))
+    # Sütunları şimdi yükle; poll sırasında son örnek zamanı bellekten okunur
+    await hass.async_add_executor_job(history.last_time, endpoint_id)
+    ring = CosaSampleRing()
+    window_detector = CosaOpenWindowDetector()
+    forecast_cache = async_get_forecast_cache(hass)
+    runtime = CosaRuntimeIntegrator(hass, entry.entry_id)
+    await runtime.async_load()
+    observations = CosaHistoryStore(hass.config.path(STORAGE_DIR, OBSERVATION_DIRECTORY), OBSERVATION_COLUMNS)
+    await hass.async_add_executor_job(observations.last_time, endpoint_id)
+    # Uzun dönem istatistikler yalnızca recorder yüklüyse aktarılır
+    statistics = None
+    if "recorder" in hass.config.components:
+        from .statistics import CosaStatisticsImporter
+        statistics = CosaStatisticsImporter(hass, history, endpoint_id, entry.title)
+    phase_started = _startup_phase(metrics, "warmup", phase_started)
+    
+    def _parse_schedule(raw: Any) -> Optional[CosaSchedule]:
+        """Programı ayrıştır; değişmediyse önbellekteki nesneyi koru."""
+        cached = coordinator.data.get("schedule") if coordinator.data else None
+        try:
+            schedule = CosaSchedule.from_api(raw)
+        except CosaScheduleError as err:
+            _LOGGER.debug("Program ayrıştırılamadı: %s", err)
+            return cached
+        if schedule is None or schedule == cached:
+            return cached
+        return schedule
+    
+    def _next_update_interval(endpoint: dict[str, Any], schedule: Optional[CosaSchedule]) -> timedelta:
+        """Program modunda bir sonraki geçişin hemen ardından yenile, arada yavaş poll et."""
+        if endpoint.get("mode") != MODE_SCHEDULE or schedule is None:
+            return UPDATE_INTERVAL
+        now = dt_util.now()
+        transition = schedule.index.next_transition(now)
+        if transition is None:
+            return UPDATE_INTERVAL
+        until_transition = transition - now + SCHEDULE_PREFETCH_DELAY
+        interval = min(SCHEDULE_SLOW_INTERVAL, until_transition)
+        _LOGGER.debug("Program modu: sonraki geçiş %s, yenileme %s sonra", transition, interval)
+        return interval
+    
+    async def _async_ingest_history(samples: list[dict[str, Any]]) -> int:
+        """Rapor serisindeki yeni örnekleri yerel geçmişe ekle."""
+        try:
+            added = await hass.async_add_executor_job(history.ingest, endpoint_id, samples)
+        except OSError as err:
+            _LOGGER.warning("Geçmiş deposuna yazılamadı: %s", err)
+            return 0
+        if added:
+            _LOGGER.debug("📈 Geçmişe %d yeni örnek eklendi", added)
+            # Tamamlanan saatleri uzun dönem istatistiklere aktar
+            if statistics is not None:
+                hass.async_create_task(statistics.async_import())
+        return added
+    
+    async def _async_record_observation(snapshot: CosaSnapshot) -> int:
+        """Rapor serisinde olmayan dış sıcaklık ve seçeneği belirli aralıklarla kaydet."""
+        now = int(time.time())
+        # Aralık dolmadıysa executor'a hiç gidilmez
+        last = observations.cached_last_time(endpoint_id)
+        if last is not None and now - last < OBSERVATION_INTERVAL:
+            return 0
+        sample = {
+            "time": now,
+            "outdoor_temperature": snapshot.outdoor_temperature,
+            "option": OPTION_CODES.index(snapshot.option) if snapshot.option in OPTION_CODES else None,
+        }
+        try:
+            return await hass.async_add_executor_job(observations.ingest, endpoint_id, [sample])
+        except OSError as err:
+            _LOGGER.warning("Gözlem kaydedilemedi: %s", err)
+            return 0
+    
+    def _compute_analytics() -> Optional[dict[str, Any]]:
+        """Executor'da: analiz penceresindeki örneklerden metrikleri hesapla."""
+        end = int(time.time())
+        start = end - int(ANALYTICS_WINDOW.total_seconds())
+        return compute_analytics(
+            history.query(endpoint_id, start, end),
+            observations.query(endpoint_id, start, end),
+            OPTION_CODES,
+            ANALYTICS_BASE_TEMPERATURE,
+            end,
+        )
     
     # Data fetch fonksiyonu
     async def async_update_data():
         """Veriyi API'den al."""
+        interval = coordinator.update_interval
+        started = metrics.refresh_started(interval.total_seconds() if interval else None)
         try:
             endpoint = await api.get_endpoint_detail(endpoint_id, token)
             
             forecast = {}
             reports = {}
-            place_id = endpoint.get("place")
-            if place_id:
-                forecast = await api.get_forecast(place_id, token)
+            history_added = 0
+            if hass.is_running:
+                place_id = endpoint.get("place")
+                if place_id:
+                    # Tahmin kendi aralığında (TTL) yenilenir, sıcak yolda paylaşılan önbellekten okunur
+                    forecast = await forecast_cache.async_get(api, place_id, token)
+                
+                # Rapor verilerini al; seri akıştan okunurken yalnızca yeni örnekler tutulur
+                collector = CosaSampleCollector(history.cached_last_time(endpoint_id))
+                reports = await api.get_reports(endpoint_id, token, on_sample=collector)
+                if collector.samples:
+                    history_added = await _async_ingest_history(collector.samples)
+            elif coordinator.data:
+                # HA açılırken rapor/tahmin entity'leri henüz yok, önceki veriyi koru
+                forecast = coordinator.data["forecast"]
+                reports = coordinator.data["reports"]
+            
+            schedule = _parse_schedule(endpoint.get("schedule"))
+            coordinator.update_interval = _next_update_interval(endpoint, schedule)
+            metrics.interval_changed(coordinator.update_interval.total_seconds())
             
-            # Rapor verilerini al
-            reports = await api.get_reports(endpoint_id, token)
+            # Yalnızca entity'lerin okuduğu alanları sakla
+            endpoint = project_endpoint(endpoint)
+            reports = project_reports(reports)
+            snapshot = CosaSnapshot(endpoint, forecast, reports)
+            previous = coordinator.data.get("snapshot") if coordinator.data else None
+            diff = snapshot.diff(previous) if previous else None
+            now = time.time()
+            window_detector.update(now, snapshot.temperature)
+            if snapshot.combi_state is not None:
+                runtime.update(now, snapshot.heating, entry.options.get(CONF_BOILER_POWER, 0.0))
+            ring.append(
+                now,
+                snapshot.temperature,
+                snapshot.humidity,
+                snapshot.raw_target_temperature,
+                snapshot.heating if snapshot.combi_state is not None else None,
+            )
             
-            return {"endpoint": endpoint, "forecast": forecast, "reports": reports}
+            # Analitik yalnızca yeni örnek geldiğinde yeniden hesaplanır
+            analytics = coordinator.data.get("analytics") if coordinator.data else None
+            if hass.is_running:
+                observed = await _async_record_observation(snapshot)
+                if history_added or observed:
+                    analytics = await hass.async_add_executor_job(_compute_analytics)
+            metrics.refresh_succeeded(started)
+            
+            return {
+                "endpoint": endpoint,
+                "forecast": forecast,
+                "reports": reports,
+                "schedule": schedule,
+                "snapshot": snapshot,
+                "diff": diff,
+                "analytics": analytics,
+                # Entity'ler yalnızca kendi alanları değiştiyse yazar
+                "changed": frozenset(diff) if diff is not None else None,
+            }
             
         except CosaAPIError as err:
+            metrics.refresh_failed()
             raise UpdateFailed(f"API hatası: {err}") from err
+        except Exception:
+            # Zaman aşımı vb. diğer hatalar da başarısız yenileme sayılır
+            metrics.refresh_failed()
+            raise
     
     # Coordinator oluştur - stabil polling
     coordinator = DataUpdateCoordinator(
@@ -73,44 +277,186 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     
     await coordinator.async_config_entry_first_refresh()
+    phase_started = _startup_phase(metrics, "first_refresh", phase_started)
     
     # Coordinator'a yardımcı metodlar ekle
     coordinator.api = api
     coordinator.token = token
     coordinator.endpoint_id = endpoint_id
+    coordinator.journal = journal
+    coordinator.history = history
+    coordinator.ring = ring
+    coordinator.window_detector = window_detector
+    coordinator.runtime = runtime
+    coordinator.forecast_cache = forecast_cache
+    coordinator.metrics = metrics
+    
+    def _optimistic_held(endpoint: str, field: str) -> bool:
+        """Komutu günlükte bekleyen iyimser değer onay beklerken düşmez."""
+        return any(
+            field in fields and journal.has_pending(endpoint, setting)
+            for setting, fields in OPTIMISTIC_JOURNAL_FIELDS.items()
+        )
+    
+    coordinator.optimistic = CosaOptimisticState(held=_optimistic_held)
     
     def _get_current_calibration() -> float:
         """Mevcut kalibrasyon değerini al."""
-        if coordinator.data:
-            return coordinator.data.get("endpoint", {}).get("calibration", 0.0)
-        return 0.0
+        pending = journal.pending_payload(endpoint_id, JOURNAL_SETTING_DEVICE_SETTINGS)
+        if pending:
+            return pending["calibration"]
+        return CosaSnapshot.from_data(coordinator.data).calibration
     
     def _is_open_window_enabled() -> bool:
         """Açık pencere özelliğinin aktif olup olmadığını kontrol et."""
-        if coordinator.data:
-            return coordinator.data.get("endpoint", {}).get("openWindowEnable", False)
-        return False
+        pending = journal.pending_payload(endpoint_id, JOURNAL_SETTING_DEVICE_SETTINGS)
+        if pending:
+            return pending["open_window_enable"]
+        return CosaSnapshot.from_data(coordinator.data).open_window_enable
+    
+    async def _send_temperatures(temps: dict[str, float]) -> bool:
+        return await api.set_target_temperatures(
+            endpoint_id, temps["home"], temps["away"], temps["sleep"], temps["custom"], token
+        )
+    
+    async def _send_device_settings(settings: dict[str, Any]) -> bool:
+        return await api.set_device_settings(
+            endpoint_id,
+            settings["calibration"],
+            open_window_enable=settings["open_window_enable"],
+            open_window_duration=settings["open_window_duration"],
+            token=token,
+        )
+    
+    async def _async_write(setting: str, payload: dict[str, Any]) -> CosaWriteResult:
+        """Yazma komutunu gönder; buluta ulaşılamazsa günlüğe al."""
+        send = _send_temperatures if setting == JOURNAL_SETTING_TARGET_TEMPERATURES else _send_device_settings
+        try:
+            result = await send(payload)
+        except CosaConnectionError:
+            # Değişiklik kaybolmasın, bağlantı gelince tekrar gönderilecek
+            await journal.async_record(endpoint_id, setting, payload)
+            return CosaWriteResult.QUEUED
+        if not result:
+            return CosaWriteResult.REJECTED
+        await journal.async_discard(endpoint_id, setting)
+        return CosaWriteResult.SENT
+    
+    def _replay_handler(setting: str, send: Callable[[dict[str, Any]], Awaitable[bool]]):
+        async def _async_send(payload: dict[str, Any]) -> bool:
+            result = await send(payload)
+            if not result:
+                # Reddedilen komutun iyimser değerleri artık onaylanmayacak
+                for field in OPTIMISTIC_JOURNAL_FIELDS[setting]:
+                    coordinator.optimistic.drop(endpoint_id, field)
+            return result
+        return _async_send
+    
+    async def _async_replay_journal() -> None:
+        if await journal.async_replay({
+            JOURNAL_SETTING_TARGET_TEMPERATURES: _replay_handler(
+                JOURNAL_SETTING_TARGET_TEMPERATURES, _send_temperatures
+            ),
+            JOURNAL_SETTING_DEVICE_SETTINGS: _replay_handler(
+                JOURNAL_SETTING_DEVICE_SETTINGS, _send_device_settings
+            ),
+        }):
+            await coordinator.async_request_refresh()
+    
+    @callback
+    def _async_check_journal() -> None:
+        """Başarılı güncellemeden sonra bekleyen komutları gönder."""
+        if coordinator.last_update_success and journal.replay_due:
+            hass.async_create_task(_async_replay_journal())
+    
+    entry.async_on_unload(coordinator.async_add_listener(_async_check_journal))
+    
+    last_fired: Optional[dict[str, Any]] = None
+    
+    @callback
+    def _async_fire_changes() -> None:
+        """Mod, preset ve bağlantı geçişlerini yenileme başına tek olay olarak yayınla."""
+        nonlocal last_fired
+        data = coordinator.data
+        if not coordinator.last_update_success or not data or data is last_fired:
+            return
+        last_fired = data
+        changes = {
+            field: change
+            for field, change in (data.get("diff") or {}).items()
+            if field in EVENT_CHANGE_FIELDS
+        }
+        if changes:
+            hass.bus.async_fire(
+                EVENT_ENDPOINT_CHANGED,
+                {
+                    "entry_id": entry.entry_id,
+                    "endpoint_id": endpoint_id,
+                    "name": data["snapshot"].name,
+                    "changes": changes,
+                },
+            )
+    
+    entry.async_on_unload(coordinator.async_add_listener(_async_fire_changes))
     
     coordinator._get_current_calibration = _get_current_calibration
     coordinator._is_open_window_enabled = _is_open_window_enabled
     
-    async def async_set_mode(mode: str, option: Optional[str] = None) -> bool:
+    async def async_set_mode(mode: str, option: Optional[str] = None, refresh: bool = True) -> bool:
         """Mod değiştir."""
         result = await api.set_mode(endpoint_id, mode, option, token)
-        if result:
+        if result and refresh:
             await coordinator.async_request_refresh()
         return result
     
-    async def async_set_temperatures(home: float, away: float, sleep: float, custom: float) -> bool:
+    # Yerel algılayıcı pencereyi açık gördüğünde geçilmeden önceki mod/seçenek
+    frost_restore: Optional[tuple[str, Optional[str]]] = None
+    
+    async def _async_apply_open_window(is_open: bool) -> None:
+        nonlocal frost_restore
+        snapshot = coordinator.data["snapshot"]
+        if is_open:
+            if snapshot.mode == MODE_MANUAL and snapshot.option == OPTION_FROZEN:
+                return
+            _LOGGER.info("🪟 Açık pencere algılandı (%s), donma korumasına geçiliyor", endpoint_id)
+            if await async_set_mode(MODE_MANUAL, OPTION_FROZEN, refresh=False):
+                frost_restore = (snapshot.mode, snapshot.option if snapshot.mode == MODE_MANUAL else None)
+        elif frost_restore is not None:
+            mode, option = frost_restore
+            frost_restore = None
+            # Bu arada kullanıcı modu değiştirdiyse dokunma
+            if snapshot.mode == MODE_MANUAL and snapshot.option == OPTION_FROZEN:
+                _LOGGER.info("🪟 Pencere kapandı (%s), önceki moda dönülüyor", endpoint_id)
+                await async_set_mode(mode, option, refresh=False)
+    
+    window_acted = window_detector.is_open
+    
+    @callback
+    def _async_check_open_window() -> None:
+        """Algılayıcı durumu değiştiyse (seçenek açıksa) donma korumasını uygula."""
+        nonlocal window_acted
+        if not coordinator.last_update_success or window_detector.is_open == window_acted:
+            return
+        window_acted = window_detector.is_open
+        if entry.options.get(CONF_OPEN_WINDOW_FROST, False) or frost_restore is not None:
+            hass.async_create_task(_async_apply_open_window(window_acted))
+    
+    entry.async_on_unload(coordinator.async_add_listener(_async_check_open_window))
+    
+    async def async_set_temperatures(home: float, away: float, sleep: float, custom: float) -> CosaWriteResult:
         """Tüm sıcaklıkları ayarla."""
         _LOGGER.info("🔧 Sıcaklık ayarlanıyor: home=%s, away=%s, sleep=%s, custom=%s", 
                      home, away, sleep, custom)
         
         try:
-            result = await api.set_target_temperatures(endpoint_id, home, away, sleep, custom, token)
-            _LOGGER.info("API sonuç: %s", result)
+            result = await _async_write(
+                JOURNAL_SETTING_TARGET_TEMPERATURES,
+                {"home": home, "away": away, "sleep": sleep, "custom": custom},
+            )
+            _LOGGER.info("API sonuç: %s", result.name)
             
-            if result:
+            # Günlüğe alındıysa yenilemenin anlamı yok; tekrar sonrası yenilenir
+            if result is CosaWriteResult.SENT:
                 # Kısa bir bekleme sonrası refresh - API'nin işlemesi için
                 await asyncio.sleep(1)
                 await coordinator.async_request_refresh()
@@ -118,61 +464,86 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             return result
         except Exception as err:
             _LOGGER.error("Sıcaklık ayarlama hatası: %s", err)
-            return False
+            return CosaWriteResult.REJECTED
     
-    async def async_set_preset_temperature(preset: str, temperature: float) -> bool:
+    async def async_set_preset_temperature(preset: str, temperature: float) -> CosaWriteResult:
         """Preset sıcaklığını ayarla."""
-        endpoint = coordinator.data.get("endpoint", {}) if coordinator.data else {}
+        return await async_set_preset_temperatures({preset: temperature})
+    
+    async def async_set_preset_temperatures(changes: dict[str, float], refresh: bool = True) -> CosaWriteResult:
+        """Bir veya daha fazla preset sıcaklığını tek istekte ayarla."""
+        snapshot = CosaSnapshot.from_data(coordinator.data)
         
-        temps = {
-            "home": endpoint.get("homeTemperature", 21.0),
-            "away": endpoint.get("awayTemperature", 18.0),
-            "sleep": endpoint.get("sleepTemperature", 19.0),
-            "custom": endpoint.get("customTemperature", 22.0),
+        # Günlükte bekleyen değişiklik varsa onun üzerine yaz
+        temps = journal.pending_payload(endpoint_id, JOURNAL_SETTING_TARGET_TEMPERATURES) or {
+            "home": snapshot.home_temperature or 21.0,
+            "away": snapshot.away_temperature or 18.0,
+            "sleep": snapshot.sleep_temperature or 19.0,
+            "custom": snapshot.custom_temperature or 22.0,
         }
-        temps[preset] = temperature
+        temps.update(changes)
         
-        result = await api.set_target_temperatures(
-            endpoint_id,
-            temps["home"], temps["away"], temps["sleep"], temps["custom"],
-            token
-        )
-        if result:
+        result = await _async_write(JOURNAL_SETTING_TARGET_TEMPERATURES, temps)
+        if result is CosaWriteResult.SENT and refresh:
             await asyncio.sleep(1)
             await coordinator.async_request_refresh()
         return result
     
-    async def async_set_open_window(enabled: bool) -> bool:
+    async def async_set_open_window(enabled: bool) -> CosaWriteResult:
         """Açık pencere algılama özelliğini ayarla."""
         calibration = _get_current_calibration()
-        result = await api.set_device_settings(
-            endpoint_id, 
-            calibration, 
-            open_window_enable=enabled,
-            open_window_duration=30,
-            token=token
-        )
-        if result:
+        result = await _async_write(JOURNAL_SETTING_DEVICE_SETTINGS, {
+            "calibration": calibration,
+            "open_window_enable": enabled,
+            "open_window_duration": 30,
+        })
+        if result is CosaWriteResult.SENT:
             await coordinator.async_request_refresh()
         return result
     
-    async def async_set_calibration(value: float) -> bool:
+    async def async_set_calibration(value: float) -> CosaWriteResult:
         """Kalibrasyonu ayarla."""
         open_window_enabled = _is_open_window_enabled()
-        result = await api.set_device_settings(
-            endpoint_id, 
-            value, 
-            open_window_enable=open_window_enabled,
-            open_window_duration=30,
-            token=token
-        )
-        if result:
+        result = await _async_write(JOURNAL_SETTING_DEVICE_SETTINGS, {
+            "calibration": value,
+            "open_window_enable": open_window_enabled,
+            "open_window_duration": 30,
+        })
+        if result is CosaWriteResult.SENT:
             await coordinator.async_request_refresh()
         return result
     
+    async def async_set_schedule(raw_days: dict[str, Any]) -> list[str]:
+        """Programdaki günleri değiştir; yalnızca farklı olan günleri gönder."""
+        cached = coordinator.data.get("schedule") if coordinator.data else None
+        if cached is None:
+            # Boş programla karşılaştırmak verilmeyen günleri de silerdi; önce cihazdan al
+            await coordinator.async_refresh()
+            cached = coordinator.data.get("schedule") if coordinator.data else None
+            if cached is None:
+                raise CosaScheduleError("Cihazın mevcut programı alınamadı")
+        updated = cached.replace_days(raw_days)
+        # Yalnızca istekte verilen ve gerçekten farklı olan günler gönderilir
+        changed = [day for day in updated.changed_days(cached) if WEEKDAYS[day] in raw_days]
+        if not changed:
+            _LOGGER.debug("Programda değişiklik yok, istek gönderilmedi")
+            return []
+        
+        if not await api.set_schedule(endpoint_id, updated.to_api(changed), token):
+            raise CosaAPIError("Program API tarafından reddedildi")
+        
+        # Dinleyicilere yeni programı bildir; bu bir endpoint değişikliği olayı değil
+        coordinator.async_set_updated_data(
+            {**coordinator.data, "schedule": updated, "diff": None, "changed": frozenset()}
+        )
+        await coordinator.async_request_refresh()
+        return [WEEKDAYS[day] for day in changed]
+    
     coordinator.async_set_mode = async_set_mode
+    coordinator.async_set_schedule = async_set_schedule
     coordinator.async_set_temperatures = async_set_temperatures
     coordinator.async_set_preset_temperature = async_set_preset_temperature
+    coordinator.async_set_preset_temperatures = async_set_preset_temperatures
     coordinator.async_set_open_window = async_set_open_window
     coordinator.async_set_calibration = async_set_calibration
     
@@ -182,7 +553,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "token": token,
     }
     
+    async_setup_services(hass)
+    async_register_metrics_view(hass)
+    
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _startup_phase(metrics, "platform_setup", phase_started)
+    
+    if not hass.is_running:
+        @callback
+        def _async_refresh_deferred(_hass: HomeAssistant) -> None:
+            """HA başladı: rapor ve hava durumu verisini al."""
+            hass.async_create_task(coordinator.async_request_refresh())
+        
+        entry.async_on_unload(async_at_started(hass, _async_refresh_deferred))
+    
+    @callback
+    def _async_record_write_delay() -> None:
+        """Entity'lerden sonra çağrılır: API yanıtı -> state yazımı gecikmesi."""
+        if coordinator.last_update_success:
+            metrics.state_written(api.last_response_at)
+    
+    # Platformlardan sonra eklenir, böylece entity dinleyicilerinden sonra çalışır
+    entry.async_on_unload(coordinator.async_add_listener(_async_record_write_delay))
     
     return True
 
@@ -193,5 +585,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            async_unload_services(hass)
+        async_get_forecast_cache(hass).prune({
+            data["coordinator"].data["endpoint"].get("place")
+            for data in hass.data[DOMAIN].values()
+            if data["coordinator"].data
+        })
     
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Entegrasyon silinince bekleyen komut günlüğünü, sayaçları ve yerel geçmişi de sil."""
+    await Store(hass, JOURNAL_STORAGE_VERSION, journal_storage_key(entry.entry_id)).async_remove()
+    await Store(hass, RUNTIME_STORAGE_VERSION, runtime_storage_key(entry.entry_id)).async_remove()
+    endpoint_id = entry.data.get("endpoint_id")
+    if endpoint_id:
+        for directory in (HISTORY_DIRECTORY, OBSERVATION_DIRECTORY):
+            store = CosaHistoryStore(hass.config.path(STORAGE_DIR, directory))
+            await hass.async_add_executor_job(store.remove, endpoint_id)
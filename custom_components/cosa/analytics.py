@@ -0,0 +1,109 @@
+"""COSA Isıtma Analitiği (NumPy; executor'da çalıştırılır)."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Optional
+
+import numpy as np
+
+from .history import TIME_COLUMN
+
+HOUR = 3600
+# Örnekler arası boşluk bundan uzunsa süre hesabında kırpılır (kopukluk)
+MAX_SAMPLE_GAP = 900
+
+
+def _hourly_mean(hours: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Saat indeksine göre ortalama (örneği olmayan saatler NaN)."""
+    valid = ~np.isnan(values)
+    counts = np.bincount(hours[valid], minlength=size)
+    sums = np.bincount(hours[valid], weights=values[valid], minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+def compute_analytics(
+    samples: dict[str, array],
+    observations: dict[str, array],
+    options: tuple[str, ...],
+    base_temperature: float,
+    end: int,
+) -> Optional[dict[str, Any]]:
+    """Rapor örnekleri ve gözlemlerden ısıtma metrikleri."""
+    times = np.frombuffer(samples[TIME_COLUMN], dtype=np.int64)
+    if times.size < 2:
+        return None
+    temperature = np.frombuffer(samples["temperature"], dtype=np.float32).astype(np.float64)
+    target = np.frombuffer(samples["target_temperature"], dtype=np.float32).astype(np.float64)
+    heating_raw = np.frombuffer(samples["heating"], dtype=np.int8)
+
+    # Her örneğin temsil ettiği süre (sonraki örneğe kadar, kopukluklarda kırpılmış)
+    durations = np.minimum(np.diff(times, append=end), MAX_SAMPLE_GAP).clip(min=0)
+    heating = np.where(heating_raw > 0, 1.0, 0.0)
+    known = heating_raw >= 0
+
+    first_hour = int(times[0]) - int(times[0]) % HOUR
+    hours = (times - first_hour) // HOUR
+    size = int(hours[-1]) + 1
+
+    # Saatlik çalışma oranı (duty cycle)
+    heated = np.bincount(hours[known], weights=(heating * durations)[known], minlength=size)
+    covered = np.bincount(hours[known], weights=durations[known], minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        duty = np.where(covered > 0, heated / np.maximum(covered, 1), np.nan)
+
+    # Hedefe göre sapma
+    valid = ~np.isnan(temperature) & ~np.isnan(target)
+    deviation = temperature[valid] - target[valid]
+    overshoot = np.clip(deviation, 0, None)
+    undershoot = np.clip(-deviation, 0, None)
+
+    result: dict[str, Any] = {
+        "duty_cycle_last_hour": None,
+        "duty_cycle_average": None,
+        "heating_hours": round(float(heated.sum()) / HOUR, 2),
+        "overshoot": round(float(overshoot.mean()), 2) if deviation.size else None,
+        "undershoot": round(float(undershoot.mean()), 2) if deviation.size else None,
+        "overshoot_max": round(float(overshoot.max()), 2) if deviation.size else None,
+        "heating_degree_hours": None,
+        "heating_hours_per_degree_hour": None,
+        "runtime_per_option": {},
+        "hours": size,
+    }
+    complete = duty[:-1] if size > 1 else duty
+    if complete.size and not np.all(np.isnan(complete)):
+        result["duty_cycle_last_hour"] = None if np.isnan(complete[-1]) else round(float(complete[-1]) * 100, 1)
+        result["duty_cycle_average"] = round(float(np.nanmean(complete)) * 100, 1)
+
+    observed_times = np.frombuffer(observations[TIME_COLUMN], dtype=np.int64)
+    if observed_times.size:
+        # Dış sıcaklığa göre ısıtma derece-saati
+        outdoor = np.frombuffer(observations["outdoor_temperature"], dtype=np.float32).astype(np.float64)
+        in_window = observed_times >= first_hour
+        outdoor_hours = (observed_times[in_window] - first_hour) // HOUR
+        hourly_outdoor = _hourly_mean(outdoor_hours, outdoor[in_window], max(size, int(outdoor_hours.max(initial=0)) + 1))
+        deficit = np.clip(base_temperature - hourly_outdoor, 0, None)
+        if not np.all(np.isnan(deficit)):
+            result["heating_degree_hours"] = round(float(np.nansum(deficit)), 1)
+            if result["heating_degree_hours"]:
+                result["heating_hours_per_degree_hour"] = round(
+                    result["heating_hours"] / result["heating_degree_hours"], 4
+                )
+
+        # Her örneğe o andaki seçeneği eşle (son gözlem)
+        option_codes = np.frombuffer(observations["option"], dtype=np.int8)
+        position = np.searchsorted(observed_times, times, side="right") - 1
+        matched = position >= 0
+        codes = option_codes[position[matched]]
+        usable = (codes >= 0) & (codes < len(options)) & known[matched]
+        runtime = np.bincount(
+            codes[usable],
+            weights=(heating * durations)[matched][usable],
+            minlength=len(options),
+        )
+        result["runtime_per_option"] = {
+            option: round(float(seconds) / HOUR, 2) for option, seconds in zip(options, runtime)
+        }
+
+    return result
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import aiohttp
+import ijson
 
 from .const import (
     API_BASE_URL,
     API_TIMEOUT,
+    REPORT_STREAM_THRESHOLD,
     ENDPOINT_LOGIN,
     ENDPOINT_GET_ENDPOINTS,
     ENDPOINT_GET_ENDPOINT,
@@ -18,10 +23,13 @@ from .const import (
     ENDPOINT_SET_TARGET_TEMPERATURES,
     ENDPOINT_GET_FORECAST,
     ENDPOINT_SET_DEVICE_SETTINGS,
+    ENDPOINT_SET_SCHEDULE,
     HEADER_USER_AGENT,
     HEADER_CONTENT_TYPE,
     HEADER_PROVIDER,
 )
+from .metrics import CosaRequestStats
+from .report_stream import CountingReader, SampleCallback, parse_report, split_report
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +44,32 @@ class CosaAuthError(CosaAPIError):
     pass
 
 
+class CosaConnectionError(CosaAPIError):
+    """Buluta ulaşılamadı (timeout veya bağlantı hatası)."""
+    pass
+
+
+_T = TypeVar("_T")
+
+
+def _instrumented(method: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+    """Metot süresini ve fırlattığı hata sınıfını istatistiklere yaz."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self: CosaAPI, *args: Any, **kwargs: Any) -> _T:
+        started = time.monotonic()
+        try:
+            result = await method(self, *args, **kwargs)
+        except Exception as err:
+            self.stats.record(name, time.monotonic() - started, err)
+            raise
+        self.stats.record(name, time.monotonic() - started)
+        return result
+
+    return wrapper
+
+
 class CosaAPI:
     """COSA Termostat API İstemcisi."""
 
@@ -43,6 +77,10 @@ class CosaAPI:
         self._session = session
         self._own_session = False
         self._token: Optional[str] = None
+        # Tazelik metrikleri için sayaçlar
+        self.response_count = 0
+        self.last_response_at: Optional[float] = None
+        self.stats = CosaRequestStats()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Session al veya oluştur."""
@@ -57,6 +95,14 @@ class CosaAPI:
             await self._session.close()
             self._session = None
 
+    async def _read_json(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
+        """Yanıtı çöz ve zamanını kaydet."""
+        data = await response.json()
+        self.response_count += 1
+        self.last_response_at = time.monotonic()
+        self.stats.payload(response.url.path, len(await response.read()))
+        return data
+
     def _get_base_headers(self) -> dict[str, str]:
         return {
             "User-Agent": HEADER_USER_AGENT,
@@ -72,6 +118,7 @@ class CosaAPI:
             headers["authtoken"] = use_token
         return headers
 
+    @_instrumented
     async def login(self, email: str, password: str) -> dict[str, Any]:
         """Login ve token al."""
         session = await self._get_session()
@@ -83,7 +130,7 @@ class CosaAPI:
                 url, json=payload, headers=self._get_base_headers(),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 
                 if data.get("ok") == 0:
                     error_code = data.get("code", "unknown")
@@ -95,9 +142,12 @@ class CosaAPI:
                 
                 return {"ok": True, "token": token}
                 
+        except asyncio.TimeoutError as err:
+            raise CosaConnectionError("login timeout") from err
         except aiohttp.ClientError as err:
             raise CosaAPIError(f"Bağlantı hatası: {err}") from err
 
+    @_instrumented
     async def get_endpoints(self, token: Optional[str] = None) -> list[dict[str, Any]]:
         """Endpoint listesini al."""
         session = await self._get_session()
@@ -108,16 +158,19 @@ class CosaAPI:
                 url, json={}, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 
                 if data.get("ok") == 0:
                     return []
                 
                 return data.get("endpoints", [])
                 
+        except asyncio.TimeoutError as err:
+            raise CosaConnectionError("get_endpoints timeout") from err
         except aiohttp.ClientError as err:
             raise CosaAPIError(f"Bağlantı hatası: {err}") from err
 
+    @_instrumented
     async def get_endpoint_detail(self, endpoint_id: str, token: Optional[str] = None) -> dict[str, Any]:
         """Endpoint detaylarını al."""
         session = await self._get_session()
@@ -129,16 +182,19 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 
                 if data.get("ok") == 0:
                     raise CosaAPIError(f"API hatası: {data.get('code')}")
                 
                 return data.get("endpoint", {})
                 
+        except asyncio.TimeoutError as err:
+            raise CosaConnectionError("get_endpoint_detail timeout") from err
         except aiohttp.ClientError as err:
             raise CosaAPIError(f"Bağlantı hatası: {err}") from err
 
+    @_instrumented
     async def get_forecast(self, place_id: str, token: Optional[str] = None) -> dict[str, Any]:
         """Hava durumu tahminini al."""
         session = await self._get_session()
@@ -150,7 +206,7 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 
                 if data.get("ok") == 0:
                     return {}
@@ -159,9 +215,14 @@ class CosaAPI:
                 _LOGGER.debug("Forecast verisi alındı - hourly: %s", bool(data.get("hourly")))
                 return data
                 
-        except aiohttp.ClientError:
+        except asyncio.TimeoutError as err:
+            self.stats.error("get_forecast", err)
+            return {}
+        except aiohttp.ClientError as err:
+            self.stats.error("get_forecast", err)
             return {}
 
+    @_instrumented
     async def set_mode(
         self, endpoint_id: str, mode: str, option: Optional[str] = None, token: Optional[str] = None
     ) -> bool:
@@ -179,13 +240,16 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 _LOGGER.debug("set_mode response: %s", data)
                 return data.get("ok") == 1
                 
+        except asyncio.TimeoutError as err:
+            raise CosaConnectionError("set_mode timeout") from err
         except aiohttp.ClientError as err:
             raise CosaAPIError(f"Bağlantı hatası: {err}") from err
 
+    @_instrumented
     async def set_target_temperatures(
         self, endpoint_id: str,
         home: float, away: float, sleep: float, custom: float,
@@ -208,17 +272,18 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 _LOGGER.info("set_target_temperatures response: %s", data)
                 return data.get("ok") == 1
                 
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as err:
             _LOGGER.warning("set_target_temperatures timeout - API yanıt vermiyor")
-            return False
+            raise CosaConnectionError("set_target_temperatures timeout") from err
         except aiohttp.ClientError as err:
             _LOGGER.error("set_target_temperatures error: %s", err)
-            return False
+            raise CosaConnectionError(f"Bağlantı hatası: {err}") from err
 
+    @_instrumented
     async def set_combi_settings(
         self, endpoint_id: str, 
         child_lock: bool,
@@ -254,15 +319,17 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 _LOGGER.info("✅ Çocuk kilidi API yanıtı: %s", data)
                 return data.get("ok") == 1
                 
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as err:
             _LOGGER.warning("⏱️ Çocuk kilidi API timeout")
+            self.stats.error("set_combi_settings", err)
             return False
         except aiohttp.ClientError as err:
             _LOGGER.error("❌ Çocuk kilidi API hatası: %s", err)
+            self.stats.error("set_combi_settings", err)
             return False
         
         try:
@@ -270,17 +337,20 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 _LOGGER.info("✅ Çocuk kilidi API yanıtı: %s", data)
                 return data.get("ok") == 1
                 
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as err:
             _LOGGER.warning("⏱️ Çocuk kilidi API timeout")
+            self.stats.error("set_combi_settings", err)
             return False
         except aiohttp.ClientError as err:
             _LOGGER.error("❌ Çocuk kilidi API hatası: %s", err)
+            self.stats.error("set_combi_settings", err)
             return False
 
+    @_instrumented
     async def set_device_settings(
         self, endpoint_id: str, 
         calibration: float,
@@ -308,19 +378,58 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 _LOGGER.info("✅ Cihaz ayarları API yanıtı: %s", data)
                 return data.get("ok") == 1
                 
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as err:
             _LOGGER.warning("⏱️ Cihaz ayarları API timeout")
-            return False
+            raise CosaConnectionError("set_device_settings timeout") from err
         except aiohttp.ClientError as err:
             _LOGGER.error("❌ Cihaz ayarları API hatası: %s", err)
-            return False
+            raise CosaConnectionError(f"Bağlantı hatası: {err}") from err
 
-    async def get_reports(self, endpoint_id: str, token: Optional[str] = None) -> dict[str, Any]:
-        """Rapor verilerini al (son 24 saat)."""
+    @_instrumented
+    async def set_schedule(
+        self, endpoint_id: str,
+        schedule: dict[str, list[dict[str, Any]]],
+        token: Optional[str] = None
+    ) -> bool:
+        """Haftalık programı ayarla (yalnızca gönderilen günler değişir)."""
+        session = await self._get_session()
+        url = f"{API_BASE_URL}{ENDPOINT_SET_SCHEDULE}"
+        payload = {"endpoint": endpoint_id, "schedule": schedule}
+        
+        _LOGGER.debug("set_schedule payload: %s", payload)
+        
+        try:
+            async with session.post(
+                url, json=payload, headers=self._get_auth_headers(token),
+                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+            ) as response:
+                data = await self._read_json(response)
+                _LOGGER.info("📅 Program API yanıtı: %s", data)
+                return data.get("ok") == 1
+                
+        except asyncio.TimeoutError as err:
+            _LOGGER.warning("⏱️ Program API timeout")
+            raise CosaConnectionError("set_schedule timeout") from err
+        except aiohttp.ClientError as err:
+            _LOGGER.error("❌ Program API hatası: %s", err)
+            raise CosaConnectionError(f"Bağlantı hatası: {err}") from err
+
+    @_instrumented
+    async def get_reports(
+        self,
+        endpoint_id: str,
+        token: Optional[str] = None,
+        on_sample: Optional[SampleCallback] = None,
+    ) -> dict[str, Any]:
+        """Rapor verilerini al (son 24 saat).
+
+        Büyük yanıtlar akış halinde ayrıştırılır; on_sample verilirse `data`
+        serisi dönen rapora eklenmez, örnekler tek tek on_sample'a verilir.
+        """
         from .const import ENDPOINT_GET_REPORTS
         session = await self._get_session()
         url = f"{API_BASE_URL}{ENDPOINT_GET_REPORTS}"
@@ -331,19 +440,38 @@ class CosaAPI:
                 url, json=payload, headers=self._get_auth_headers(token),
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                data = await response.json()
+                # API yanıtı: {"report": {"data": [...], "stats": {...}, "summary": {...}}, "ok": 1}
+                length = response.content_length
+                if length is not None and length <= REPORT_STREAM_THRESHOLD:
+                    # Küçük gövdede json.loads akıştan birkaç kat hızlı
+                    body = await response.read()
+                    size = len(body)
+                    ok, report = split_report(json.loads(body), on_sample)
+                else:
+                    reader = CountingReader(response.content)
+                    ok, report = await parse_report(reader, on_sample)
+                    size = reader.size
+                self.response_count += 1
+                self.last_response_at = time.monotonic()
+                self.stats.payload(response.url.path, size)
                 
-                if data.get("ok") == 0:
+                if ok == 0:
                     _LOGGER.warning("Rapor verisi alınamadı")
                     return {}
                 
-                
-                # API yanıtı: {"report": {"data": [...], "stats": {...}, "summary": {...}}, "ok": 1}
-                report = data.get("report", {})
                 _LOGGER.debug("Rapor verisi alındı - stats: %s, summary: %s", 
                     bool(report.get("stats")), bool(report.get("summary")))
                 return report
                 
+        except asyncio.TimeoutError as err:
+            _LOGGER.warning("Rapor verisi zaman aşımına uğradı")
+            self.stats.error("get_reports", err)
+            return {}
+        except (ijson.JSONError, ValueError) as err:
+            _LOGGER.warning("Rapor yanıtı çözülemedi: %s", err)
+            self.stats.error("get_reports", err)
+            return {}
         except aiohttp.ClientError as err:
             _LOGGER.warning("Rapor verisi alınamadı: %s", err)
+            self.stats.error("get_reports", err)
             return {}
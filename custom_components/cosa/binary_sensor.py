@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .entity import CosaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,35 +32,26 @@ async def async_setup_entry(
     entities = [
         CosaConnectedSensor(coordinator, config_entry),
         CosaHeatingSensor(coordinator, config_entry),
+        CosaLocalOpenWindowSensor(coordinator, config_entry),
     ]
     
     async_add_entities(entities)
 
 
-class CosaBaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class CosaBaseBinarySensor(CosaEntity, BinarySensorEntity):
     """COSA Base Binary Sensor."""
 
-    _attr_has_entity_name = True
-
     def __init__(self, coordinator, config_entry: ConfigEntry, key: str, name: str) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, config_entry)
         self._key = key
         self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{key}"
         self._attr_name = name
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-        )
-
-    @property
-    def _endpoint(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("endpoint", {})
-        return {}
 
 
 class CosaConnectedSensor(CosaBaseBinarySensor):
     """Bağlantı Durumu Sensörü."""
 
+    _snapshot_fields = ("is_connected",)
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
@@ -66,13 +59,13 @@ class CosaConnectedSensor(CosaBaseBinarySensor):
 
     @property
     def is_on(self) -> bool:
-        device = self._endpoint.get("device", {})
-        return device.get("isConnected", False)
+        return self._snapshot.is_connected
 
 
 class CosaHeatingSensor(CosaBaseBinarySensor):
     """Isıtma Durumu Sensörü."""
 
+    _snapshot_fields = ("heating",)
     _attr_device_class = BinarySensorDeviceClass.HEAT
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
@@ -80,4 +73,39 @@ class CosaHeatingSensor(CosaBaseBinarySensor):
 
     @property
     def is_on(self) -> bool:
-        return self._endpoint.get("combiState") == "on"
+        return self._snapshot.heating
+
+
+class CosaLocalOpenWindowSensor(CosaBaseBinarySensor):
+    """Yerel Açık Pencere Algılama (sıcaklık düşüş eğiminden)."""
+
+    _attr_device_class = BinarySensorDeviceClass.WINDOW
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "local_open_window", "Açık Pencere (Yerel)")
+        self._written: bool | None = None
+
+    @property
+    def is_on(self) -> bool:
+        return self.coordinator.window_detector.is_open
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        detector = self.coordinator.window_detector
+        opened_at: datetime | None = None
+        if detector.opened_at is not None:
+            opened_at = dt_util.utc_from_timestamp(detector.opened_at)
+        return {
+            "opened_at": opened_at,
+            "reference_temperature": detector.reference,
+            "drop_rate": detector.drop_rate,
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        is_open = self.coordinator.window_detector.is_open
+        if self._availability_changed() or is_open != self._written:
+            self._written = is_open
+            self.async_write_ha_state()
+        else:
+            self.coordinator.metrics.write_suppressed()
@@ -17,39 +17,23 @@ from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN, MIN_TEMP, MAX_TEMP, TEMP_STEP,
     MODE_MANUAL, MODE_AUTO, MODE_SCHEDULE,
     OPTION_HOME, OPTION_SLEEP, OPTION_AWAY, OPTION_CUSTOM, OPTION_FROZEN,
+    PRESET_EVDE, PRESET_UYKU, PRESET_DISARI, PRESET_MANUEL, PRESET_OTOMATIK, PRESET_HAFTALIK,
+    PRESET_TO_OPTION,
 )
+from .entity import CosaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-# Türkçe Preset İsimleri
-PRESET_EVDE = "Evde"
-PRESET_UYKU = "Uyku"
-PRESET_DISARI = "Dışarı"
-PRESET_MANUEL = "Manuel"
-PRESET_OTOMATIK = "Otomatik"
-PRESET_HAFTALIK = "Haftalık"
-
-# API değerlerinden Türkçe preset'e dönüşüm
-OPTION_TO_PRESET = {
-    OPTION_HOME: PRESET_EVDE,
-    OPTION_SLEEP: PRESET_UYKU,
-    OPTION_AWAY: PRESET_DISARI,
-    OPTION_CUSTOM: PRESET_MANUEL,
-}
-
-# Türkçe preset'ten API değerine dönüşüm
-PRESET_TO_OPTION = {
-    PRESET_EVDE: OPTION_HOME,
-    PRESET_UYKU: OPTION_SLEEP,
-    PRESET_DISARI: OPTION_AWAY,
-    PRESET_MANUEL: OPTION_CUSTOM,
-}
+# İyimser durum alanları
+OPTIMISTIC_TARGET = "target_temperature"
+OPTIMISTIC_HVAC_MODE = "hvac_mode"
+OPTIMISTIC_PRESET = "preset_mode"
+TARGET_TOLERANCE = 0.05
 
 # Preset İkonları
 PRESET_ICONS = {
@@ -61,6 +45,14 @@ PRESET_ICONS = {
     PRESET_HAFTALIK: "mdi:calendar-clock",
 }
 
+# Ek özelliklere kopyalanan snapshot alanları (sıra önbellek anahtarını belirler)
+ATTRIBUTE_FIELDS = (
+    "mode", "option", "combi_state",
+    "home_temperature", "away_temperature", "sleep_temperature", "custom_temperature",
+    "firmware_version", "battery_voltage", "power_state", "rssi", "child_lock",
+    "open_window_state", "outdoor_temperature", "outdoor_humidity", "weather_icon",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -72,10 +64,16 @@ async def async_setup_entry(
     async_add_entities([CosaClimate(coordinator, config_entry)])
 
 
-class CosaClimate(CoordinatorEntity, ClimateEntity):
+class CosaClimate(CosaEntity, ClimateEntity):
     """COSA Climate Entity."""
 
-    _attr_has_entity_name = True
+    _snapshot_fields = (
+        "temperature", "humidity", "target_temperature", "raw_target_temperature",
+        "hvac_mode", "preset", "heating", "mode", "option", "combi_state",
+        "home_temperature", "away_temperature", "sleep_temperature", "custom_temperature",
+        "firmware_version", "battery_voltage", "power_state", "rssi", "child_lock",
+        "open_window_state", "outdoor_temperature", "outdoor_humidity", "weather_icon",
+    )
     _attr_name = None
     _attr_translation_key = "cosa_thermostat"
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -91,118 +89,80 @@ class CosaClimate(CoordinatorEntity, ClimateEntity):
     _attr_max_temp = MAX_TEMP
     _attr_target_temperature_step = TEMP_STEP
     _enable_turn_on_off_backwards_compatibility = False
+    # Ayrı sensörlerde zaten kaydedilen veya sık değişen özellikler recorder'a yazılmaz
+    _unrecorded_attributes = frozenset({
+        "combi_state", "firmware_version", "battery_voltage", "power_state", "rssi",
+        "outdoor_temperature", "outdoor_humidity", "weather_icon", "preset_icon",
+    })
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_climate"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, config_entry.entry_id)},
-            name=coordinator.data.get("endpoint", {}).get("name", "COSA Termostat") if coordinator.data else "COSA Termostat",
+            name=self._snapshot.name or "COSA Termostat",
             manufacturer="COSA",
             model="Smart Thermostat",
         )
-        # Optimistic update için geçici değerler
-        self._optimistic_target_temp: float | None = None
-        self._optimistic_preset: str | None = None
-        self._optimistic_hvac_mode: HVACMode | None = None
+        self._attributes_key: tuple | None = None
+        self._attributes: dict[str, Any] = {}
 
     @property
-    def _endpoint(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("endpoint", {})
-        return {}
+    def _optimistic(self):
+        return self.coordinator.optimistic
 
     @property
-    def _forecast(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("forecast", {})
-        return {}
+    def _endpoint_id(self) -> str:
+        return self.coordinator.endpoint_id
 
     @property
     def current_temperature(self) -> float | None:
-        return self._endpoint.get("temperature")
+        return self._snapshot.temperature
 
     @property
     def current_humidity(self) -> int | None:
-        humidity = self._endpoint.get("humidity")
+        humidity = self._snapshot.humidity
         return round(humidity) if humidity else None
 
     @property
     def target_temperature(self) -> float | None:
         # Optimistic değer varsa onu göster
-        if self._optimistic_target_temp is not None:
-            return self._optimistic_target_temp
-        
-        # Mevcut mod ve option'a göre doğru sıcaklığı döndür
-        mode = self._endpoint.get("mode")
-        option = self._endpoint.get("option")
-        
-        # Manuel moddaysa option'a göre sıcaklık
-        if mode == MODE_MANUAL:
-            if option == OPTION_HOME:
-                return self._endpoint.get("homeTemperature")
-            elif option == OPTION_AWAY:
-                return self._endpoint.get("awayTemperature")
-            elif option == OPTION_SLEEP:
-                return self._endpoint.get("sleepTemperature")
-            elif option == OPTION_CUSTOM:
-                return self._endpoint.get("customTemperature")
-        
-        # Diğer modlarda targetTemperature kullan
-        return self._endpoint.get("targetTemperature")
+        optimistic = self._optimistic.get(self._endpoint_id, OPTIMISTIC_TARGET)
+        if optimistic is not None:
+            return optimistic
+        return self._snapshot.target_temperature
 
     @property
     def hvac_mode(self) -> HVACMode:
         # Optimistic değer varsa onu göster
-        if self._optimistic_hvac_mode is not None:
-            return self._optimistic_hvac_mode
-        
-        mode = self._endpoint.get("mode")
-        if mode == MODE_MANUAL:
-            option = self._endpoint.get("option")
-            if option == OPTION_FROZEN:
-                return HVACMode.OFF
-        return HVACMode.HEAT
+        optimistic = self._optimistic.get(self._endpoint_id, OPTIMISTIC_HVAC_MODE)
+        if optimistic is not None:
+            return optimistic
+        return self._snapshot.hvac_mode
 
     @property
     def hvac_action(self) -> HVACAction:
-        combi_state = self._endpoint.get("combiState")
-        if combi_state == "on":
+        if self._snapshot.heating:
             return HVACAction.HEATING
         return HVACAction.IDLE
 
     @property
     def preset_mode(self) -> str | None:
         # Optimistic değer varsa onu göster
-        if self._optimistic_preset is not None:
-            return self._optimistic_preset
-            
-        mode = self._endpoint.get("mode")
-        option = self._endpoint.get("option")
-        
-        if mode == MODE_SCHEDULE:
-            return PRESET_HAFTALIK
-        elif mode == MODE_AUTO:
-            return PRESET_OTOMATIK
-        elif mode == MODE_MANUAL:
-            return OPTION_TO_PRESET.get(option, PRESET_EVDE)
-        return OPTION_TO_PRESET.get(option, PRESET_EVDE)
+        optimistic = self._optimistic.get(self._endpoint_id, OPTIMISTIC_PRESET)
+        if optimistic is not None:
+            return optimistic
+        return self._snapshot.preset
 
     @property
     def icon(self) -> str:
         """Mod ve duruma göre ikon döndür."""
-        combi_state = self._endpoint.get("combiState")
-        mode = self._endpoint.get("mode")
-        option = self._endpoint.get("option")
-        
         # Isıtılıyorsa alev ikonu
-        if combi_state == "on":
+        if self._snapshot.heating:
             return "mdi:fire"
         
         # Kapalıysa (optimistic veya gerçek)
-        if self._optimistic_hvac_mode == HVACMode.OFF:
-            return "mdi:snowflake"
-        if mode == MODE_MANUAL and option == OPTION_FROZEN:
+        if self.hvac_mode == HVACMode.OFF:
             return "mdi:snowflake"
         
         # Preset'e göre ikon
@@ -211,42 +171,23 @@ class CosaClimate(CoordinatorEntity, ClimateEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Coordinator güncellemesini işle ve optimistic değerleri temizle."""
-        # API'den gelen gerçek veriyle optimistic değerleri karşılaştır
-        real_target = self._endpoint.get("targetTemperature")
-        if self._optimistic_target_temp is not None and real_target == self._optimistic_target_temp:
-            self._optimistic_target_temp = None
-        
-        # HVAC mode kontrolü
-        mode = self._endpoint.get("mode")
-        option = self._endpoint.get("option")
-        if mode == MODE_MANUAL and option == OPTION_FROZEN:
-            real_hvac_mode = HVACMode.OFF
-        else:
-            real_hvac_mode = HVACMode.HEAT
-        
-        if self._optimistic_hvac_mode is not None and real_hvac_mode == self._optimistic_hvac_mode:
-            self._optimistic_hvac_mode = None
-        
-        # Preset kontrolü
-        real_preset = None
-        if mode == MODE_SCHEDULE:
-            real_preset = PRESET_HAFTALIK
-        elif mode == MODE_AUTO:
-            real_preset = PRESET_OTOMATIK
-        else:
-            real_preset = OPTION_TO_PRESET.get(option, PRESET_EVDE)
-        
-        if self._optimistic_preset is not None and real_preset == self._optimistic_preset:
-            self._optimistic_preset = None
-        
-        self.async_write_ha_state()
+        """Coordinator güncellemesini işle ve optimistic değerleri onayla."""
+        snapshot = self._snapshot
+        # Ekranda gösterilen hedefle karşılaştır (manuel modda preset sıcaklığı)
+        confirmed = self._optimistic.confirm(self._endpoint_id, OPTIMISTIC_TARGET, snapshot.target_temperature)
+        confirmed |= self._optimistic.confirm(self._endpoint_id, OPTIMISTIC_HVAC_MODE, snapshot.hvac_mode)
+        confirmed |= self._optimistic.confirm(self._endpoint_id, OPTIMISTIC_PRESET, snapshot.preset)
+        self._async_write_if_changed(force=confirmed)
+
+    def _clear_optimistic(self, *fields: str) -> None:
+        for field in fields:
+            self._optimistic.clear(self._endpoint_id, field)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         # Optimistic update
-        self._optimistic_hvac_mode = hvac_mode
+        self._optimistic.set(self._endpoint_id, OPTIMISTIC_HVAC_MODE, hvac_mode)
         if hvac_mode == HVACMode.OFF:
-            self._optimistic_preset = None  # Preset'i temizle
+            self._clear_optimistic(OPTIMISTIC_PRESET)  # Preset'i temizle
         self.async_write_ha_state()
         
         if hvac_mode == HVACMode.OFF:
@@ -256,26 +197,29 @@ class CosaClimate(CoordinatorEntity, ClimateEntity):
         
         if not result:
             # API başarısız, optimistic değeri temizle
-            self._optimistic_hvac_mode = None
-            self._optimistic_preset = None
+            self._clear_optimistic(OPTIMISTIC_HVAC_MODE, OPTIMISTIC_PRESET)
             self.async_write_ha_state()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         # Optimistic update - preset ve sıcaklık
-        self._optimistic_preset = preset_mode
-        self._optimistic_hvac_mode = HVACMode.HEAT  # Preset seçildiğinde ısıtma açık
+        self._optimistic.set(self._endpoint_id, OPTIMISTIC_PRESET, preset_mode)
+        self._optimistic.set(self._endpoint_id, OPTIMISTIC_HVAC_MODE, HVACMode.HEAT)  # Preset seçildiğinde ısıtma açık
         
         # Preset'e göre sıcaklığı da hemen güncelle
+        snapshot = self._snapshot
+        target = None
         if preset_mode == PRESET_EVDE:
-            self._optimistic_target_temp = self._endpoint.get("homeTemperature", 21)
+            target = snapshot.home_temperature or 21
         elif preset_mode == PRESET_UYKU:
-            self._optimistic_target_temp = self._endpoint.get("sleepTemperature", 19)
+            target = snapshot.sleep_temperature or 19
         elif preset_mode == PRESET_DISARI:
-            self._optimistic_target_temp = self._endpoint.get("awayTemperature", 15)
+            target = snapshot.away_temperature or 15
         elif preset_mode == PRESET_MANUEL:
-            self._optimistic_target_temp = self._endpoint.get("customTemperature", 20)
+            target = snapshot.custom_temperature or 20
         elif preset_mode in (PRESET_OTOMATIK, PRESET_HAFTALIK):
-            self._optimistic_target_temp = self._endpoint.get("targetTemperature", 21)
+            target = snapshot.raw_target_temperature or 21
+        if target is not None:
+            self._optimistic.set(self._endpoint_id, OPTIMISTIC_TARGET, target, TARGET_TOLERANCE)
         
         self.async_write_ha_state()
         
@@ -289,8 +233,7 @@ class CosaClimate(CoordinatorEntity, ClimateEntity):
         
         if not result:
             # API başarısız, optimistic değerleri temizle
-            self._optimistic_preset = None
-            self._optimistic_hvac_mode = None
+            self._clear_optimistic(OPTIMISTIC_PRESET, OPTIMISTIC_HVAC_MODE, OPTIMISTIC_TARGET)
             self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -299,38 +242,26 @@ class CosaClimate(CoordinatorEntity, ClimateEntity):
             return
         
         # Optimistic update - hemen UI'ı güncelle
-        self._optimistic_target_temp = temperature
+        self._optimistic.set(self._endpoint_id, OPTIMISTIC_TARGET, temperature, TARGET_TOLERANCE)
         self.async_write_ha_state()
         
-        option = self._endpoint.get("option", OPTION_HOME)
-        
-        home = self._endpoint.get("homeTemperature", 21)
-        away = self._endpoint.get("awayTemperature", 15)
-        sleep = self._endpoint.get("sleepTemperature", 19)
-        custom = self._endpoint.get("customTemperature", 20)
-        
-        if option == OPTION_HOME:
-            home = temperature
-        elif option == OPTION_AWAY:
-            away = temperature
-        elif option == OPTION_SLEEP:
-            sleep = temperature
-        elif option == OPTION_CUSTOM:
-            custom = temperature
-        else:
-            home = temperature
+        # Yalnızca etkin seçeneğin sıcaklığı gönderilir; günlükte bekleyen
+        # diğer preset değişiklikleri korunur
+        option = self._snapshot.option
+        if option not in (OPTION_HOME, OPTION_AWAY, OPTION_SLEEP, OPTION_CUSTOM):
+            option = OPTION_HOME
         
         try:
-            result = await self.coordinator.async_set_temperatures(home, away, sleep, custom)
+            result = await self.coordinator.async_set_preset_temperatures({option: temperature})
             if not result:
-                # API başarısız ama timeout değilse temizle
+                # API reddetti, optimistic değer süresi dolunca düşecek
                 _LOGGER.warning("Sıcaklık ayarı başarısız, optimistic değer korunuyor")
         except asyncio.TimeoutError:
             # Timeout - optimistic değeri koru, arka planda işlenebilir
             _LOGGER.warning("API timeout - sıcaklık ayarı arka planda işleniyor")
         except Exception as err:
             _LOGGER.error("Sıcaklık ayarı hatası: %s", err)
-            self._optimistic_target_temp = None
+            self._clear_optimistic(OPTIMISTIC_TARGET)
             self.async_write_ha_state()
 
     async def async_turn_on(self) -> None:
@@ -341,30 +272,12 @@ class CosaClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        device = self._endpoint.get("device", {})
-        forecast_data = self._forecast.get("hourly", [{}])
-        current_weather = forecast_data[0] if forecast_data else {}
-        
-        # Preset ikonu bilgisini ekle
-        current_preset = self.preset_mode
-        preset_icon = PRESET_ICONS.get(current_preset, "mdi:thermostat")
-        
-        return {
-            "mode": self._endpoint.get("mode"),
-            "option": self._endpoint.get("option"),
-            "combi_state": self._endpoint.get("combiState"),
-            "home_temperature": self._endpoint.get("homeTemperature"),
-            "away_temperature": self._endpoint.get("awayTemperature"),
-            "sleep_temperature": self._endpoint.get("sleepTemperature"),
-            "custom_temperature": self._endpoint.get("customTemperature"),
-            "firmware_version": device.get("version"),
-            "battery_voltage": self._endpoint.get("batteryVoltage"),
-            "power_state": self._endpoint.get("powerState"),
-            "rssi": self._endpoint.get("rssi"),
-            "child_lock": self._endpoint.get("childLock"),
-            "open_window_state": self._endpoint.get("openWindowState"),
-            "outdoor_temperature": current_weather.get("temperature"),
-            "outdoor_humidity": current_weather.get("humidity"),
-            "weather_icon": current_weather.get("icon"),
-            "preset_icon": preset_icon,
-        }
+        """Girdiler değişmedikçe önbellekteki sözlüğü döndür."""
+        snapshot = self._snapshot
+        key = (self.preset_mode, *(getattr(snapshot, field) for field in ATTRIBUTE_FIELDS))
+        if key != self._attributes_key:
+            self._attributes_key = key
+            self._attributes = dict(zip(ATTRIBUTE_FIELDS, key[1:]))
+            # Preset ikonu bilgisini ekle
+            self._attributes["preset_icon"] = PRESET_ICONS.get(key[0], "mdi:thermostat")
+        return self._attributes
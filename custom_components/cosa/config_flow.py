@@ -9,10 +9,18 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .api import CosaAPI
-from .const import DOMAIN, CONF_ENDPOINT_ID
+from .const import (
+    DOMAIN,
+    CONF_BOILER_POWER,
+    CONF_DEADBAND_PREFIX,
+    CONF_ENDPOINT_ID,
+    CONF_OPEN_WINDOW_FROST,
+    SENSOR_DEADBANDS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +37,14 @@ class CosaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._token: str | None = None
         self._endpoints: list[dict] = []
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> CosaOptionsFlow:
+        """Seçenekler akışı."""
+        return CosaOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -126,3 +142,37 @@ class CosaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 }
             ),
         )
+
+
+class CosaOptionsFlow(config_entries.OptionsFlow):
+    """COSA seçenekleri."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Seçenekler adımı."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        schema: dict[Any, Any] = {
+            vol.Optional(
+                CONF_OPEN_WINDOW_FROST,
+                default=self._entry.options.get(CONF_OPEN_WINDOW_FROST, False),
+            ): bool,
+            vol.Optional(
+                CONF_BOILER_POWER,
+                default=self._entry.options.get(CONF_BOILER_POWER, 0.0),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        }
+        # Sensör başına ölü bant (0 = her değişim yazılır)
+        for key, default in SENSOR_DEADBANDS.items():
+            option = f"{CONF_DEADBAND_PREFIX}{key}"
+            schema[vol.Optional(option, default=self._entry.options.get(option, default))] = vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            )
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
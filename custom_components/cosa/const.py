@@ -5,12 +5,23 @@ from datetime import timedelta
 DOMAIN = "cosa"
 PLATFORMS = ["climate", "sensor", "binary_sensor", "switch", "number"]
 
+# Olaylar
+EVENT_ENDPOINT_CHANGED = f"{DOMAIN}_endpoint_changed"
+# Olayı tetikleyen snapshot alanları; ölçüm değişimleri olay yayınlamaz
+EVENT_CHANGE_FIELDS = frozenset({"mode", "option", "preset", "hvac_mode", "is_connected"})
+
 # Config Keys
 CONF_ENDPOINT_ID = "endpoint_id"
+CONF_OPEN_WINDOW_FROST = "open_window_frost"  # açık pencerede donma korumasına geç
+CONF_BOILER_POWER = "boiler_power"  # kW, enerji tahmini için kombi gücü (0 = kapalı)
+CONF_DEADBAND_PREFIX = "deadband_"  # + sensör anahtarı, SENSOR_DEADBANDS varsayılanını ezer
 
 # API Konfigürasyonu
 API_BASE_URL = "https://kiwi-api.nuvia.com.tr"
 API_TIMEOUT = 60
+# Rapor gövdesi bundan büyükse (veya boyutu bilinmiyorsa) akış halinde ayrıştırılır;
+# tam günlük rapor (288 örnek, ~50 kB) akışla, gün başındaki kısa raporlar tek seferde çözülür
+REPORT_STREAM_THRESHOLD = 32 * 1024  # bayt
 
 # API Endpoint'leri
 ENDPOINT_LOGIN = "/api/users/login"
@@ -49,6 +60,58 @@ PRESET_MANUAL = "manual"
 PRESET_AUTOMATIC = "automatic"
 PRESET_WEEKLY = "weekly"
 
+# Türkçe Preset İsimleri
+PRESET_EVDE = "Evde"
+PRESET_UYKU = "Uyku"
+PRESET_DISARI = "Dışarı"
+PRESET_MANUEL = "Manuel"
+PRESET_OTOMATIK = "Otomatik"
+PRESET_HAFTALIK = "Haftalık"
+
+# API değerlerinden Türkçe preset'e dönüşüm
+OPTION_TO_PRESET = {
+    OPTION_HOME: PRESET_EVDE,
+    OPTION_SLEEP: PRESET_UYKU,
+    OPTION_AWAY: PRESET_DISARI,
+    OPTION_CUSTOM: PRESET_MANUEL,
+}
+
+# Türkçe preset'ten API değerine dönüşüm
+PRESET_TO_OPTION = {
+    PRESET_EVDE: OPTION_HOME,
+    PRESET_UYKU: OPTION_SLEEP,
+    PRESET_DISARI: OPTION_AWAY,
+    PRESET_MANUEL: OPTION_CUSTOM,
+}
+
+# Sensörlerde gösterilen Türkçe isimler
+MODE_NAMES = {
+    MODE_MANUAL: "Manuel",
+    MODE_AUTO: "Otomatik",
+    MODE_SCHEDULE: "Haftalık",
+}
+
+OPTION_NAMES = {
+    OPTION_HOME: "Evde",
+    OPTION_AWAY: "Dışarı",
+    OPTION_SLEEP: "Uyku",
+    OPTION_CUSTOM: "Manuel",
+    OPTION_FROZEN: "Donma Koruma",
+}
+
+COMBI_STATE_NAMES = {
+    "on": "Açık",
+    "off": "Kapalı",
+}
+
+NETWORK_QUALITY_NAMES = {
+    0: "Çok Zayıf",
+    1: "Zayıf",
+    2: "Orta",
+    3: "İyi",
+    4: "Çok İyi",
+}
+
 # Sıcaklık Limitleri
 MIN_TEMP = 5.0
 MAX_TEMP = 32.0
@@ -59,6 +122,92 @@ CALIBRATION_MIN = -5.0
 CALIBRATION_MAX = 5.0
 CALIBRATION_STEP = 0.1
 
+# Çevrimdışı Komut Günlüğü
+JOURNAL_STORAGE_VERSION = 1
+JOURNAL_BACKOFF_MIN = 5  # saniye
+JOURNAL_BACKOFF_MAX = 300  # saniye
+JOURNAL_SETTING_TARGET_TEMPERATURES = "target_temperatures"
+JOURNAL_SETTING_DEVICE_SETTINGS = "device_settings"
+
+# İyimser Durum
+OPTIMISTIC_TIMEOUT = 120  # saniye, onay gelmezse değer düşürülür (günlükte bekleyen komutlar hariç)
+OPTIMISTIC_LATENCY_SAMPLES = 50
+# Günlükteki ayar -> o ayarla yazılan iyimser alanlar
+OPTIMISTIC_JOURNAL_FIELDS = {
+    JOURNAL_SETTING_TARGET_TEMPERATURES: (
+        "target_temperature",
+        "home_temperature",
+        "away_temperature",
+        "sleep_temperature",
+        "custom_temperature",
+    ),
+    JOURNAL_SETTING_DEVICE_SETTINGS: ("calibration", "open_window_enable"),
+}
+
+# Toplu (Filo) Komutlar
+FLEET_MAX_CONCURRENCY = 4  # hesap başına eşzamanlı istek
+FLEET_MIN_REQUEST_INTERVAL = 0.25  # saniye, hesap başına istekler arası
+FLEET_REFRESH_DELAY = 1  # saniye, API'nin işlemesi için
+
+# Haftalık Program Modunda Yenileme
+SCHEDULE_SLOW_INTERVAL = timedelta(seconds=60)  # geçişler arasında
+SCHEDULE_PREFETCH_DELAY = timedelta(seconds=5)  # geçişten hemen sonra
+
+# Yerel Geçmiş Deposu
+HISTORY_DIRECTORY = "cosa_history"  # .storage altında
+HISTORY_DEFAULT_RANGE = timedelta(hours=24)
+HISTORY_DEFAULT_BUCKET = 3600  # saniye
+STATISTICS_IMPORT_BATCH = 168  # recorder'a tek seferde gönderilen saat sayısı
+OBSERVATION_DIRECTORY = "cosa_observations"  # dış sıcaklık ve seçenek gözlemleri
+OBSERVATION_INTERVAL = 300  # saniye, rapor serisiyle aynı çözünürlük
+
+# Son Örnekler Halka Tamponu
+RING_SIZE = 240  # örnek; 15 sn aralıkla yaklaşık 1 saat
+
+# Hava Durumu Tahmin Önbelleği
+FORECAST_TTL = 1800  # saniye, tahmin bu süre boyunca yeniden alınmaz
+FORECAST_RETRY_DELAY = 120  # saniye, başarısız tahmin isteğinden sonra
+FORECAST_HOURLY_LIMIT = 48
+FORECAST_DAILY_LIMIT = 8
+
+# Yerel Çalışma Süresi / Enerji Sayacı
+RUNTIME_STORAGE_VERSION = 1
+RUNTIME_SAVE_DELAY = 300  # saniye, sayaçlar en geç bu kadar sonra diske yazılır
+RUNTIME_MAX_GAP = 300  # saniye, iki örnek arasında sayılacak en uzun süre
+
+# Yerel Açık Pencere Algılama
+OPEN_WINDOW_WINDOW = 180  # saniye, düşüşün arandığı kayan pencere
+OPEN_WINDOW_MIN_DROP = 0.4  # °C, pencere içindeki en yüksek değerden düşüş
+OPEN_WINDOW_MIN_RATE = 6.0  # °C/saat, en az düşüş hızı
+OPEN_WINDOW_RECOVERY = 0.2  # °C, en düşük değerden bu kadar yükselince kapanır
+OPEN_WINDOW_MAX_DURATION = 1800  # saniye
+
+# Isıtma Analitiği
+ANALYTICS_WINDOW = timedelta(days=7)
+ANALYTICS_BASE_TEMPERATURE = 18.0  # derece-saat taban sıcaklığı
+
+# Tazelik Metrikleri
+METRICS_SAMPLES = 100  # yüzdelikler için son N yenileme
+METRICS_INTERVAL_HISTORY = 20  # son N aralık değişikliği
+METRICS_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # saniye
+METRICS_VIEW_URL = "/api/cosa/metrics"  # Prometheus metin formatı
+
+# Gürültülü Telemetri Ölü Bandı (sensör anahtarı -> en küçük anlamlı değişim)
+# Varsayılanlardır; seçeneklerden sensör başına değiştirilebilir
+SENSOR_DEADBANDS = {
+    "humidity": 1.0,
+    "battery_voltage": 0.05,
+    "rssi": 3,
+    "outdoor_temperature": 0.3,
+    "outdoor_humidity": 2.0,
+    "temperature_trend": 0.2,
+    "temperature_average": 0.1,
+    "boiler_runtime": 0.01,
+    "boiler_energy": 0.01,
+}
+SENSOR_MIN_PUBLISH_INTERVAL = 60  # saniye, iki yayın arası en az
+SENSOR_HEARTBEAT_INTERVAL = 900  # saniye, bant içi değişim bu süreden sonra yine yazılır
+
 # Güncelleme Aralığı - 10 saniye
 SCAN_INTERVAL = timedelta(seconds=10)
 UPDATE_INTERVAL = timedelta(seconds=10)
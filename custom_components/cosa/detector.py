@@ -0,0 +1,60 @@
+"""COSA Yerel Açık Pencere Algılama (hızlı sıcaklık düşüşünden)."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Optional
+
+from .const import (
+    OPEN_WINDOW_MAX_DURATION,
+    OPEN_WINDOW_MIN_DROP,
+    OPEN_WINDOW_MIN_RATE,
+    OPEN_WINDOW_RECOVERY,
+    OPEN_WINDOW_WINDOW,
+)
+
+
+class CosaOpenWindowDetector:
+    """Sıcaklık düşüş eğimine göre artımlı açık pencere algılayıcı."""
+
+    __slots__ = ("_samples", "is_open", "opened_at", "reference", "lowest", "drop_rate")
+
+    def __init__(self) -> None:
+        self._samples: deque[tuple[float, float]] = deque()
+        self.is_open = False
+        self.opened_at: Optional[float] = None
+        self.reference: Optional[float] = None
+        self.lowest: Optional[float] = None
+        self.drop_rate: Optional[float] = None
+
+    def update(self, timestamp: float, temperature: Optional[float]) -> bool:
+        """Yeni örneği işle; durum değiştiyse True döner."""
+        if temperature is None:
+            return False
+        samples = self._samples
+        samples.append((timestamp, temperature))
+        while samples and timestamp - samples[0][0] > OPEN_WINDOW_WINDOW:
+            samples.popleft()
+
+        if self.is_open:
+            self.lowest = min(self.lowest, temperature)
+            recovered = temperature - self.lowest >= OPEN_WINDOW_RECOVERY
+            if recovered or timestamp - self.opened_at >= OPEN_WINDOW_MAX_DURATION:
+                self.is_open = False
+                self.opened_at = self.reference = self.lowest = self.drop_rate = None
+                return True
+            return False
+
+        peak_time, peak = max(samples, key=lambda sample: sample[1])
+        elapsed = timestamp - peak_time
+        if elapsed <= 0 or peak - temperature < OPEN_WINDOW_MIN_DROP:
+            return False
+        rate = (peak - temperature) / elapsed * 3600
+        if rate < OPEN_WINDOW_MIN_RATE:
+            return False
+        self.is_open = True
+        self.opened_at = timestamp
+        self.reference = peak
+        self.lowest = temperature
+        self.drop_rate = round(rate, 1)
+        return True
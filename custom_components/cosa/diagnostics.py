@@ -0,0 +1,52 @@
+"""COSA Tanı (Diagnostics) Desteği."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ENDPOINT_ID, DOMAIN
+from .models import CosaSnapshot
+from .services import account_budget_diagnostics
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, CONF_ENDPOINT_ID, "token", "name", "place"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Config entry için tanı verisi: son snapshot ve performans sayaçları."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    api = coordinator.api
+    interval = coordinator.update_interval
+    place = coordinator.forecast_cache.get((coordinator.data or {}).get("endpoint", {}).get("place"))
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "snapshot": async_redact_data(CosaSnapshot.from_data(coordinator.data).as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": interval.total_seconds() if interval else None,
+            "changed_fields": sorted((coordinator.data or {}).get("changed") or []),
+        },
+        "refresh": coordinator.metrics.as_dict(),
+        "api": {
+            "responses": api.response_count,
+            **api.stats.as_dict(),
+        },
+        "journal": coordinator.journal.as_diagnostics(),
+        "fleet_budget": account_budget_diagnostics(hass, entry.data.get(CONF_EMAIL, "")),
+        "runtime": coordinator.runtime.as_diagnostics(),
+        "forecast": {
+            "places": len(coordinator.forecast_cache),
+            **(place.as_diagnostics() if place else {}),
+        },
+        "optimistic": {
+            "latency": coordinator.optimistic.latency_stats(),
+            "expired": dict(coordinator.optimistic.expired),
+        },
+    }
@@ -0,0 +1,64 @@
+"""COSA Ortak Entity Sınıfı."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .models import CosaSnapshot
+
+
+class CosaEntity(CoordinatorEntity):
+    """Tüm COSA entity'lerinin tabanı."""
+
+    _attr_has_entity_name = True
+    # Entity'nin gösterdiği snapshot alanları; boşsa her güncellemede yazılır
+    _snapshot_fields: tuple[str, ...] = ()
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+        )
+        self._last_available: bool | None = None
+
+    @property
+    def _snapshot(self) -> CosaSnapshot:
+        return CosaSnapshot.from_data(self.coordinator.data)
+
+    def _availability_changed(self) -> bool:
+        available = self.available
+        if available == self._last_available:
+            return False
+        self._last_available = available
+        return True
+
+    def _should_write(self) -> bool:
+        """Bu güncellemede entity'nin gösterdiği bir şey değişti mi."""
+        if self._availability_changed():
+            return True
+        if not self._snapshot_fields or not self.coordinator.data:
+            return True
+        changed = self.coordinator.data.get("changed")
+        return changed is None or not changed.isdisjoint(self._snapshot_fields)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """State yazımlarını tanı verisi için say."""
+        self.coordinator.metrics.entity_written(self.entity_id)
+        super().async_write_ha_state()
+
+    @callback
+    def _async_write_if_changed(self, force: bool = False) -> None:
+        if force or self._should_write():
+            self.async_write_ha_state()
+        else:
+            self.coordinator.metrics.write_suppressed()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Yalnızca ilgili alanlar değiştiyse durumu yaz."""
+        self._async_write_if_changed()
@@ -0,0 +1,117 @@
+"""COSA Hava Durumu Tahmin Önbelleği.
+
+Tahmin saatler içinde değişir; termostat ise saniyeler içinde. Bu yüzden
+getForecast yanıtı FORECAST_TTL boyunca önbellekte tutulur ve coordinator
+her yenilemede API yerine önbelleği okur. Önbellek tüm entry'ler arasında
+paylaşılır ve yer (place) kimliğine göre tutulur: aynı evdeki termostatlar
+TTL başına tek istek yapar, aynı anda süresi dolan istekler tek bir
+yenilemeyi bekler. Hava durumu entity'si saatlik ve günlük dizileri de
+buradan alır.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import CosaAPI
+from .const import (
+    DOMAIN,
+    FORECAST_DAILY_LIMIT,
+    FORECAST_HOURLY_LIMIT,
+    FORECAST_RETRY_DELAY,
+    FORECAST_TTL,
+)
+from .projection import project_forecast, project_forecast_series
+
+_LOGGER = logging.getLogger(__name__)
+
+_CACHE = f"{DOMAIN}_forecast_cache"
+
+
+class CosaPlaceForecast:
+    """Tek bir yerin tahmini, TTL süresince."""
+
+    def __init__(self, place_id: str) -> None:
+        self.place_id = place_id
+        # Snapshot için mevcut saat ve entity için diziler
+        self.current: dict[str, Any] = {}
+        self.series: dict[str, Any] = {}
+        self.fetched_at: Optional[float] = None
+        self.requests = 0
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self._expires_at
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "fetched_at": self.fetched_at,
+            "expired": self.expired,
+            "hourly": len(self.series.get("hourly", ())),
+            "daily": len(self.series.get("daily", ())),
+        }
+
+    async def async_get(self, api: CosaAPI, token: Optional[str] = None) -> dict[str, Any]:
+        """Mevcut saatin tahmini; süresi dolduysa API'den (tek istekle) yenilenir."""
+        if not self.expired:
+            return self.current
+        async with self._lock:
+            # Beklerken başka bir entry yenilediyse onu kullan
+            if not self.expired:
+                return self.current
+            self.requests += 1
+            forecast = await api.get_forecast(self.place_id, token)
+            if not forecast.get("hourly"):
+                # Eski tahmini koru, kısa süre sonra tekrar dene
+                _LOGGER.debug("Tahmin alınamadı, %ss sonra tekrar denenecek", FORECAST_RETRY_DELAY)
+                self._expires_at = time.monotonic() + FORECAST_RETRY_DELAY
+                return self.current
+
+            self.current = project_forecast(forecast)
+            self.series = project_forecast_series(forecast, FORECAST_HOURLY_LIMIT, FORECAST_DAILY_LIMIT)
+            self.fetched_at = time.time()
+            self._expires_at = time.monotonic() + FORECAST_TTL
+            return self.current
+
+
+class CosaForecastCache:
+    """Tüm entry'lerin paylaştığı, yer kimliğine göre tahmin önbelleği."""
+
+    def __init__(self) -> None:
+        self._places: dict[str, CosaPlaceForecast] = {}
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    def get(self, place_id: Optional[str]) -> Optional[CosaPlaceForecast]:
+        """Yerin önbellek kaydı (henüz istenmediyse None)."""
+        return self._places.get(place_id) if place_id else None
+
+    async def async_get(self, api: CosaAPI, place_id: str, token: Optional[str] = None) -> dict[str, Any]:
+        """Yerin mevcut saat tahmini."""
+        place = self._places.get(place_id)
+        if place is None:
+            place = self._places[place_id] = CosaPlaceForecast(place_id)
+        return await place.async_get(api, token)
+
+    def prune(self, place_ids: set[str]) -> None:
+        """Artık hiçbir entry'nin kullanmadığı yerleri at."""
+        for place_id in set(self._places) - place_ids:
+            del self._places[place_id]
+
+
+@callback
+def async_get_forecast_cache(hass: HomeAssistant) -> CosaForecastCache:
+    """Paylaşılan önbelleği döndür (ilk çağrıda oluşturulur)."""
+    cache = hass.data.get(_CACHE)
+    if cache is None:
+        cache = hass.data[_CACHE] = CosaForecastCache()
+    return cache
@@ -0,0 +1,240 @@
+"""COSA Yerel Geçmiş Deposu.
+
+Endpoint başına sütunlu, yalnızca eklemeli zaman serisi; dosya işlemleri
+bloklayıcıdır, executor'da çağrılmalıdır.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import math
+import os
+import shutil
+import threading
+from typing import Any, Iterable, Iterator, Optional
+
+# Sütun adı -> (array tipi, örnek alanı)
+COLUMNS = {
+    "temperature": ("f", "temperature"),
+    "humidity": ("f", "humidity"),
+    "target_temperature": ("f", "targetTemperature"),
+    "heating": ("b", "combiState"),
+}
+# Rapor serisinde olmayan, her yenilemede snapshot'tan kaydedilen gözlemler
+OBSERVATION_COLUMNS = {
+    "outdoor_temperature": ("f", "outdoor_temperature"),
+    "option": ("b", "option"),
+}
+TIME_COLUMN = "time"
+_TIME_KEYS = ("time", "timestamp", "date")
+_MISSING_FLAG = -1
+
+
+def _parse_time(sample: dict[str, Any]) -> Optional[int]:
+    """Örneğin zamanını epoch saniyesine çevir (saniye, milisaniye veya ISO)."""
+    for key in _TIME_KEYS:
+        value = sample.get(key)
+        if value is None:
+            continue
+        if isinstance(value, (int, float)):
+            return int(value / 1000 if value > 1e11 else value)
+        if isinstance(value, str):
+            try:
+                return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+            except ValueError:
+                return None
+    return None
+
+
+def _value(kind: str, raw: Any) -> float | int:
+    if kind == "b":
+        if raw is None:
+            return _MISSING_FLAG
+        if isinstance(raw, str):
+            return int(raw == "on")
+        return int(raw)
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class CosaSampleCollector:
+    """Akıştan gelen rapor örneklerinden yalnızca yenilerini ve kullanılan alanları toplar."""
+
+    def __init__(self, after: Optional[int], columns: dict[str, tuple[str, str]] = COLUMNS) -> None:
+        self._after = after
+        self._keys = (*_TIME_KEYS, *(key for _, key in columns.values()))
+        self.samples: list[dict[str, Any]] = []
+        self.seen = 0
+
+    def __call__(self, sample: dict[str, Any]) -> None:
+        self.seen += 1
+        timestamp = _parse_time(sample)
+        if timestamp is None or (self._after is not None and timestamp <= self._after):
+            return
+        self.samples.append({key: sample[key] for key in self._keys if key in sample})
+
+
+class _EndpointColumns:
+    """Tek bir endpoint'in bellekteki sütunları ve dosya yolları."""
+
+    def __init__(self, directory: str, schema: dict[str, tuple[str, str]]) -> None:
+        self.directory = directory
+        self.columns: dict[str, array] = {TIME_COLUMN: array("q")}
+        self.columns.update({name: array(kind) for name, (kind, _) in schema.items()})
+        self._load()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.col")
+
+    def _load(self) -> None:
+        for name, column in self.columns.items():
+            path = self._path(name)
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as file:
+                data = file.read()
+            usable = len(data) - len(data) % column.itemsize
+            column.frombytes(data[:usable])
+        # Yarıda kalmış bir ekleme varsa tüm sütunları en kısasına indir
+        length = min(len(column) for column in self.columns.values())
+        for name, column in self.columns.items():
+            if len(column) != length:
+                del column[length:]
+                with open(self._path(name), "wb") as file:
+                    column.tofile(file)
+
+    def append(self, rows: dict[str, array]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        for name, values in rows.items():
+            with open(self._path(name), "ab") as file:
+                values.tofile(file)
+            self.columns[name].extend(values)
+
+
+class CosaHistoryStore:
+    """Endpoint başına sütunlu, yalnızca eklemeli zaman serisi deposu."""
+
+    def __init__(self, directory: str, columns: dict[str, tuple[str, str]] = COLUMNS) -> None:
+        self._directory = directory
+        self._schema = columns
+        self._endpoints: dict[str, _EndpointColumns] = {}
+        # Son örnek zamanı; event loop kilit almadan buradan okur
+        self._last: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, endpoint_id: str) -> _EndpointColumns:
+        endpoint = self._endpoints.get(endpoint_id)
+        if endpoint is None:
+            endpoint = self._endpoints[endpoint_id] = _EndpointColumns(
+                os.path.join(self._directory, endpoint_id), self._schema
+            )
+            times = endpoint.columns[TIME_COLUMN]
+            if times:
+                self._last[endpoint_id] = times[-1]
+        return endpoint
+
+    def last_time(self, endpoint_id: str) -> Optional[int]:
+        with self._lock:
+            times = self._endpoint(endpoint_id).columns[TIME_COLUMN]
+            return times[-1] if times else None
+
+    def cached_last_time(self, endpoint_id: str) -> Optional[int]:
+        """Son örnek zamanı, diske/kilide dokunmadan (sütunlar executor'da yüklenmiş olmalı)."""
+        return self._last.get(endpoint_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(endpoint.columns[TIME_COLUMN]) for endpoint in self._endpoints.values())
+
+    def ingest(self, endpoint_id: str, samples: Iterable[dict[str, Any]]) -> int:
+        """Son kayıttan yeni örnekleri ekle; eklenen örnek sayısını döndür."""
+        with self._lock:
+            endpoint = self._endpoint(endpoint_id)
+            times = endpoint.columns[TIME_COLUMN]
+            last = times[-1] if times else None
+            fresh: dict[int, dict[str, Any]] = {}
+            for sample in samples:
+                timestamp = _parse_time(sample)
+                if timestamp is not None and (last is None or timestamp > last):
+                    fresh[timestamp] = sample
+            if not fresh:
+                return 0
+
+            ordered = sorted(fresh)
+            rows = {TIME_COLUMN: array("q", ordered)}
+            for name, (kind, key) in self._schema.items():
+                rows[name] = array(kind, (_value(kind, fresh[timestamp].get(key)) for timestamp in ordered))
+            endpoint.append(rows)
+            self._last[endpoint_id] = ordered[-1]
+            return len(ordered)
+
+    def query(
+        self,
+        endpoint_id: str,
+        start: int,
+        end: int,
+        columns: Optional[Iterable[str]] = None,
+    ) -> dict[str, array]:
+        """[start, end] aralığındaki örnekler (sütun başına dizi dilimi)."""
+        names = [TIME_COLUMN, *(columns or self._schema)]
+        with self._lock:
+            endpoint = self._endpoint(endpoint_id)
+            times = endpoint.columns[TIME_COLUMN]
+            low, high = bisect_left(times, start), bisect_right(times, end)
+            return {name: endpoint.columns[name][low:high] for name in names}
+
+    def iter_query(
+        self,
+        endpoint_id: str,
+        start: int,
+        end: int,
+        chunk: int = 10000,
+    ) -> Iterator[dict[str, array]]:
+        """query ile aynı, en fazla chunk örneklik dilimler halinde (dışa aktarma için)."""
+        names = [TIME_COLUMN, *self._schema]
+        with self._lock:
+            times = self._endpoint(endpoint_id).columns[TIME_COLUMN]
+            low, high = bisect_left(times, start), bisect_right(times, end)
+        for position in range(low, high, chunk):
+            stop = min(position + chunk, high)
+            with self._lock:
+                columns = self._endpoint(endpoint_id).columns
+                window = {name: columns[name][position:stop] for name in names}
+            yield window
+
+    def downsample(
+        self,
+        endpoint_id: str,
+        start: int,
+        end: int,
+        bucket: int,
+    ) -> list[dict[str, Any]]:
+        """Aralığı bucket saniyelik dilimlere böl: sıcaklıkların ortalaması, ısıtma oranı."""
+        window = self.query(endpoint_id, start, end)
+        times = window[TIME_COLUMN]
+        result: list[dict[str, Any]] = []
+        position = 0
+        while position < len(times):
+            bucket_start = times[position] - (times[position] - start) % bucket
+            stop = bisect_left(times, bucket_start + bucket, position)
+            row: dict[str, Any] = {"start": bucket_start, "samples": stop - position}
+            for name, (kind, _) in self._schema.items():
+                values = [
+                    value for value in window[name][position:stop]
+                    if (value != _MISSING_FLAG if kind == "b" else not math.isnan(value))
+                ]
+                row[name] = round(sum(values) / len(values), 3) if values else None
+            result.append(row)
+            position = stop
+        return result
+
+    def remove(self, endpoint_id: str) -> None:
+        """Endpoint'in tüm geçmişini sil."""
+        with self._lock:
+            self._endpoints.pop(endpoint_id, None)
+            self._last.pop(endpoint_id, None)
+            shutil.rmtree(os.path.join(self._directory, endpoint_id), ignore_errors=True)
@@ -0,0 +1,149 @@
+"""COSA Çevrimdışı Komut Günlüğü."""
+
+from __future__ import annotations
+
+import asyncio
+from enum import IntEnum
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .api import CosaConnectionError
+from .const import (
+    DOMAIN,
+    JOURNAL_BACKOFF_MAX,
+    JOURNAL_BACKOFF_MIN,
+    JOURNAL_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ReplayHandler = Callable[[dict[str, Any]], Awaitable[bool]]
+
+
+class CosaWriteResult(IntEnum):
+    """Yazma komutunun sonucu; gönderildi ve günlüğe alındı durumları doğru (truthy)."""
+
+    REJECTED = 0
+    SENT = 1
+    QUEUED = 2  # bulut ulaşılamadı, bağlantı gelince gönderilecek
+
+
+def journal_storage_key(entry_id: str) -> str:
+    """Config entry'ye ait günlük dosyasının anahtarı."""
+    return f"{DOMAIN}.journal.{entry_id}"
+
+
+class CosaCommandJournal:
+    """Buluta ulaşılamadığında başarısız yazma komutlarını saklar.
+
+    Her endpoint + ayar için tek kayıt tutulur; yeni komut eskisinin yerine
+    geçer ve sıranın sonuna taşınır. Bağlantı geri geldiğinde kayıtlar
+    sırayla, artan bekleme süreleriyle yeniden gönderilir.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(hass, JOURNAL_STORAGE_VERSION, journal_storage_key(entry_id))
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+        self._failures = 0
+        self._next_attempt = 0.0
+        self.retries = 0
+
+    @staticmethod
+    def _key(endpoint_id: str, setting: str) -> str:
+        return f"{endpoint_id}:{setting}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def replay_due(self) -> bool:
+        """Bekleyen kayıt var ve bekleme süresi dolmuş mu."""
+        return bool(self._entries) and not self._lock.locked() and time.monotonic() >= self._next_attempt
+
+    def has_pending(self, endpoint_id: str, setting: str) -> bool:
+        """Bu ayar için gönderilmeyi bekleyen komut var mı."""
+        return self._key(endpoint_id, setting) in self._entries
+
+    def pending_payload(self, endpoint_id: str, setting: str) -> Optional[dict[str, Any]]:
+        """Henüz gönderilemeyen son komutun içeriği."""
+        entry = self._entries.get(self._key(endpoint_id, setting))
+        return dict(entry["payload"]) if entry else None
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Bekleyen kayıtlar ve yeniden deneme (devre) durumu."""
+        return {
+            "pending": [
+                {"setting": entry["setting"], "payload": entry["payload"]}
+                for entry in self._entries.values()
+            ],
+            "failures": self._failures,
+            "retries": self.retries,
+            "next_attempt_in": max(0.0, round(self._next_attempt - time.monotonic(), 1)),
+        }
+
+    async def async_load(self) -> None:
+        """Kayıtlı günlüğü diskten yükle."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        for entry in data.get("entries", []):
+            self._entries[self._key(entry["endpoint"], entry["setting"])] = entry
+        if self._entries:
+            _LOGGER.info("📒 %d bekleyen komut günlükten yüklendi", len(self._entries))
+
+    async def _async_save(self) -> None:
+        await self._store.async_save({"entries": list(self._entries.values())})
+
+    async def async_record(self, endpoint_id: str, setting: str, payload: dict[str, Any]) -> None:
+        """Başarısız komutu kaydet, aynı ayara ait eski kaydın yerine geçir."""
+        key = self._key(endpoint_id, setting)
+        self._entries.pop(key, None)
+        self._entries[key] = {
+            "endpoint": endpoint_id,
+            "setting": setting,
+            "payload": payload,
+            "recorded_at": time.time(),
+        }
+        _LOGGER.warning("📒 Komut günlüğe alındı (%s), bağlantı gelince gönderilecek", setting)
+        await self._async_save()
+
+    async def async_discard(self, endpoint_id: str, setting: str) -> None:
+        """Daha yeni bir komut başarıyla gönderildiyse eski kaydı at."""
+        if self._entries.pop(self._key(endpoint_id, setting), None) is not None:
+            await self._async_save()
+
+    async def async_replay(self, handlers: dict[str, ReplayHandler]) -> bool:
+        """Bekleyen komutları sırayla gönder. Tümü gönderildiyse True döner."""
+        async with self._lock:
+            while self._entries:
+                key, entry = next(iter(self._entries.items()))
+                handler = handlers.get(entry["setting"])
+                self.retries += 1
+                try:
+                    result = await handler(entry["payload"]) if handler else False
+                except CosaConnectionError as err:
+                    self._failures += 1
+                    delay = min(JOURNAL_BACKOFF_MIN * 2 ** (self._failures - 1), JOURNAL_BACKOFF_MAX)
+                    self._next_attempt = time.monotonic() + delay
+                    _LOGGER.debug("Günlük tekrarı başarısız (%s), %ss sonra denenecek", err, delay)
+                    await self._async_save()
+                    return False
+
+                # API komutu reddettiyse tekrar denemenin anlamı yok
+                if not result:
+                    _LOGGER.warning("📒 Günlükteki komut API tarafından reddedildi: %s", entry)
+                else:
+                    _LOGGER.info("📒 Günlükteki komut gönderildi (%s)", entry["setting"])
+                # Tekrar sırasında aynı ayar için yeni komut geldiyse onu koru
+                if self._entries.get(key) is entry:
+                    self._entries.pop(key)
+
+            self._failures = 0
+            self._next_attempt = 0.0
+            await self._async_save()
+            return True
@@ -0,0 +1,162 @@
+"""COSA Veri Tazeliği Metrikleri."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime, timezone
+import time
+from typing import Any, Optional
+
+from .const import METRICS_INTERVAL_HISTORY, METRICS_LATENCY_BUCKETS, METRICS_SAMPLES
+
+
+def percentile(samples: deque[float], q: float) -> Optional[float]:
+    """En yakın sıra yöntemiyle yüzdelik (örnek yoksa None)."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class CosaRefreshMetrics:
+    """Coordinator yenilemeleri için hafif sayaçlar.
+
+    Yenileme süresi, API yanıtından state yazımına kadar geçen süre,
+    başarısız ve atlanan tick sayıları tutulur.
+    """
+
+    def __init__(self, samples: int = METRICS_SAMPLES) -> None:
+        self.durations: deque[float] = deque(maxlen=samples)
+        self.write_delays: deque[float] = deque(maxlen=samples)
+        self.last_success: Optional[datetime] = None
+        self.failed = 0
+        self.skipped = 0
+        self.intervals: deque[tuple[str, Optional[float]]] = deque(maxlen=METRICS_INTERVAL_HISTORY)
+        self.entity_writes: dict[str, int] = {}
+        self.suppressed_writes = 0
+        self.refresh_count = 0
+        self.refresh_time_total = 0.0
+        self.startup: dict[str, float] = {}
+        self._last_start: Optional[float] = None
+
+    def refresh_started(self, interval: Optional[float]) -> float:
+        """Yenileme başladı; beklenen aralığın çok ötesindeyse atlanan tick say."""
+        now = time.monotonic()
+        if self._last_start is not None and interval:
+            missed = int((now - self._last_start) / interval + 0.5) - 1
+            if missed > 0:
+                self.skipped += missed
+        self._last_start = now
+        return now
+
+    def refresh_succeeded(self, started: float) -> None:
+        duration = time.monotonic() - started
+        self.durations.append(duration)
+        self.refresh_count += 1
+        self.refresh_time_total += duration
+        self.last_success = datetime.now(timezone.utc)
+
+    def refresh_failed(self) -> None:
+        self.failed += 1
+
+    def interval_changed(self, interval: Optional[float]) -> None:
+        """Coordinator aralığı değiştiyse geçmişe ekle."""
+        if not self.intervals or self.intervals[-1][1] != interval:
+            self.intervals.append((datetime.now(timezone.utc).isoformat(), interval))
+
+    def entity_written(self, entity_id: str) -> None:
+        self.entity_writes[entity_id] = self.entity_writes.get(entity_id, 0) + 1
+
+    def write_suppressed(self) -> None:
+        """Değişiklik olmadığı için atlanan state yazımı."""
+        self.suppressed_writes += 1
+
+    def state_written(self, response_at: Optional[float]) -> None:
+        """Entity'ler yazıldıktan sonra, son API yanıtından bu yana geçen süre."""
+        if response_at is not None:
+            self.write_delays.append(time.monotonic() - response_at)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "duration_p50": percentile(self.durations, 0.5),
+            "duration_p95": percentile(self.durations, 0.95),
+            "write_delay_p50": percentile(self.write_delays, 0.5),
+            "write_delay_p95": percentile(self.write_delays, 0.95),
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "interval_history": list(self.intervals),
+            "entity_writes": dict(self.entity_writes),
+            "suppressed_writes": self.suppressed_writes,
+            "startup": dict(self.startup),
+        }
+
+    @property
+    def last_success_age(self) -> Optional[float]:
+        if self.last_success is None:
+            return None
+        return (datetime.now(timezone.utc) - self.last_success).total_seconds()
+
+
+class _MethodStats:
+    """Tek bir API metodunun sayaçları."""
+
+    __slots__ = ("requests", "errors", "buckets", "total_time")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        # Kümülatif değil; her örnek ilk uyan kovaya yazılır (son kova = +Inf)
+        self.buckets = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+        self.total_time = 0.0
+
+
+class CosaRequestStats:
+    """API metodu başına istek sayısı, hata sınıfları, gecikme histogramı ve yanıt boyutu."""
+
+    def __init__(self) -> None:
+        self.methods: dict[str, _MethodStats] = {}
+        self.payload_sizes: dict[str, dict[str, int]] = {}
+
+    def _method(self, method: str) -> _MethodStats:
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods[method] = _MethodStats()
+        return stats
+
+    def record(self, method: str, duration: float, error: Optional[BaseException] = None) -> None:
+        stats = self._method(method)
+        stats.requests += 1
+        stats.total_time += duration
+        stats.buckets[bisect_left(METRICS_LATENCY_BUCKETS, duration)] += 1
+        if error is not None:
+            self.error(method, error)
+
+    def error(self, method: str, error: BaseException) -> None:
+        errors = self._method(method).errors
+        name = type(error).__name__
+        errors[name] = errors.get(name, 0) + 1
+
+    def payload(self, path: str, size: int) -> None:
+        sizes = self.payload_sizes.setdefault(path, {"last": 0, "max": 0, "count": 0, "total": 0})
+        sizes["last"] = size
+        sizes["max"] = max(sizes["max"], size)
+        sizes["count"] += 1
+        sizes["total"] += size
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "methods": {
+                method: {
+                    "requests": stats.requests,
+                    "errors": dict(stats.errors),
+                    "avg_seconds": round(stats.total_time / stats.requests, 3) if stats.requests else None,
+                    "histogram": dict(zip(
+                        [*(str(bound) for bound in METRICS_LATENCY_BUCKETS), "+Inf"], stats.buckets
+                    )),
+                }
+                for method, stats in self.methods.items()
+            },
+            "payload_sizes": self.payload_sizes,
+        }
@@ -0,0 +1,203 @@
+"""COSA Veri Modelleri."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from homeassistant.components.climate import HVACMode
+
+from .const import (
+    BATTERY_LEVELS,
+    COMBI_STATE_NAMES,
+    MODE_AUTO,
+    MODE_MANUAL,
+    MODE_NAMES,
+    MODE_SCHEDULE,
+    NETWORK_QUALITY_NAMES,
+    OPTION_AWAY,
+    OPTION_CUSTOM,
+    OPTION_FROZEN,
+    OPTION_HOME,
+    OPTION_NAMES,
+    OPTION_SLEEP,
+    OPTION_TO_PRESET,
+    PRESET_EVDE,
+    PRESET_HAFTALIK,
+    PRESET_OTOMATIK,
+    WEATHER_ICONS,
+    WEATHER_TRANSLATIONS,
+)
+
+# Manuel modda hedef sıcaklığın okunduğu preset alanı
+_OPTION_TEMPERATURE_KEYS = {
+    OPTION_HOME: "homeTemperature",
+    OPTION_AWAY: "awayTemperature",
+    OPTION_SLEEP: "sleepTemperature",
+    OPTION_CUSTOM: "customTemperature",
+}
+
+_RUNTIME_KEYS = ("total", "home", "sleep", "away", "custom", "frozen")
+
+
+def _hours(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds / 3600, 2)
+
+
+class CosaSnapshot:
+    """Bir yenilemede API yanıtından bir kez ayrıştırılan endpoint durumu.
+
+    Entity'ler sözlükleri gezmek yerine bu nesnenin düz alanlarını okur;
+    türetilmiş değerler (hedef sıcaklık, HVAC modu, preset vb.) burada
+    bir kez hesaplanır.
+    """
+
+    __slots__ = (
+        # Endpoint
+        "name",
+        "place",
+        "temperature",
+        "humidity",
+        "target_temperature",
+        "raw_target_temperature",
+        "home_temperature",
+        "away_temperature",
+        "sleep_temperature",
+        "custom_temperature",
+        "mode",
+        "option",
+        "mode_name",
+        "option_name",
+        "hvac_mode",
+        "preset",
+        "combi_state",
+        "combi_state_name",
+        "heating",
+        "battery_voltage",
+        "power_state",
+        "battery_percent",
+        "rssi",
+        "firmware_version",
+        "is_connected",
+        "calibration",
+        "open_window_enable",
+        "open_window_state",
+        "child_lock",
+        # Hava durumu (hourly[0])
+        "outdoor_temperature",
+        "outdoor_humidity",
+        "weather_icon",
+        "weather_name",
+        "weather_ha_icon",
+        # Raporlar (son 24 saat)
+        "runtimes",
+        "runtime_hours",
+        "average_temperatures",
+        "max_temperature",
+        "min_temperature",
+        "max_humidity",
+        "min_humidity",
+        "place_average_temperature",
+        "network_quality",
+        "network_quality_name",
+        "offline_for",
+    )
+
+    def __init__(
+        self,
+        endpoint: dict[str, Any],
+        forecast: dict[str, Any],
+        reports: dict[str, Any],
+    ) -> None:
+        get = endpoint.get
+        device = get("device") or {}
+
+        self.name = get("name")
+        self.place = get("place")
+        self.temperature = get("temperature")
+        self.humidity = get("humidity")
+        self.raw_target_temperature = get("targetTemperature")
+        self.home_temperature = get("homeTemperature")
+        self.away_temperature = get("awayTemperature")
+        self.sleep_temperature = get("sleepTemperature")
+        self.custom_temperature = get("customTemperature")
+
+        mode = self.mode = get("mode")
+        option = self.option = get("option")
+        self.mode_name = MODE_NAMES.get(mode, mode)
+        self.option_name = OPTION_NAMES.get(option, option)
+
+        # Manuel moddaysa option'a göre sıcaklık, diğer modlarda targetTemperature
+        if mode == MODE_MANUAL and option in _OPTION_TEMPERATURE_KEYS:
+            self.target_temperature = get(_OPTION_TEMPERATURE_KEYS[option])
+        else:
+            self.target_temperature = self.raw_target_temperature
+
+        self.hvac_mode = HVACMode.OFF if mode == MODE_MANUAL and option == OPTION_FROZEN else HVACMode.HEAT
+        if mode == MODE_SCHEDULE:
+            self.preset = PRESET_HAFTALIK
+        elif mode == MODE_AUTO:
+            self.preset = PRESET_OTOMATIK
+        else:
+            self.preset = OPTION_TO_PRESET.get(option, PRESET_EVDE)
+
+        combi_state = self.combi_state = get("combiState")
+        self.combi_state_name = COMBI_STATE_NAMES.get(combi_state, combi_state)
+        self.heating = combi_state == "on"
+
+        self.battery_voltage = get("batteryVoltage")
+        self.power_state = get("powerState")
+        self.battery_percent = BATTERY_LEVELS.get(self.power_state or "", 0)
+        self.rssi = get("rssi")
+        self.firmware_version = device.get("version")
+        self.is_connected = device.get("isConnected", False)
+        self.calibration = get("calibration", 0.0)
+        self.open_window_enable = get("openWindowEnable", False)
+        self.open_window_state = get("openWindowState")
+        self.child_lock = get("childLock")
+
+        hourly = forecast.get("hourly") or [{}]
+        current = hourly[0]
+        self.outdoor_temperature = current.get("temperature")
+        self.outdoor_humidity = current.get("humidity")
+        icon = self.weather_icon = current.get("icon")
+        self.weather_name = WEATHER_TRANSLATIONS.get(icon, icon) if icon is not None else None
+        self.weather_ha_icon = WEATHER_ICONS.get(icon, icon) if icon is not None else None
+
+        summary = reports.get("summary") or {}
+        stats = reports.get("stats") or {}
+        self.runtimes = summary.get("runtimes") or {}
+        self.runtime_hours = {key: _hours(self.runtimes.get(key)) for key in _RUNTIME_KEYS}
+        self.average_temperatures = summary.get("averageTemperatures") or {}
+        self.max_temperature = stats.get("maxTemperature")
+        self.min_temperature = stats.get("minTemperature")
+        self.max_humidity = stats.get("maxHumidity")
+        self.min_humidity = stats.get("minHumidity")
+        average = stats.get("placeAverageTemperature")
+        self.place_average_temperature = round(average, 1) if average else None
+        quality = self.network_quality = stats.get("networkQuality")
+        self.network_quality_name = (
+            None if quality is None else NETWORK_QUALITY_NAMES.get(quality, f"Seviye {quality}")
+        )
+        self.offline_for = stats.get("offlineFor", 0)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def diff(self, previous: CosaSnapshot) -> dict[str, dict[str, Any]]:
+        """Önceki snapshot'a göre değişen alanlar: {alan: {"old", "new"}}."""
+        changes = {}
+        for field in self.__slots__:
+            old, new = getattr(previous, field), getattr(self, field)
+            if old != new:
+                changes[field] = {"old": old, "new": new}
+        return changes
+
+    @classmethod
+    def from_data(cls, data: Optional[dict[str, Any]]) -> CosaSnapshot:
+        """Coordinator verisinden snapshot al."""
+        if data and "snapshot" in data:
+            return data["snapshot"]
+        return EMPTY_SNAPSHOT
+
+
+EMPTY_SNAPSHOT = CosaSnapshot({}, {}, {})
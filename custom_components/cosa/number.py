@@ -8,9 +8,7 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -18,9 +16,13 @@ from .const import (
     CALIBRATION_MAX,
     CALIBRATION_STEP,
 )
+from .entity import CosaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+CALIBRATION_TOLERANCE = 0.05
+TEMPERATURE_TOLERANCE = 0.25
+
 TEMPERATURE_MIN = 5.0
 TEMPERATURE_MAX = 32.0
 TEMPERATURE_STEP = 0.5
@@ -45,10 +47,10 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class CosaCalibrationNumber(CoordinatorEntity, NumberEntity):
+class CosaCalibrationNumber(CosaEntity, NumberEntity):
     """Sıcaklık Kalibrasyonu Number Entity."""
 
-    _attr_has_entity_name = True
+    _snapshot_fields = ("calibration",)
     _attr_native_min_value = CALIBRATION_MIN
     _attr_native_max_value = CALIBRATION_MAX
     _attr_native_step = CALIBRATION_STEP
@@ -57,48 +59,39 @@ class CosaCalibrationNumber(CoordinatorEntity, NumberEntity):
     _attr_icon = "mdi:thermometer-check"
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_calibration"
         self._attr_name = "Sıcaklık Kalibrasyonu"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-        )
-        self._optimistic_value: float | None = None
-
-    @property
-    def _endpoint(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("endpoint", {})
-        return {}
 
     @property
     def native_value(self) -> float | None:
-        if self._optimistic_value is not None:
-            return self._optimistic_value
-        return self._endpoint.get("calibration", 0.0)
+        optimistic = self.coordinator.optimistic.get(self.coordinator.endpoint_id, "calibration")
+        if optimistic is not None:
+            return optimistic
+        return self._snapshot.calibration
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Coordinator güncellemesini işle."""
-        real_value = self._endpoint.get("calibration", 0.0)
-        if self._optimistic_value is not None and abs(real_value - self._optimistic_value) < 0.05:
-            self._optimistic_value = None
-        self.async_write_ha_state()
+        confirmed = self.coordinator.optimistic.confirm(
+            self.coordinator.endpoint_id, "calibration", self._snapshot.calibration
+        )
+        self._async_write_if_changed(force=confirmed)
 
     async def async_set_native_value(self, value: float) -> None:
         """Kalibrasyonu ayarla."""
-        self._optimistic_value = value
+        optimistic = self.coordinator.optimistic
+        optimistic.set(self.coordinator.endpoint_id, "calibration", value, CALIBRATION_TOLERANCE)
         self.async_write_ha_state()
         result = await self.coordinator.async_set_calibration(value)
         if not result:
-            self._optimistic_value = None
+            optimistic.clear(self.coordinator.endpoint_id, "calibration")
             self.async_write_ha_state()
 
 
-class CosaTemperatureNumberBase(CoordinatorEntity, NumberEntity):
+class CosaTemperatureNumberBase(CosaEntity, NumberEntity):
     """Base class for temperature number entities."""
 
-    _attr_has_entity_name = True
     _attr_native_min_value = TEMPERATURE_MIN
     _attr_native_max_value = TEMPERATURE_MAX
     _attr_native_step = TEMPERATURE_STEP
@@ -108,48 +101,40 @@ class CosaTemperatureNumberBase(CoordinatorEntity, NumberEntity):
     _preset_name: str = ""
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, config_entry)
         self._config_entry = config_entry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-        )
-        self._optimistic_value: float | None = None
-
-    @property
-    def _endpoint(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("endpoint", {})
-        return {}
+        self._snapshot_fields = (self._temp_key,)
 
     @property
     def native_value(self) -> float | None:
-        if self._optimistic_value is not None:
-            return self._optimistic_value
-        return self._endpoint.get(self._temp_key)
+        optimistic = self.coordinator.optimistic.get(self.coordinator.endpoint_id, self._temp_key)
+        if optimistic is not None:
+            return optimistic
+        return getattr(self._snapshot, self._temp_key)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Coordinator güncellemesini işle."""
-        real_value = self._endpoint.get(self._temp_key)
-        if self._optimistic_value is not None and real_value is not None:
-            if abs(real_value - self._optimistic_value) < 0.25:
-                self._optimistic_value = None
-        self.async_write_ha_state()
+        confirmed = self.coordinator.optimistic.confirm(
+            self.coordinator.endpoint_id, self._temp_key, getattr(self._snapshot, self._temp_key)
+        )
+        self._async_write_if_changed(force=confirmed)
 
     async def async_set_native_value(self, value: float) -> None:
         """Sıcaklığı ayarla."""
-        self._optimistic_value = value
+        optimistic = self.coordinator.optimistic
+        optimistic.set(self.coordinator.endpoint_id, self._temp_key, value, TEMPERATURE_TOLERANCE)
         self.async_write_ha_state()
         result = await self.coordinator.async_set_preset_temperature(self._preset_name, value)
         if not result:
-            self._optimistic_value = None
+            optimistic.clear(self.coordinator.endpoint_id, self._temp_key)
             self.async_write_ha_state()
 
 
 class CosaHomeTemperatureNumber(CosaTemperatureNumberBase):
     """Evdeyim Sıcaklığı Number Entity."""
 
-    _temp_key = "homeTemperature"
+    _temp_key = "home_temperature"
     _preset_name = "home"
     _attr_icon = "mdi:home-thermometer"
 
@@ -162,7 +147,7 @@ class CosaHomeTemperatureNumber(CosaTemperatureNumberBase):
 class CosaAwayTemperatureNumber(CosaTemperatureNumberBase):
     """Dışarıdayım Sıcaklığı Number Entity."""
 
-    _temp_key = "awayTemperature"
+    _temp_key = "away_temperature"
     _preset_name = "away"
     _attr_icon = "mdi:home-export-outline"
 
@@ -175,7 +160,7 @@ class CosaAwayTemperatureNumber(CosaTemperatureNumberBase):
 class CosaSleepTemperatureNumber(CosaTemperatureNumberBase):
     """Uyku Sıcaklığı Number Entity."""
 
-    _temp_key = "sleepTemperature"
+    _temp_key = "sleep_temperature"
     _preset_name = "sleep"
     _attr_icon = "mdi:bed"
 
@@ -188,7 +173,7 @@ class CosaSleepTemperatureNumber(CosaTemperatureNumberBase):
 class CosaCustomTemperatureNumber(CosaTemperatureNumberBase):
     """Özel Sıcaklık Number Entity."""
 
-    _temp_key = "customTemperature"
+    _temp_key = "custom_temperature"
     _preset_name = "custom"
     _attr_icon = "mdi:thermometer-lines"
 
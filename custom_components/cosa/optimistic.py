@@ -0,0 +1,127 @@
+"""COSA İyimser (Optimistic) Durum Yöneticisi."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from .const import OPTIMISTIC_LATENCY_SAMPLES, OPTIMISTIC_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _PendingValue:
+    """Buluttan onay bekleyen tek bir değer."""
+
+    __slots__ = ("value", "tolerance", "created", "since", "dropped")
+
+    def __init__(self, value: Any, tolerance: float) -> None:
+        self.value = value
+        self.tolerance = tolerance
+        self.created = time.monotonic()
+        # Süre sayımının başladığı an; komut günlükte beklerken ileri alınır
+        self.since = self.created
+        self.dropped = False
+
+    def matches(self, real_value: Any) -> bool:
+        if real_value is None:
+            return False
+        if self.tolerance and isinstance(self.value, (int, float)) and isinstance(real_value, (int, float)):
+            return abs(real_value - self.value) <= self.tolerance
+        return real_value == self.value
+
+
+class CosaOptimisticState:
+    """(endpoint, alan) anahtarlı iyimser değerler.
+
+    Değer, bulut toleransla aynı değeri döndürdüğünde onaylanır veya süre
+    dolunca düşürülür; böylece hiçbir kontrol sonsuza kadar iyimser kalmaz.
+    Komutu çevrimdışı günlükte bekleyen değerler için (held) süre, komut
+    gönderilene kadar başlamaz; günlükteki komut reddedilirse değer hemen
+    düşürülür. Komuttan onaya kadar geçen süre her alan için kaydedilir.
+    """
+
+    def __init__(
+        self,
+        timeout: float = OPTIMISTIC_TIMEOUT,
+        held: Optional[Callable[[str, str], bool]] = None,
+    ) -> None:
+        self._timeout = timeout
+        self._held = held
+        self._pending: dict[tuple[str, str], _PendingValue] = {}
+        self.latencies: dict[str, deque[float]] = {}
+        self.expired: dict[str, int] = {}
+
+    def set(self, endpoint_id: str, field: str, value: Any, tolerance: float = 0.0) -> None:
+        """Komut gönderilmeden önce iyimser değeri kaydet."""
+        self._pending[(endpoint_id, field)] = _PendingValue(value, tolerance)
+
+    def clear(self, endpoint_id: str, field: str) -> None:
+        """Komut başarısız olduysa iyimser değeri at."""
+        self._pending.pop((endpoint_id, field), None)
+
+    def drop(self, endpoint_id: str, field: str) -> None:
+        """Günlükteki komut reddedildi; değer bir sonraki güncellemede düşer."""
+        pending = self._pending.get((endpoint_id, field))
+        if pending is not None:
+            pending.dropped = True
+
+    def _timed_out(self, endpoint_id: str, field: str, pending: _PendingValue) -> bool:
+        if pending.dropped:
+            return True
+        now = time.monotonic()
+        if self._held is not None and self._held(endpoint_id, field):
+            pending.since = now
+            return False
+        return now - pending.since > self._timeout
+
+    def get(self, endpoint_id: str, field: str) -> Any | None:
+        """Geçerli iyimser değer, yoksa None."""
+        pending = self._pending.get((endpoint_id, field))
+        if pending is None:
+            return None
+        if self._timed_out(endpoint_id, field, pending):
+            self._expire(endpoint_id, field)
+            return None
+        return pending.value
+
+    def confirm(self, endpoint_id: str, field: str, real_value: Any) -> bool:
+        """Buluttan gelen değerle karşılaştır. Değer düştüyse True döner."""
+        key = (endpoint_id, field)
+        pending = self._pending.get(key)
+        if pending is None:
+            return False
+
+        elapsed = time.monotonic() - pending.created
+        if pending.matches(real_value):
+            del self._pending[key]
+            self.latencies.setdefault(
+                field, deque(maxlen=OPTIMISTIC_LATENCY_SAMPLES)
+            ).append(elapsed)
+            _LOGGER.debug("%s onaylandı (%.1f sn)", field, elapsed)
+            return True
+
+        if self._timed_out(endpoint_id, field, pending):
+            self._expire(endpoint_id, field)
+            return True
+        return False
+
+    def _expire(self, endpoint_id: str, field: str) -> None:
+        self._pending.pop((endpoint_id, field), None)
+        self.expired[field] = self.expired.get(field, 0) + 1
+        _LOGGER.debug("%s için iyimser değer onaylanmadan süresi doldu", field)
+
+    def latency_stats(self) -> dict[str, dict[str, float]]:
+        """Alan başına komut→onay gecikmesi özeti."""
+        return {
+            field: {
+                "count": len(samples),
+                "last": round(samples[-1], 2),
+                "avg": round(sum(samples) / len(samples), 2),
+                "max": round(max(samples), 2),
+            }
+            for field, samples in self.latencies.items()
+            if samples
+        }
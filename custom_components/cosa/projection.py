@@ -0,0 +1,97 @@
+"""COSA API Yanıt Projeksiyonu: yanıtlardan yalnızca entity'lerin okuduğu alanlar tutulur."""
+
+from __future__ import annotations
+
+from typing import Any
+
+ENDPOINT_FIELDS = (
+    "name",
+    "place",
+    "temperature",
+    "humidity",
+    "targetTemperature",
+    "homeTemperature",
+    "awayTemperature",
+    "sleepTemperature",
+    "customTemperature",
+    "mode",
+    "option",
+    "combiState",
+    "batteryVoltage",
+    "powerState",
+    "rssi",
+    "calibration",
+    "openWindowEnable",
+    "openWindowState",
+    "childLock",
+)
+DEVICE_FIELDS = ("version", "isConnected")
+# Yalnızca mevcut saat (hourly[0]) okunuyor
+FORECAST_HOURLY_FIELDS = ("temperature", "humidity", "icon")
+# Hava durumu entity'si için tahmin dizileri
+FORECAST_SERIES_FIELDS = (
+    "time",
+    "icon",
+    "temperature",
+    "apparentTemperature",
+    "humidity",
+    "pressure",
+    "precipProbability",
+)
+FORECAST_DAILY_FIELDS = FORECAST_SERIES_FIELDS + (
+    "temperatureHigh",
+    "temperatureLow",
+    "temperatureMax",
+    "temperatureMin",
+)
+REPORT_SUMMARY_FIELDS = ("runtimes", "averageTemperatures")
+REPORT_STATS_FIELDS = (
+    "maxTemperature",
+    "minTemperature",
+    "maxHumidity",
+    "minHumidity",
+    "placeAverageTemperature",
+    "networkQuality",
+    "offlineFor",
+)
+
+
+def _pick(source: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    return {field: source[field] for field in fields if field in source}
+
+
+def project_endpoint(endpoint: dict[str, Any]) -> dict[str, Any]:
+    """getEndpoint yanıtından kullanılan alanlar."""
+    projected = _pick(endpoint, ENDPOINT_FIELDS)
+    device = endpoint.get("device")
+    if device:
+        projected["device"] = _pick(device, DEVICE_FIELDS)
+    return projected
+
+
+def project_forecast(forecast: dict[str, Any]) -> dict[str, Any]:
+    """getForecast yanıtından yalnızca mevcut saat."""
+    hourly = forecast.get("hourly")
+    if not hourly:
+        return {}
+    return {"hourly": [_pick(hourly[0], FORECAST_HOURLY_FIELDS)]}
+
+
+def project_forecast_series(
+    forecast: dict[str, Any], hourly_limit: int, daily_limit: int
+) -> dict[str, Any]:
+    """getForecast yanıtından saatlik/günlük diziler (sınırlı sayıda)."""
+    return {
+        "hourly": [_pick(hour, FORECAST_SERIES_FIELDS) for hour in (forecast.get("hourly") or [])[:hourly_limit]],
+        "daily": [_pick(day, FORECAST_DAILY_FIELDS) for day in (forecast.get("daily") or [])[:daily_limit]],
+    }
+
+
+def project_reports(reports: dict[str, Any]) -> dict[str, Any]:
+    """getReportsAnalyzed raporundan özet ve istatistikler (seri verisi hariç)."""
+    projected = {}
+    if reports.get("summary"):
+        projected["summary"] = _pick(reports["summary"], REPORT_SUMMARY_FIELDS)
+    if reports.get("stats"):
+        projected["stats"] = _pick(reports["stats"], REPORT_STATS_FIELDS)
+    return projected
@@ -0,0 +1,116 @@
+"""COSA Prometheus Metrik Görünümü."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, METRICS_LATENCY_BUCKETS, METRICS_VIEW_URL
+from .metrics import percentile
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_REGISTERED = f"{DOMAIN}_metrics_view"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Family:
+    """Tek bir metrik ailesinin satırları."""
+
+    def __init__(self, name: str, kind: str, help_text: str) -> None:
+        self.name = name
+        self.lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+    def add(self, value: float, suffix: str = "", **labels: Any) -> None:
+        self.lines.append(f"{self.name}{suffix}{_labels(**labels)} {value}")
+
+
+def render_metrics(coordinators: Iterable[Any]) -> str:
+    """Yüklü entry'lerin sayaçlarını Prometheus metin formatına çevir."""
+    latency = _Family("cosa_api_request_duration_seconds", "histogram", "API metodu başına istek süresi")
+    errors = _Family("cosa_api_errors_total", "counter", "API metodu ve hata sınıfı başına hata sayısı")
+    response_bytes = _Family("cosa_api_response_bytes_total", "counter", "API yolu başına alınan yanıt baytı")
+    retries = _Family("cosa_journal_retries_total", "counter", "Çevrimdışı günlükten yeniden gönderilen komutlar")
+    pending = _Family("cosa_journal_pending", "gauge", "Gönderilmeyi bekleyen komutlar")
+    refresh = _Family("cosa_refresh_duration_seconds", "summary", "Coordinator yenileme süresi")
+    failed = _Family("cosa_refresh_failed_total", "counter", "Başarısız yenilemeler")
+    skipped = _Family("cosa_refresh_skipped_total", "counter", "Beklenen aralıkta gerçekleşmeyen yenilemeler")
+    last_success = _Family("cosa_refresh_last_success_timestamp_seconds", "gauge", "Son başarılı yenileme zamanı")
+    writes = _Family("cosa_state_writes_total", "counter", "Yazılan entity state'leri")
+    suppressed = _Family("cosa_state_writes_suppressed_total", "counter", "Değişiklik olmadığı için atlanan state yazımları")
+
+    for coordinator in coordinators:
+        endpoint = coordinator.endpoint_id
+        metrics = coordinator.metrics
+        stats = coordinator.api.stats
+
+        for method, method_stats in stats.methods.items():
+            cumulative = 0
+            for bound, count in zip((*METRICS_LATENCY_BUCKETS, "+Inf"), method_stats.buckets):
+                cumulative += count
+                latency.add(cumulative, "_bucket", endpoint=endpoint, method=method, le=bound)
+            latency.add(round(method_stats.total_time, 6), "_sum", endpoint=endpoint, method=method)
+            latency.add(method_stats.requests, "_count", endpoint=endpoint, method=method)
+            for error, count in method_stats.errors.items():
+                errors.add(count, endpoint=endpoint, method=method, error=error)
+        for path, sizes in stats.payload_sizes.items():
+            response_bytes.add(sizes["total"], endpoint=endpoint, path=path)
+
+        retries.add(coordinator.journal.retries, endpoint=endpoint)
+        pending.add(len(coordinator.journal), endpoint=endpoint)
+
+        for quantile in (0.5, 0.95):
+            value = percentile(metrics.durations, quantile)
+            if value is not None:
+                refresh.add(round(value, 6), endpoint=endpoint, quantile=quantile)
+        refresh.add(round(metrics.refresh_time_total, 6), "_sum", endpoint=endpoint)
+        refresh.add(metrics.refresh_count, "_count", endpoint=endpoint)
+        failed.add(metrics.failed, endpoint=endpoint)
+        skipped.add(metrics.skipped, endpoint=endpoint)
+        if metrics.last_success is not None:
+            last_success.add(metrics.last_success.timestamp(), endpoint=endpoint)
+        writes.add(sum(metrics.entity_writes.values()), endpoint=endpoint)
+        suppressed.add(metrics.suppressed_writes, endpoint=endpoint)
+
+    families = (
+        latency, errors, response_bytes, retries, pending,
+        refresh, failed, skipped, last_success, writes, suppressed,
+    )
+    return "\n".join(line for family in families for line in family.lines) + "\n"
+
+
+class CosaMetricsView(HomeAssistantView):
+    """Kimlik doğrulamalı Prometheus metrik uç noktası."""
+
+    url = METRICS_VIEW_URL
+    name = "api:cosa:metrics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        coordinators = [data["coordinator"] for data in self._hass.data.get(DOMAIN, {}).values()]
+        return web.Response(
+            body=render_metrics(coordinators).encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Görünümü bir kez kaydet (HA görünümleri kaldırılamaz)."""
+    if hass.data.get(_REGISTERED):
+        return
+    hass.http.register_view(CosaMetricsView(hass))
+    hass.data[_REGISTERED] = True
@@ -0,0 +1,85 @@
+"""COSA Rapor Yanıtı Akış Ayrıştırıcısı.
+
+Seri örnekleri gövde okunurken tek tek geri çağrıya verilir; bellek yerine
+CPU harcadığı için yalnızca REPORT_STREAM_THRESHOLD üstünde kullanılır.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Protocol
+
+import ijson
+
+SampleCallback = Callable[[dict[str, Any]], None]
+
+_SECTIONS = {"report.summary": "summary", "report.stats": "stats"}
+_SAMPLE_PREFIX = "report.data.item"
+_CONTAINER_START = ("start_map", "start_array")
+_CONTAINER_END = ("end_map", "end_array")
+
+
+class AsyncReader(Protocol):
+    async def read(self, n: int = -1) -> bytes: ...
+
+
+class CountingReader:
+    """Okunan bayt sayısını tutan akış sarmalayıcısı."""
+
+    def __init__(self, stream: AsyncReader) -> None:
+        self._stream = stream
+        self.size = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        chunk = await self._stream.read(n)
+        self.size += len(chunk)
+        return chunk
+
+
+async def parse_report(
+    stream: AsyncReader, on_sample: Optional[SampleCallback] = None
+) -> tuple[Any, dict[str, Any]]:
+    """Yanıttan (`ok`, report) döndür; seri örnekleri on_sample'a gider.
+
+    on_sample verilmezse örnekler report["data"] listesinde toplanır.
+    """
+    ok: Any = None
+    report: dict[str, Any] = {}
+    if on_sample is None:
+        samples: list[dict[str, Any]] = report.setdefault("data", [])
+        on_sample = samples.append
+
+    builder: Optional[ijson.ObjectBuilder] = None
+    section = ""
+    async for prefix, event, value in ijson.parse_async(stream, use_float=True):
+        if builder is None:
+            if event in _CONTAINER_START and (prefix in _SECTIONS or prefix == _SAMPLE_PREFIX):
+                section = prefix
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "ok":
+                ok = value
+            continue
+
+        builder.event(event, value)
+        if prefix == section and event in _CONTAINER_END:
+            if section == _SAMPLE_PREFIX:
+                on_sample(builder.value)
+            else:
+                report[_SECTIONS[section]] = builder.value
+            builder = None
+    return ok, report
+
+
+def split_report(
+    data: dict[str, Any], on_sample: Optional[SampleCallback] = None
+) -> tuple[Any, dict[str, Any]]:
+    """Bütün olarak çözülmüş yanıtı parse_report ile aynı biçimde döndür."""
+    raw = data.get("report") or {}
+    report = {name: raw[name] for name in _SECTIONS.values() if name in raw}
+    samples = raw.get("data") or []
+    if on_sample is None:
+        report["data"] = list(samples)
+    else:
+        for sample in samples:
+            on_sample(sample)
+    return data.get("ok"), report
@@ -0,0 +1,132 @@
+"""COSA Son Örnekler Halka Tamponu (O(1) pencere ortalaması ve sıcaklık eğimi)."""
+
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Optional
+
+from .const import RING_SIZE
+
+
+class CosaSampleRing:
+    """Endpoint başına son örnekler ve artımlı kayan istatistikler."""
+
+    __slots__ = (
+        "size",
+        "times",
+        "temperature",
+        "humidity",
+        "target",
+        "heating",
+        "_head",
+        "_count",
+        "_origin",
+        "_appends",
+        "_n",
+        "_sum_t",
+        "_sum_x",
+        "_sum_tt",
+        "_sum_tx",
+        "last_heating_start",
+        "_last_heating",
+    )
+
+    def __init__(self, size: int = RING_SIZE) -> None:
+        self.size = size
+        self.times = array("d", bytes(8 * size))
+        self.temperature = array("f", bytes(4 * size))
+        self.humidity = array("f", bytes(4 * size))
+        self.target = array("f", bytes(4 * size))
+        self.heating = array("b", bytes(size))
+        self._head = 0
+        self._count = 0
+        self._origin: Optional[float] = None
+        self._appends = 0
+        self._reset_sums()
+        self.last_heating_start: Optional[float] = None
+        self._last_heating: Optional[bool] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _reset_sums(self) -> None:
+        self._n = 0
+        self._sum_t = self._sum_x = self._sum_tt = self._sum_tx = 0.0
+
+    def _add(self, t: float, x: float, sign: int) -> None:
+        if math.isnan(x):
+            return
+        t -= self._origin
+        self._n += sign
+        self._sum_t += sign * t
+        self._sum_x += sign * x
+        self._sum_tt += sign * t * t
+        self._sum_tx += sign * t * x
+
+    def append(
+        self,
+        timestamp: float,
+        temperature: Optional[float],
+        humidity: Optional[float],
+        target: Optional[float],
+        heating: Optional[bool],
+    ) -> None:
+        """Yeni örneği ekle; doluysa en eskisini çıkar."""
+        if self._origin is None:
+            self._origin = timestamp
+        value = math.nan if temperature is None else float(temperature)
+        position = self._head
+        if self._count == self.size:
+            self._add(self.times[position], self.temperature[position], -1)
+        else:
+            self._count += 1
+
+        self.times[position] = timestamp
+        self.temperature[position] = value
+        self.humidity[position] = math.nan if humidity is None else float(humidity)
+        self.target[position] = math.nan if target is None else float(target)
+        self.heating[position] = -1 if heating is None else int(heating)
+        self._add(timestamp, self.temperature[position], 1)
+        self._head = (position + 1) % self.size
+
+        if heating and self._last_heating is False:
+            self.last_heating_start = timestamp
+        if heating is not None:
+            self._last_heating = heating
+
+        # Kayan nokta birikimini önlemek için toplamları arada bir baştan kur
+        self._appends += 1
+        if self._appends % self.size == 0:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._origin = self.times[self._head if self._count == self.size else 0]
+        self._reset_sums()
+        for index in range(self._count):
+            self._add(self.times[index], self.temperature[index], 1)
+
+    @property
+    def average_temperature(self) -> Optional[float]:
+        """Penceredeki ortalama sıcaklık."""
+        return self._sum_x / self._n if self._n else None
+
+    @property
+    def temperature_rate(self) -> Optional[float]:
+        """Sıcaklık değişim hızı (°C/saat, en küçük kareler eğimi)."""
+        if self._n < 2:
+            return None
+        denominator = self._n * self._sum_tt - self._sum_t ** 2
+        if denominator <= 0:
+            return None
+        slope = (self._n * self._sum_tx - self._sum_t * self._sum_x) / denominator
+        return slope * 3600
+
+    @property
+    def window_seconds(self) -> float:
+        """Penceredeki ilk ve son örnek arasındaki süre."""
+        if self._count < 2:
+            return 0.0
+        newest = self.times[(self._head - 1) % self.size]
+        oldest = self.times[self._head if self._count == self.size else 0]
+        return newest - oldest
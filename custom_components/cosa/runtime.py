@@ -0,0 +1,109 @@
+"""COSA Yerel Çalışma Süresi ve Enerji Sayacı.
+
+Coordinator'ın gördüğü her `combiState` geçişi zaman damgasıyla işlenir;
+kombi açıkken geçen süre ve (ayarlanmışsa) kombi gücüyle çarpılmış enerji
+artımlı olarak biriktirilir. Sayaçlar gecikmeli kayıtla diskte tutulur,
+yeniden başlatmalarda kaldığı yerden devam eder.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    RUNTIME_MAX_GAP,
+    RUNTIME_SAVE_DELAY,
+    RUNTIME_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def runtime_storage_key(entry_id: str) -> str:
+    """Config entry'ye ait sayaç dosyasının anahtarı."""
+    return f"{DOMAIN}.runtime.{entry_id}"
+
+
+class CosaRuntimeIntegrator:
+    """Kombi çalışma süresi (saniye) ve tahmini enerji (kWh) sayaçları.
+
+    İki örnek arasındaki süre, önceki örnekte kombi açıksa eklenir. Uzun
+    boşluklar (HA kapalıyken, bağlantı yokken) RUNTIME_MAX_GAP ile
+    sınırlanır; bilinmeyen süre sayılmaz.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(hass, RUNTIME_STORAGE_VERSION, runtime_storage_key(entry_id))
+        self.runtime_seconds = 0.0
+        self.energy_kwh = 0.0
+        self.starts = 0
+        self.last_on: Optional[float] = None
+        self.last_off: Optional[float] = None
+        self.power_kw = 0.0
+        self._heating: Optional[bool] = None
+        self._last_seen: Optional[float] = None
+
+    def _data(self) -> dict[str, Any]:
+        return {
+            "runtime_seconds": round(self.runtime_seconds, 1),
+            "energy_kwh": round(self.energy_kwh, 5),
+            "starts": self.starts,
+            "last_on": self.last_on,
+            "last_off": self.last_off,
+            "heating": self._heating,
+            "last_seen": self._last_seen,
+        }
+
+    async def async_load(self) -> None:
+        """Kayıtlı sayaçları diskten yükle."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self.runtime_seconds = data.get("runtime_seconds", 0.0)
+        self.energy_kwh = data.get("energy_kwh", 0.0)
+        self.starts = data.get("starts", 0)
+        self.last_on = data.get("last_on")
+        self.last_off = data.get("last_off")
+        self._heating = data.get("heating")
+        self._last_seen = data.get("last_seen")
+
+    def update(self, timestamp: float, heating: Optional[bool], power_kw: float) -> bool:
+        """Yeni örneği işle; sayaçlar değiştiyse True döner."""
+        if heating is None:
+            return False
+        self.power_kw = power_kw
+        changed = False
+        if self._heating and self._last_seen is not None:
+            elapsed = min(max(timestamp - self._last_seen, 0.0), RUNTIME_MAX_GAP)
+            if elapsed:
+                self.runtime_seconds += elapsed
+                self.energy_kwh += power_kw * elapsed / 3600
+                changed = True
+
+        if heating != self._heating:
+            if heating:
+                self.starts += 1
+                self.last_on = timestamp
+            elif self._heating is not None:
+                self.last_off = timestamp
+            _LOGGER.debug("🔥 Kombi %s (toplam %.2f saat)", "açıldı" if heating else "kapandı", self.runtime_hours)
+            self._heating = heating
+            changed = True
+        self._last_seen = timestamp
+
+        # Her örnekte değil, gecikmeli ve toplu kaydet
+        if changed:
+            self._store.async_delay_save(self._data, RUNTIME_SAVE_DELAY)
+        return changed
+
+    @property
+    def runtime_hours(self) -> float:
+        return self.runtime_seconds / 3600
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        return {**self._data(), "power_kw": self.power_kw}
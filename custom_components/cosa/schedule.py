@@ -0,0 +1,152 @@
+"""COSA Haftalık Program."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+from .const import OPTION_AWAY, OPTION_CUSTOM, OPTION_FROZEN, OPTION_HOME, OPTION_SLEEP
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# Slot = dakika * 8 + seçenek kodu; bir gün tek bir array('H') içinde tutulur
+OPTION_CODES = (OPTION_HOME, OPTION_SLEEP, OPTION_AWAY, OPTION_CUSTOM, OPTION_FROZEN)
+_OPTION_TO_CODE = {option: code for code, option in enumerate(OPTION_CODES)}
+_CODE_BITS = 3
+_CODE_MASK = (1 << _CODE_BITS) - 1
+
+MINUTES_PER_DAY = 24 * 60
+SECONDS_PER_WEEK = 7 * MINUTES_PER_DAY * 60
+
+
+class CosaScheduleError(ValueError):
+    """Geçersiz program verisi."""
+
+
+def _parse_minute(slot: dict[str, Any]) -> int:
+    """Slot başlangıcını gün içi dakikaya çevir."""
+    value = slot.get("start", slot.get("time"))
+    if isinstance(value, str):
+        try:
+            hour, minute = value.split(":")[:2]
+            minutes = int(hour) * 60 + int(minute)
+        except ValueError as err:
+            raise CosaScheduleError(f"Geçersiz saat: {value}") from err
+    elif isinstance(value, int):
+        minutes = value
+    elif "hour" in slot:
+        minutes = int(slot["hour"]) * 60 + int(slot.get("minute", 0))
+    else:
+        raise CosaScheduleError(f"Slot başlangıcı yok: {slot}")
+    if not 0 <= minutes < MINUTES_PER_DAY:
+        raise CosaScheduleError(f"Geçersiz saat: {value}")
+    return minutes
+
+
+def _pack_day(slots: Iterable[dict[str, Any]]) -> array:
+    packed = []
+    for slot in slots:
+        option = slot.get("option", slot.get("mode"))
+        if option not in _OPTION_TO_CODE:
+            raise CosaScheduleError(f"Geçersiz seçenek: {option}")
+        packed.append(_parse_minute(slot) << _CODE_BITS | _OPTION_TO_CODE[option])
+    return array("H", sorted(packed))
+
+
+class CosaSchedule:
+    """Haftalık programın sıkıştırılmış gösterimi (gün başına slot dizisi)."""
+
+    __slots__ = ("days", "_index")
+
+    def __init__(self, days: tuple[array, ...]) -> None:
+        if len(days) != len(WEEKDAYS):
+            raise CosaScheduleError("Program 7 gün içermeli")
+        self.days = days
+        self._index: Optional[CosaScheduleIndex] = None
+
+    @property
+    def index(self) -> CosaScheduleIndex:
+        """Geçiş dizini; program başına bir kez hesaplanır."""
+        if self._index is None:
+            self._index = CosaScheduleIndex(self)
+        return self._index
+
+    @classmethod
+    def from_api(cls, raw: Any) -> Optional[CosaSchedule]:
+        """API verisinden oluştur. Gün adı sözlüğü veya 7 elemanlı liste kabul edilir."""
+        if not raw:
+            return None
+        if isinstance(raw, dict):
+            return cls(tuple(_pack_day(raw.get(day) or []) for day in WEEKDAYS))
+        if isinstance(raw, list) and len(raw) == len(WEEKDAYS):
+            return cls(tuple(_pack_day(day or []) for day in raw))
+        raise CosaScheduleError("Tanınmayan program formatı")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CosaSchedule) and self.days == other.days
+
+    def slots(self, day: int) -> list[tuple[int, str]]:
+        """Günün (dakika, seçenek) slotları."""
+        return [(value >> _CODE_BITS, OPTION_CODES[value & _CODE_MASK]) for value in self.days[day]]
+
+    def day_to_api(self, day: int) -> list[dict[str, str]]:
+        return [
+            {"start": f"{minute // 60:02d}:{minute % 60:02d}", "option": option}
+            for minute, option in self.slots(day)
+        ]
+
+    def to_api(self, days: Optional[Iterable[int]] = None) -> dict[str, list[dict[str, str]]]:
+        """API formatına çevir; days verilirse yalnızca o günler."""
+        selected = range(len(WEEKDAYS)) if days is None else days
+        return {WEEKDAYS[day]: self.day_to_api(day) for day in selected}
+
+    def replace_days(self, raw_days: dict[str, Any]) -> CosaSchedule:
+        """Verilen günleri değiştirilmiş yeni program döndür."""
+        days = list(self.days)
+        for name, slots in raw_days.items():
+            if name not in WEEKDAYS:
+                raise CosaScheduleError(f"Geçersiz gün: {name}")
+            days[WEEKDAYS.index(name)] = _pack_day(slots or [])
+        return CosaSchedule(tuple(days))
+
+    def changed_days(self, other: Optional[CosaSchedule]) -> list[int]:
+        """other'a göre farklı olan günlerin indeksleri."""
+        if other is None:
+            return list(range(len(WEEKDAYS)))
+        return [day for day in range(len(WEEKDAYS)) if self.days[day] != other.days[day]]
+
+    @classmethod
+    def empty(cls) -> CosaSchedule:
+        return cls(tuple(array("H") for _ in WEEKDAYS))
+
+
+class CosaScheduleIndex:
+    """Program geçişlerinin hafta başından itibaren saniye cinsinden sıralı dizini."""
+
+    __slots__ = ("_events",)
+
+    def __init__(self, schedule: CosaSchedule) -> None:
+        self._events = array("I", sorted(
+            day * MINUTES_PER_DAY * 60 + (value >> _CODE_BITS) * 60
+            for day, slots in enumerate(schedule.days)
+            for value in slots
+        ))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def next_transition(self, now: datetime) -> Optional[datetime]:
+        """now'dan sonraki ilk geçiş zamanı."""
+        if not self._events:
+            return None
+        now = now.replace(microsecond=0)
+        second_of_week = now.weekday() * MINUTES_PER_DAY * 60 + now.hour * 3600 + now.minute * 60 + now.second
+        position = bisect_right(self._events, second_of_week)
+        if position < len(self._events):
+            delta = self._events[position] - second_of_week
+        else:
+            # Hafta sonuna gelindi, bir sonraki haftanın ilk geçişi
+            delta = self._events[0] + SECONDS_PER_WEEK - second_of_week
+        return now + timedelta(seconds=delta)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,15 +16,27 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
     UnitOfElectricPotential,
+    UnitOfEnergy,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import DOMAIN, BATTERY_LEVELS, WEATHER_ICONS, WEATHER_TRANSLATIONS
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_started
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CONF_DEADBAND_PREFIX,
+    SENSOR_DEADBANDS,
+    SENSOR_HEARTBEAT_INTERVAL,
+    SENSOR_MIN_PUBLISH_INTERVAL,
+)
+from .entity import CosaEntity
+from .metrics import percentile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +49,7 @@ async def async_setup_entry(
     """Sensor platformunu kur."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     
+    # Kritik yol: canlı termostat verisi
     entities = [
         CosaTemperatureSensor(coordinator, config_entry),
         CosaHumiditySensor(coordinator, config_entry),
@@ -45,10 +60,28 @@ async def async_setup_entry(
         CosaCombiStateSensor(coordinator, config_entry),
         CosaModeSensor(coordinator, config_entry),
         CosaOptionSensor(coordinator, config_entry),
+        CosaFirmwareVersionSensor(coordinator, config_entry),
+        # Eğilim Sensörleri (bellekteki son örnekler)
+        CosaTemperatureTrendSensor(coordinator, config_entry),
+        CosaTemperatureAverageSensor(coordinator, config_entry),
+        CosaLastHeatingStartSensor(coordinator, config_entry),
+        # Yerel Çalışma Süresi / Enerji Sayaçları
+        CosaBoilerRuntimeSensor(coordinator, config_entry),
+        CosaBoilerEnergySensor(coordinator, config_entry),
+        # Tanı Sensörleri (veri tazeliği)
+        CosaLastRefreshSensor(coordinator, config_entry),
+        CosaRefreshDurationSensor(coordinator, config_entry, 0.5),
+        CosaRefreshDurationSensor(coordinator, config_entry, 0.95),
+        CosaWriteDelaySensor(coordinator, config_entry),
+        CosaFailedRefreshSensor(coordinator, config_entry),
+        CosaSkippedRefreshSensor(coordinator, config_entry),
+    ]
+    
+    # Hava durumu ve rapor sensörleri HA başladıktan sonra eklenir
+    deferred = [
         CosaOutdoorTemperatureSensor(coordinator, config_entry),
         CosaOutdoorHumiditySensor(coordinator, config_entry),
         CosaWeatherSensor(coordinator, config_entry),
-        CosaFirmwareVersionSensor(coordinator, config_entry),
         # Rapor Sensörleri
         CosaTotalRuntimeSensor(coordinator, config_entry),
         CosaHomeRuntimeSensor(coordinator, config_entry),
@@ -60,41 +93,100 @@ async def async_setup_entry(
         CosaMinHumiditySensor(coordinator, config_entry),
         CosaOutdoorAverageTemperatureSensor(coordinator, config_entry),
         CosaNetworkQualitySensor(coordinator, config_entry),
+        # Analitik Sensörleri (yerel geçmiş, son 7 gün)
+        CosaDutyCycleSensor(coordinator, config_entry),
+        CosaHeatingDegreeHoursSensor(coordinator, config_entry),
+        CosaHeatingRuntimeSensor(coordinator, config_entry),
+        CosaOvershootSensor(coordinator, config_entry),
+        CosaUndershootSensor(coordinator, config_entry),
     ]
     
     async_add_entities(entities)
+    
+    @callback
+    def _async_add_deferred(_hass: HomeAssistant) -> None:
+        async_add_entities(deferred)
+    
+    config_entry.async_on_unload(async_at_started(hass, _async_add_deferred))
 
 
-class CosaBaseSensor(CoordinatorEntity, SensorEntity):
+class CosaBaseSensor(CosaEntity, SensorEntity):
     """COSA Base Sensor."""
 
-    _attr_has_entity_name = True
-
     def __init__(self, coordinator, config_entry: ConfigEntry, key: str, name: str) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, config_entry)
         self._key = key
         self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{key}"
         self._attr_name = name
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-        )
+        self._entry = config_entry
+        self._published: Any = None
+        self._published_at: float | None = None
 
     @property
-    def _endpoint(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("endpoint", {})
-        return {}
+    def _deadband(self) -> float | None:
+        """Ölü bant: yalnızca anlamlı değişimler recorder'a yazılır (seçeneklerden ezilebilir)."""
+        default = SENSOR_DEADBANDS.get(self._key)
+        if default is None:
+            return None
+        return self._entry.options.get(f"{CONF_DEADBAND_PREFIX}{self._key}", default)
+
+    def _should_publish(self, value: Any) -> bool:
+        """Değer ölü bandın dışına çıktı mı veya heartbeat zamanı geldi mi."""
+        if self._published_at is None:
+            return True
+        elapsed = time.monotonic() - self._published_at
+        # Bant içinde kalan değer de en geç heartbeat aralığında yeniden yazılır
+        if elapsed >= SENSOR_HEARTBEAT_INTERVAL:
+            return True
+        if value == self._published:
+            return False
+        if value is None or self._published is None:
+            return True
+        deadband = self._deadband
+        if not deadband:
+            # Ölü bant 0: her değişim beklemeden yazılır
+            return True
+        return (
+            elapsed >= SENSOR_MIN_PUBLISH_INTERVAL
+            and abs(value - self._published) >= deadband
+        )
 
-    @property
-    def _forecast(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("forecast", {})
-        return {}
+    def _publish(self) -> None:
+        self._published = self.native_value
+        self._published_at = time.monotonic()
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._deadband is not None:
+            # Yenileme gelmese de (ör. yavaş program aralığı) heartbeat zamanında yaz
+            self.async_on_remove(async_track_time_interval(
+                self.hass, self._async_heartbeat, timedelta(seconds=SENSOR_HEARTBEAT_INTERVAL)
+            ))
+
+    @callback
+    def _async_heartbeat(self, _now: datetime) -> None:
+        if (
+            self._published_at is not None
+            and time.monotonic() - self._published_at >= SENSOR_HEARTBEAT_INTERVAL
+        ):
+            self._publish()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._deadband is None:
+            super()._handle_coordinator_update()
+            return
+        if self._availability_changed() or self._should_publish(self.native_value):
+            self._publish()
+        else:
+            self.coordinator.metrics.write_suppressed()
 
 
 class CosaTemperatureSensor(CosaBaseSensor):
     """Oda Sıcaklığı Sensörü."""
 
+    _snapshot_fields = ("temperature",)
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -104,12 +196,13 @@ class CosaTemperatureSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._endpoint.get("temperature")
+        return self._snapshot.temperature
 
 
 class CosaHumiditySensor(CosaBaseSensor):
     """Nem Sensörü."""
 
+    _snapshot_fields = ("humidity",)
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -119,12 +212,13 @@ class CosaHumiditySensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._endpoint.get("humidity")
+        return self._snapshot.humidity
 
 
 class CosaTargetTemperatureSensor(CosaBaseSensor):
     """Hedef Sıcaklık Sensörü."""
 
+    _snapshot_fields = ("raw_target_temperature",)
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -134,12 +228,13 @@ class CosaTargetTemperatureSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._endpoint.get("targetTemperature")
+        return self._snapshot.raw_target_temperature
 
 
 class CosaBatteryVoltageSensor(CosaBaseSensor):
     """Pil Voltajı Sensörü."""
 
+    _snapshot_fields = ("battery_voltage",)
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
@@ -149,12 +244,13 @@ class CosaBatteryVoltageSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._endpoint.get("batteryVoltage")
+        return self._snapshot.battery_voltage
 
 
 class CosaBatteryPercentSensor(CosaBaseSensor):
     """Pil Yüzdesi Sensörü."""
 
+    _snapshot_fields = ("battery_percent",)
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -164,13 +260,13 @@ class CosaBatteryPercentSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> int | None:
-        power_state = self._endpoint.get("powerState", "")
-        return BATTERY_LEVELS.get(power_state, 0)
+        return self._snapshot.battery_percent
 
 
 class CosaRssiSensor(CosaBaseSensor):
     """Sinyal Gücü Sensörü."""
 
+    _snapshot_fields = ("rssi",)
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
@@ -181,12 +277,13 @@ class CosaRssiSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> int | None:
-        return self._endpoint.get("rssi")
+        return self._snapshot.rssi
 
 
 class CosaCombiStateSensor(CosaBaseSensor):
     """Kombi Durumu Sensörü."""
 
+    _snapshot_fields = ("combi_state_name",)
     _attr_icon = "mdi:fire"
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
@@ -194,17 +291,13 @@ class CosaCombiStateSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        state = self._endpoint.get("combiState")
-        if state == "on":
-            return "Açık"
-        elif state == "off":
-            return "Kapalı"
-        return state
+        return self._snapshot.combi_state_name
 
 
 class CosaModeSensor(CosaBaseSensor):
     """Mod Sensörü."""
 
+    _snapshot_fields = ("mode_name",)
     _attr_icon = "mdi:thermostat"
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
@@ -212,18 +305,13 @@ class CosaModeSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        mode = self._endpoint.get("mode")
-        mode_names = {
-            "manual": "Manuel",
-            "auto": "Otomatik",
-            "schedule": "Haftalık",
-        }
-        return mode_names.get(mode, mode)
+        return self._snapshot.mode_name
 
 
 class CosaOptionSensor(CosaBaseSensor):
     """Seçenek Sensörü."""
 
+    _snapshot_fields = ("option_name",)
     _attr_icon = "mdi:home-thermometer"
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
@@ -231,20 +319,13 @@ class CosaOptionSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        option = self._endpoint.get("option")
-        option_names = {
-            "home": "Evde",
-            "away": "Dışarı",
-            "sleep": "Uyku",
-            "custom": "Manuel",
-            "frozen": "Donma Koruma",
-        }
-        return option_names.get(option, option)
+        return self._snapshot.option_name
 
 
 class CosaOutdoorTemperatureSensor(CosaBaseSensor):
     """Dış Sıcaklık Sensörü."""
 
+    _snapshot_fields = ("outdoor_temperature",)
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -254,15 +335,13 @@ class CosaOutdoorTemperatureSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        hourly = self._forecast.get("hourly", [])
-        if hourly:
-            return hourly[0].get("temperature")
-        return None
+        return self._snapshot.outdoor_temperature
 
 
 class CosaOutdoorHumiditySensor(CosaBaseSensor):
     """Dış Nem Sensörü."""
 
+    _snapshot_fields = ("outdoor_humidity",)
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -272,15 +351,13 @@ class CosaOutdoorHumiditySensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        hourly = self._forecast.get("hourly", [])
-        if hourly:
-            return hourly[0].get("humidity")
-        return None
+        return self._snapshot.outdoor_humidity
 
 
 class CosaWeatherSensor(CosaBaseSensor):
     """Hava Durumu Sensörü."""
 
+    _snapshot_fields = ("weather_name", "weather_icon", "weather_ha_icon")
     _attr_icon = "mdi:weather-partly-cloudy"
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
@@ -288,29 +365,25 @@ class CosaWeatherSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        hourly = self._forecast.get("hourly", [])
-        if hourly:
-            icon = hourly[0].get("icon", "")
-            # Türkçe çeviri döndür
-            return WEATHER_TRANSLATIONS.get(icon, icon)
-        return None
+        # Türkçe çeviri
+        return self._snapshot.weather_name
 
     @property
     def extra_state_attributes(self) -> dict:
         """Ekstra özellikler."""
-        hourly = self._forecast.get("hourly", [])
-        if hourly:
-            icon = hourly[0].get("icon", "")
-            return {
-                "icon_key": icon,
-                "ha_icon": WEATHER_ICONS.get(icon, icon),
-            }
-        return {}
+        snapshot = self._snapshot
+        if snapshot.weather_icon is None:
+            return {}
+        return {
+            "icon_key": snapshot.weather_icon,
+            "ha_icon": snapshot.weather_ha_icon,
+        }
 
 
 class CosaFirmwareVersionSensor(CosaBaseSensor):
     """Firmware Versiyonu Sensörü."""
 
+    _snapshot_fields = ("firmware_version",)
     _attr_icon = "mdi:chip"
     _attr_entity_registry_enabled_default = False
 
@@ -319,8 +392,7 @@ class CosaFirmwareVersionSensor(CosaBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        device = self._endpoint.get("device", {})
-        return device.get("version")
+        return self._snapshot.firmware_version
 
 
 # ===== RAPOR SENSÖRLERİ =====
@@ -328,24 +400,11 @@ class CosaFirmwareVersionSensor(CosaBaseSensor):
 class CosaReportBaseSensor(CosaBaseSensor):
     """COSA Rapor Base Sensor."""
 
-    @property
-    def _reports(self) -> dict:
-        if self.coordinator.data:
-            return self.coordinator.data.get("reports", {})
-        return {}
-
-    @property
-    def _stats(self) -> dict:
-        return self._reports.get("stats", {})
-
-    @property
-    def _summary(self) -> dict:
-        return self._reports.get("summary", {})
-
 
 class CosaTotalRuntimeSensor(CosaReportBaseSensor):
     """Toplam Çalışma Süresi Sensörü (Son 24 Saat)."""
 
+    _snapshot_fields = ("runtime_hours", "runtimes")
     _attr_icon = "mdi:clock-outline"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "h"
@@ -355,28 +414,26 @@ class CosaTotalRuntimeSensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        runtimes = self._summary.get("runtimes", {})
-        total_seconds = runtimes.get("total")
-        if total_seconds is None:
-            return None
-        return round(total_seconds / 3600, 2)
+        return self._snapshot.runtime_hours["total"]
 
     @property
     def extra_state_attributes(self) -> dict:
-        runtimes = self._summary.get("runtimes", {})
+        snapshot = self._snapshot
+        hours = snapshot.runtime_hours
         return {
-            "evde_saat": round(runtimes.get("home", 0) / 3600, 2),
-            "uyku_saat": round(runtimes.get("sleep", 0) / 3600, 2),
-            "disari_saat": round(runtimes.get("away", 0) / 3600, 2),
-            "manuel_saat": round(runtimes.get("custom", 0) / 3600, 2),
-            "donma_koruma_saat": round(runtimes.get("frozen", 0) / 3600, 2),
-            "toplam_saniye": runtimes.get("total", 0),
+            "evde_saat": hours["home"] or 0.0,
+            "uyku_saat": hours["sleep"] or 0.0,
+            "disari_saat": hours["away"] or 0.0,
+            "manuel_saat": hours["custom"] or 0.0,
+            "donma_koruma_saat": hours["frozen"] or 0.0,
+            "toplam_saniye": snapshot.runtimes.get("total", 0),
         }
 
 
 class CosaHomeRuntimeSensor(CosaReportBaseSensor):
     """Evde Modu Çalışma Süresi (Son 24 Saat)."""
 
+    _snapshot_fields = ("runtime_hours",)
     _attr_icon = "mdi:home-clock"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "h"
@@ -386,16 +443,13 @@ class CosaHomeRuntimeSensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        runtimes = self._summary.get("runtimes", {})
-        seconds = runtimes.get("home")
-        if seconds is None:
-            return None
-        return round(seconds / 3600, 2)
+        return self._snapshot.runtime_hours["home"]
 
 
 class CosaSleepRuntimeSensor(CosaReportBaseSensor):
     """Uyku Modu Çalışma Süresi (Son 24 Saat)."""
 
+    _snapshot_fields = ("runtime_hours",)
     _attr_icon = "mdi:bed-clock"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "h"
@@ -405,16 +459,13 @@ class CosaSleepRuntimeSensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        runtimes = self._summary.get("runtimes", {})
-        seconds = runtimes.get("sleep")
-        if seconds is None:
-            return None
-        return round(seconds / 3600, 2)
+        return self._snapshot.runtime_hours["sleep"]
 
 
 class CosaAverageTemperatureSensor(CosaReportBaseSensor):
     """Ortalama Sıcaklık Sensörü (Son 24 Saat)."""
 
+    _snapshot_fields = ("average_temperatures",)
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -425,12 +476,11 @@ class CosaAverageTemperatureSensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        avg_temps = self._summary.get("averageTemperatures", {})
-        return avg_temps.get("total")
+        return self._snapshot.average_temperatures.get("total")
 
     @property
     def extra_state_attributes(self) -> dict:
-        avg_temps = self._summary.get("averageTemperatures", {})
+        avg_temps = self._snapshot.average_temperatures
         return {
             "evde_ortalama": avg_temps.get("home"),
             "uyku_ortalama": avg_temps.get("sleep"),
@@ -442,6 +492,7 @@ class CosaAverageTemperatureSensor(CosaReportBaseSensor):
 class CosaMaxTemperatureSensor(CosaReportBaseSensor):
     """Maksimum Sıcaklık Sensörü (Son 24 Saat)."""
 
+    _snapshot_fields = ("max_temperature",)
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -451,12 +502,13 @@ class CosaMaxTemperatureSensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._stats.get("maxTemperature")
+        return self._snapshot.max_temperature
 
 
 class CosaMinTemperatureSensor(CosaReportBaseSensor):
     """Minimum Sıcaklık Sensörü (Son 24 Saat)."""
 
+    _snapshot_fields = ("min_temperature",)
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -466,12 +518,13 @@ class CosaMinTemperatureSensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._stats.get("minTemperature")
+        return self._snapshot.min_temperature
 
 
 class CosaMaxHumiditySensor(CosaReportBaseSensor):
     """Maksimum Nem Sensörü (Son 24 Saat)."""
 
+    _snapshot_fields = ("max_humidity",)
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -481,12 +534,13 @@ class CosaMaxHumiditySensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._stats.get("maxHumidity")
+        return self._snapshot.max_humidity
 
 
 class CosaMinHumiditySensor(CosaReportBaseSensor):
     """Minimum Nem Sensörü (Son 24 Saat)."""
 
+    _snapshot_fields = ("min_humidity",)
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -496,12 +550,13 @@ class CosaMinHumiditySensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        return self._stats.get("minHumidity")
+        return self._snapshot.min_humidity
 
 
 class CosaOutdoorAverageTemperatureSensor(CosaReportBaseSensor):
     """Dış Ortam Ortalama Sıcaklık (Son 24 Saat)."""
 
+    _snapshot_fields = ("place_average_temperature",)
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -512,13 +567,13 @@ class CosaOutdoorAverageTemperatureSensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> float | None:
-        avg = self._stats.get("placeAverageTemperature")
-        return round(avg, 1) if avg else None
+        return self._snapshot.place_average_temperature
 
 
 class CosaNetworkQualitySensor(CosaReportBaseSensor):
     """Ağ Kalitesi Sensörü."""
 
+    _snapshot_fields = ("network_quality", "network_quality_name", "offline_for")
     _attr_icon = "mdi:wifi"
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
@@ -526,21 +581,363 @@ class CosaNetworkQualitySensor(CosaReportBaseSensor):
 
     @property
     def native_value(self) -> str | None:
-        quality = self._stats.get("networkQuality")
-        if quality is None:
-            return None
-        quality_names = {
-            0: "Çok Zayıf",
-            1: "Zayıf", 
-            2: "Orta",
-            3: "İyi",
-            4: "Çok İyi",
+        return self._snapshot.network_quality_name
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "quality_level": snapshot.network_quality,
+            "offline_seconds": snapshot.offline_for,
         }
-        return quality_names.get(quality, f"Seviye {quality}")
+
+
+# ===== EĞİLİM SENSÖRLERİ =====
+
+class CosaTemperatureTrendSensor(CosaBaseSensor):
+    """Sıcaklık Değişim Hızı (son örnekler üzerinden eğim)."""
+
+    _attr_icon = "mdi:chart-line-variant"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "°C/h"
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "temperature_trend", "Sıcaklık Değişim Hızı")
+
+    @property
+    def native_value(self) -> float | None:
+        rate = self.coordinator.ring.temperature_rate
+        return None if rate is None else round(rate, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        ring = self.coordinator.ring
+        return {"samples": len(ring), "window_minutes": round(ring.window_seconds / 60, 1)}
+
+
+class CosaTemperatureAverageSensor(CosaBaseSensor):
+    """Kısa Pencere Ortalama Sıcaklık."""
+
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "temperature_average", "Ortalama Sıcaklık (kısa)")
+
+    @property
+    def native_value(self) -> float | None:
+        average = self.coordinator.ring.average_temperature
+        return None if average is None else round(average, 2)
+
+
+class CosaLastHeatingStartSensor(CosaBaseSensor):
+    """Son Isıtma Başlangıcı."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:fire-alert"
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "last_heating_start", "Son Isıtma Başlangıcı")
+        self._written: float | None = None
+
+    @property
+    def native_value(self) -> datetime | None:
+        started = self.coordinator.ring.last_heating_start
+        return None if started is None else dt_util.utc_from_timestamp(started)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        started = self.coordinator.ring.last_heating_start
+        if self._availability_changed() or started != self._written:
+            self._written = started
+            self.async_write_ha_state()
+        else:
+            self.coordinator.metrics.write_suppressed()
+
+
+# ===== ÇALIŞMA SÜRESİ / ENERJİ SENSÖRLERİ =====
+
+class CosaBoilerRuntimeSensor(CosaBaseSensor):
+    """Kombi Toplam Çalışma Süresi (yerel sayaç)."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "boiler_runtime", "Kombi Çalışma Süresi")
+
+    @property
+    def native_value(self) -> float:
+        return round(self.coordinator.runtime.runtime_hours, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        runtime = self.coordinator.runtime
+        return {
+            "starts": runtime.starts,
+            "last_on": None if runtime.last_on is None else dt_util.utc_from_timestamp(runtime.last_on),
+            "last_off": None if runtime.last_off is None else dt_util.utc_from_timestamp(runtime.last_off),
+        }
+
+
+class CosaBoilerEnergySensor(CosaBaseSensor):
+    """Kombi Tahmini Enerji (çalışma süresi x kombi gücü)."""
+
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "boiler_energy", "Kombi Enerjisi")
+
+    @property
+    def available(self) -> bool:
+        # Kombi gücü seçeneklerden girilmediyse tahmin yapılamaz
+        return super().available and self.coordinator.runtime.power_kw > 0
+
+    @property
+    def native_value(self) -> float:
+        return round(self.coordinator.runtime.energy_kwh, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {"boiler_power": self.coordinator.runtime.power_kw}
+
+
+# ===== ANALİTİK SENSÖRLERİ =====
+
+class CosaAnalyticsBaseSensor(CosaBaseSensor):
+    """Yerel geçmişten hesaplanan metrikler; yalnızca yeniden hesaplanınca yazılır."""
+
+    def __init__(self, coordinator, config_entry: ConfigEntry, key: str, name: str) -> None:
+        super().__init__(coordinator, config_entry, key, name)
+        self._written_analytics: dict[str, Any] | None = None
+
+    @property
+    def _analytics(self) -> dict[str, Any]:
+        return (self.coordinator.data or {}).get("analytics") or {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        analytics = (self.coordinator.data or {}).get("analytics")
+        if self._availability_changed() or analytics is not self._written_analytics:
+            self._written_analytics = analytics
+            self.async_write_ha_state()
+        else:
+            self.coordinator.metrics.write_suppressed()
+
+
+class CosaDutyCycleSensor(CosaAnalyticsBaseSensor):
+    """Kombi Çalışma Oranı (son tamamlanan saat)."""
+
+    _attr_icon = "mdi:percent-circle-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "duty_cycle", "Kombi Çalışma Oranı")
+
+    @property
+    def native_value(self) -> float | None:
+        return self._analytics.get("duty_cycle_last_hour")
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {"ortalama_7g": self._analytics.get("duty_cycle_average")}
+
+
+class CosaHeatingDegreeHoursSensor(CosaAnalyticsBaseSensor):
+    """Isıtma Derece-Saati (son 7 gün, dış sıcaklığa göre)."""
+
+    _attr_icon = "mdi:thermometer-chevron-down"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "°C·h"
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "heating_degree_hours", "Isıtma Derece-Saat (7g)")
+
+    @property
+    def native_value(self) -> float | None:
+        return self._analytics.get("heating_degree_hours")
 
     @property
     def extra_state_attributes(self) -> dict:
+        return {"derece_saat_basina_calisma": self._analytics.get("heating_hours_per_degree_hour")}
+
+
+class CosaHeatingRuntimeSensor(CosaAnalyticsBaseSensor):
+    """Isıtma Süresi (son 7 gün) ve seçenek başına dağılımı."""
+
+    _attr_icon = "mdi:fire-circle"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "h"
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "heating_runtime_7d", "Isıtma Süresi (7g)")
+
+    @property
+    def native_value(self) -> float | None:
+        return self._analytics.get("heating_hours")
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {f"{option}_saat": hours for option, hours in self._analytics.get("runtime_per_option", {}).items()}
+
+
+class CosaOvershootSensor(CosaAnalyticsBaseSensor):
+    """Hedef Aşımı (son 7 gün ortalaması)."""
+
+    _attr_icon = "mdi:thermometer-chevron-up"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "overshoot", "Hedef Aşımı (7g)")
+
+    @property
+    def native_value(self) -> float | None:
+        return self._analytics.get("overshoot")
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {"en_yuksek": self._analytics.get("overshoot_max")}
+
+
+class CosaUndershootSensor(CosaAnalyticsBaseSensor):
+    """Hedefin Altında Kalma (son 7 gün ortalaması)."""
+
+    _attr_icon = "mdi:thermometer-chevron-down"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "undershoot", "Hedef Altı (7g)")
+
+    @property
+    def native_value(self) -> float | None:
+        return self._analytics.get("undershoot")
+
+
+# ===== TANI SENSÖRLERİ =====
+
+class CosaMetricsBaseSensor(CosaBaseSensor):
+    """Veri tazeliği metrikleri; yenileme başarısız olsa da erişilebilir kalır."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def _metrics(self):
+        return self.coordinator.metrics
+
+
+class CosaLastRefreshSensor(CosaMetricsBaseSensor):
+    """Son Başarılı Yenileme Sensörü."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:update"
+    # Her poll'da değişir; recorder'a satır yazmaması için varsayılan kapalı
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"age_seconds"})
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "last_refresh", "Son Başarılı Yenileme")
+        self._written: Any = None
+
+    @property
+    def native_value(self):
+        return self._metrics.last_success
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Yalnızca gerçek (başarılı) yenilemede yaz; başarısız tur yaşı güncellemez
+        last_success = self._metrics.last_success
+        if last_success != self._written:
+            self._written = last_success
+            self.async_write_ha_state()
+        else:
+            self.coordinator.metrics.write_suppressed()
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        age = self._metrics.last_success_age
+        return {"age_seconds": None if age is None else round(age, 1)}
+
+
+class CosaRefreshDurationSensor(CosaMetricsBaseSensor):
+    """Yenileme Süresi Yüzdelik Sensörü."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, config_entry: ConfigEntry, quantile: float) -> None:
+        label = f"p{int(quantile * 100)}"
+        super().__init__(coordinator, config_entry, f"refresh_duration_{label}", f"Yenileme Süresi {label}")
+        self._quantile = quantile
+
+    @property
+    def native_value(self) -> float | None:
+        value = percentile(self._metrics.durations, self._quantile)
+        return None if value is None else round(value * 1000)
+
+
+class CosaWriteDelaySensor(CosaMetricsBaseSensor):
+    """API Yanıtı → State Yazımı Gecikmesi (bir önceki yenileme)."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-sand"
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "write_delay", "Yanıt→Yazım Gecikmesi")
+
+    @property
+    def native_value(self) -> float | None:
+        delays = self._metrics.write_delays
+        return round(delays[-1] * 1000, 1) if delays else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        delays = self._metrics.write_delays
         return {
-            "quality_level": self._stats.get("networkQuality"),
-            "offline_seconds": self._stats.get("offlineFor", 0),
+            f"p{int(quantile * 100)}": round(value * 1000, 1)
+            for quantile in (0.5, 0.95)
+            if (value := percentile(delays, quantile)) is not None
         }
+
+
+class CosaFailedRefreshSensor(CosaMetricsBaseSensor):
+    """Başarısız Yenileme Sayacı."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:alert-circle-outline"
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "failed_refreshes", "Başarısız Yenileme")
+
+    @property
+    def native_value(self) -> int:
+        return self._metrics.failed
+
+
+class CosaSkippedRefreshSensor(CosaMetricsBaseSensor):
+    """Atlanan Yenileme Sayacı (beklenen aralıkta gerçekleşmeyen tick'ler)."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:debug-step-over"
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry, "skipped_refreshes", "Atlanan Yenileme")
+
+    @property
+    def native_value(self) -> int:
+        return self._metrics.skipped
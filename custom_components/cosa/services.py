@@ -0,0 +1,325 @@
+"""COSA Servisleri."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+import voluptuous as vol
+
+from homeassistant.const import CONF_EMAIL
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import CosaAPIError
+from .const import (
+    DOMAIN,
+    FLEET_MAX_CONCURRENCY,
+    FLEET_MIN_REQUEST_INTERVAL,
+    FLEET_REFRESH_DELAY,
+    HISTORY_DEFAULT_BUCKET,
+    HISTORY_DEFAULT_RANGE,
+    MAX_TEMP,
+    MIN_TEMP,
+    MODE_AUTO,
+    MODE_MANUAL,
+    MODE_SCHEDULE,
+    OPTION_AWAY,
+    OPTION_CUSTOM,
+    OPTION_FROZEN,
+    OPTION_HOME,
+    OPTION_SLEEP,
+)
+from .journal import CosaWriteResult
+from .schedule import WEEKDAYS, CosaScheduleError
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY_TO_FLEET = "apply_to_fleet"
+# Hesap (e-posta) başına, çağrılar arasında paylaşılan istek bütçeleri
+_BUDGETS = f"{DOMAIN}_fleet_budgets"
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_GET_SCHEDULE = "get_schedule"
+SERVICE_SET_SCHEDULE = "set_schedule"
+
+ATTR_ENDPOINT_ID = "endpoint_id"
+ATTR_ENDPOINT_IDS = "endpoint_ids"
+ATTR_SCHEDULE = "schedule"
+ATTR_MODE = "mode"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_BUCKET = "bucket"
+ATTR_OPTION = "option"
+
+# Servis alanı -> API preset anahtarı
+TEMPERATURE_FIELDS = {
+    "home_temperature": "home",
+    "away_temperature": "away",
+    "sleep_temperature": "sleep",
+    "custom_temperature": "custom",
+}
+
+_TEMPERATURE = vol.All(vol.Coerce(float), vol.Range(min=MIN_TEMP, max=MAX_TEMP))
+
+APPLY_TO_FLEET_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ENDPOINT_IDS): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_MODE): vol.In([MODE_MANUAL, MODE_AUTO, MODE_SCHEDULE]),
+            vol.Optional(ATTR_OPTION): vol.In(
+                [OPTION_HOME, OPTION_AWAY, OPTION_SLEEP, OPTION_CUSTOM, OPTION_FROZEN]
+            ),
+            **{vol.Optional(field): _TEMPERATURE for field in TEMPERATURE_FIELDS},
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_MODE, ATTR_OPTION, *TEMPERATURE_FIELDS),
+)
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENDPOINT_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_BUCKET, default=HISTORY_DEFAULT_BUCKET): vol.All(
+            vol.Coerce(int), vol.Range(min=60)
+        ),
+    }
+)
+
+GET_SCHEDULE_SCHEMA = vol.Schema({vol.Required(ATTR_ENDPOINT_ID): cv.string})
+
+SET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENDPOINT_ID): cv.string,
+        vol.Required(ATTR_SCHEDULE): {vol.In(WEEKDAYS): vol.All(cv.ensure_list, [dict])},
+    }
+)
+
+
+class _AccountBudget:
+    """Hesap başına eşzamanlılık ve istek aralığı sınırı."""
+
+    def __init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENCY)
+        self._lock = asyncio.Lock()
+        self._last_start = 0.0
+        self._in_flight = 0
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        self._in_flight += 1
+        async with self._lock:
+            wait = self._last_start + FLEET_MIN_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_start = time.monotonic()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Boş eşzamanlılık yuvaları ve son istekten bu yana geçen süre."""
+        return {
+            "max_concurrency": FLEET_MAX_CONCURRENCY,
+            "in_flight": self._in_flight,
+            "available": FLEET_MAX_CONCURRENCY - self._in_flight,
+            "min_request_interval": FLEET_MIN_REQUEST_INTERVAL,
+            "last_request_ago": (
+                round(time.monotonic() - self._last_start, 1) if self._last_start else None
+            ),
+        }
+
+
+def _account_budget(hass: HomeAssistant, account: str) -> _AccountBudget:
+    """Hesabın paylaşılan bütçesi; ardışık servis çağrıları da aynı sınıra tabidir."""
+    budgets: dict[str, _AccountBudget] = hass.data.setdefault(_BUDGETS, {})
+    budget = budgets.get(account)
+    if budget is None:
+        budget = budgets[account] = _AccountBudget()
+    return budget
+
+
+def account_budget_diagnostics(hass: HomeAssistant, account: str) -> Optional[dict[str, Any]]:
+    """Hesabın filo bütçesi durumu; henüz filo servisi çağrılmadıysa None."""
+    budget = hass.data.get(_BUDGETS, {}).get(account)
+    return budget.as_diagnostics() if budget else None
+
+
+def _loaded_entries(hass: HomeAssistant) -> dict[str, tuple[Any, Any]]:
+    """endpoint_id -> (config entry, coordinator)."""
+    entries = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if data:
+            coordinator = data["coordinator"]
+            entries[coordinator.endpoint_id] = (entry, coordinator)
+    return entries
+
+
+def _get_coordinator(hass: HomeAssistant, endpoint_id: str):
+    loaded = _loaded_entries(hass)
+    if endpoint_id not in loaded:
+        raise HomeAssistantError(f"Bilinmeyen endpoint: {endpoint_id}")
+    return loaded[endpoint_id][1]
+
+
+async def _async_apply(coordinator, budget: _AccountBudget, call_data: dict[str, Any]) -> dict[str, Any]:
+    """Tek endpoint'e komutları uygula (yenileme yapmadan)."""
+    temps = {
+        preset: call_data[field]
+        for field, preset in TEMPERATURE_FIELDS.items()
+        if field in call_data
+    }
+    mode = call_data.get(ATTR_MODE)
+    option = call_data.get(ATTR_OPTION)
+    if option and not mode:
+        mode = MODE_MANUAL
+
+    written = None
+    try:
+        if temps:
+            async with budget:
+                written = await coordinator.async_set_preset_temperatures(temps, refresh=False)
+                if not written:
+                    return {"ok": False, "error": "temperatures_rejected"}
+        if mode:
+            async with budget:
+                if not await coordinator.async_set_mode(mode, option, refresh=False):
+                    return {"ok": False, "error": "mode_rejected"}
+    except CosaAPIError as err:
+        return {"ok": False, "error": str(err)}
+    except asyncio.TimeoutError:
+        return {"ok": False, "error": "timeout"}
+
+    return {"ok": True, "queued": written is CosaWriteResult.QUEUED}
+
+
+async def _async_apply_to_fleet(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Birden fazla termostata aynı komutu uygula."""
+    loaded = _loaded_entries(hass)
+    endpoint_ids = call.data.get(ATTR_ENDPOINT_IDS) or list(loaded)
+
+    results: dict[str, dict[str, Any]] = {}
+    tasks: dict[str, asyncio.Task] = {}
+    for endpoint_id in dict.fromkeys(endpoint_ids):
+        if endpoint_id not in loaded:
+            results[endpoint_id] = {"ok": False, "error": "unknown_endpoint"}
+            continue
+        entry, coordinator = loaded[endpoint_id]
+        budget = _account_budget(hass, entry.data.get(CONF_EMAIL, ""))
+        tasks[endpoint_id] = hass.async_create_task(_async_apply(coordinator, budget, call.data))
+
+    if tasks:
+        for endpoint_id, result in zip(tasks, await asyncio.gather(*tasks.values())):
+            results[endpoint_id] = result
+
+    # Komut başına değil, en sonda tek seferde yenile
+    refreshed = [loaded[endpoint_id][1] for endpoint_id, result in results.items() if result.get("ok")]
+    if refreshed:
+        await asyncio.sleep(FLEET_REFRESH_DELAY)
+        await asyncio.gather(*(coordinator.async_request_refresh() for coordinator in refreshed))
+
+    _LOGGER.info(
+        "🏢 Toplu komut: %d/%d endpoint başarılı",
+        sum(1 for result in results.values() if result["ok"]), len(results),
+    )
+    return {"results": results}
+
+
+async def _async_get_history(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Yerel geçmişten aralığı dilimlere bölerek döndür."""
+    coordinator = _get_coordinator(hass, call.data[ATTR_ENDPOINT_ID])
+    end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+    start = dt_util.as_utc(call.data.get(ATTR_START) or end - HISTORY_DEFAULT_RANGE)
+    if start >= end:
+        raise HomeAssistantError("Başlangıç bitişten önce olmalı")
+    buckets = await hass.async_add_executor_job(
+        coordinator.history.downsample,
+        coordinator.endpoint_id,
+        int(start.timestamp()),
+        int(end.timestamp()),
+        call.data[ATTR_BUCKET],
+    )
+    for bucket in buckets:
+        bucket["start"] = dt_util.utc_from_timestamp(bucket["start"]).isoformat()
+    return {"history": buckets}
+
+
+async def _async_get_schedule(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Önbellekteki haftalık programı döndür."""
+    coordinator = _get_coordinator(hass, call.data[ATTR_ENDPOINT_ID])
+    schedule = coordinator.data.get("schedule") if coordinator.data else None
+    return {"schedule": schedule.to_api() if schedule else None}
+
+
+async def _async_set_schedule(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Haftalık programdaki günleri değiştir."""
+    coordinator = _get_coordinator(hass, call.data[ATTR_ENDPOINT_ID])
+    try:
+        changed = await coordinator.async_set_schedule(call.data[ATTR_SCHEDULE])
+    except CosaScheduleError as err:
+        raise ServiceValidationError(f"Program ayarlanamadı: {err}") from err
+    except CosaAPIError as err:
+        raise HomeAssistantError(f"Program gönderilemedi: {err}") from err
+    return {"changed_days": changed}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Servisleri kaydet (bir kez)."""
+    if hass.services.has_service(DOMAIN, SERVICE_APPLY_TO_FLEET):
+        return
+
+    async def async_handle_apply_to_fleet(call: ServiceCall) -> ServiceResponse:
+        return await _async_apply_to_fleet(hass, call)
+
+    async def async_handle_get_history(call: ServiceCall) -> ServiceResponse:
+        return await _async_get_history(hass, call)
+
+    async def async_handle_get_schedule(call: ServiceCall) -> ServiceResponse:
+        return await _async_get_schedule(hass, call)
+
+    async def async_handle_set_schedule(call: ServiceCall) -> ServiceResponse:
+        return await _async_set_schedule(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_TO_FLEET,
+        async_handle_apply_to_fleet,
+        schema=APPLY_TO_FLEET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_handle_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCHEDULE,
+        async_handle_get_schedule,
+        schema=GET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCHEDULE,
+        async_handle_set_schedule,
+        schema=SET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Son entry kaldırılınca servisleri sil."""
+    for service in (SERVICE_APPLY_TO_FLEET, SERVICE_GET_HISTORY, SERVICE_GET_SCHEDULE, SERVICE_SET_SCHEDULE):
+        hass.services.async_remove(DOMAIN, service)
+    hass.data.pop(_BUDGETS, None)
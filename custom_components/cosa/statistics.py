@@ -0,0 +1,137 @@
+"""COSA Uzun Dönem İstatistik Aktarımı.
+
+Yerel geçmiş deposundaki rapor örnekleri saatlik dış (external)
+istatistiklere çevrilip recorder'a toplu olarak aktarılır. Her istatistik
+son aktarılan saatten devam eder; yalnızca tamamlanmış saatler yazılır.
+Rapor örnekleri gecikmeli gelebildiği için son aktarılan saat her seferinde
+yeniden yazılır (recorder aynı başlangıçlı satırın üzerine yazar).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from typing import Any, Optional
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN, STATISTICS_IMPORT_BATCH
+from .history import TIME_COLUMN, CosaHistoryStore
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = 3600
+
+# Geçmiş sütunu -> (isim, birim, toplam mı)
+STATISTICS = {
+    "temperature": ("Sıcaklık", UnitOfTemperature.CELSIUS, False),
+    "humidity": ("Nem", PERCENTAGE, False),
+    "target_temperature": ("Hedef Sıcaklık", UnitOfTemperature.CELSIUS, False),
+    "heating": ("Isıtma Süresi", UnitOfTime.HOURS, True),
+}
+
+
+def statistic_id(endpoint_id: str, column: str) -> str:
+    return f"{DOMAIN}:{slugify(endpoint_id)}_{column}"
+
+
+def _hourly(times, values, is_flag: bool) -> list[tuple[int, list[float]]]:
+    """Örnekleri saat başlangıcına göre grupla (eksik değerler atlanır)."""
+    hours: list[tuple[int, list[float]]] = []
+    for timestamp, value in zip(times, values):
+        if (value < 0) if is_flag else math.isnan(value):
+            continue
+        hour = timestamp - timestamp % HOUR
+        if not hours or hours[-1][0] != hour:
+            hours.append((hour, []))
+        hours[-1][1].append(value)
+    return hours
+
+
+class CosaStatisticsImporter:
+    """Bir endpoint'in geçmişini recorder istatistiklerine aktarır."""
+
+    def __init__(self, hass: HomeAssistant, history: CosaHistoryStore, endpoint_id: str, name: str) -> None:
+        self._hass = hass
+        self._history = history
+        self._endpoint_id = endpoint_id
+        self._name = name
+        self._lock = asyncio.Lock()
+
+    async def _async_last(self, stat_id: str) -> Optional[dict[str, Any]]:
+        """Son aktarılan saatlik satır."""
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, stat_id, True, {"sum", "state"}
+        )
+        rows = last.get(stat_id)
+        return rows[0] if rows else None
+
+    async def async_import(self) -> int:
+        """Tamamlanmış yeni saatleri aktar; aktarılan satır sayısını döndür."""
+        if self._lock.locked():
+            return 0
+        async with self._lock:
+            now = int(dt_util.utcnow().timestamp())
+            current_hour = now - now % HOUR
+            imported = 0
+            for column, (label, unit, has_sum) in STATISTICS.items():
+                imported += await self._async_import_column(column, label, unit, has_sum, current_hour)
+            if imported:
+                _LOGGER.debug("📊 %d saatlik istatistik aktarıldı (%s)", imported, self._endpoint_id)
+            return imported
+
+    async def _async_import_column(
+        self, column: str, label: str, unit: str, has_sum: bool, current_hour: int
+    ) -> int:
+        stat_id = statistic_id(self._endpoint_id, column)
+        last = await self._async_last(stat_id)
+        # Son saat eksik aktarılmış olabilir; ondan itibaren yeniden yaz
+        start = int(last["start"]) if last else 0
+        if start >= current_hour:
+            return 0
+        window = await self._hass.async_add_executor_job(
+            self._history.query, self._endpoint_id, start, current_hour - 1, [column]
+        )
+        hours = _hourly(window[TIME_COLUMN], window[column], has_sum)
+        if not hours:
+            return 0
+
+        # Yeniden yazılan saatten önceki toplam
+        total = (last.get("sum") or 0.0) - (last.get("state") or 0.0) if last else 0.0
+        rows: list[StatisticData] = []
+        for hour, values in hours:
+            start_dt = dt_util.utc_from_timestamp(hour)
+            if has_sum:
+                # Isıtan örneklerin oranı x 1 saat
+                state = round(sum(values) / len(values), 4)
+                total += state
+                rows.append(StatisticData(start=start_dt, state=state, sum=round(total, 4)))
+            else:
+                rows.append(StatisticData(
+                    start=start_dt,
+                    mean=round(sum(values) / len(values), 2),
+                    min=min(values),
+                    max=max(values),
+                ))
+
+        metadata = StatisticMetaData(
+            has_mean=not has_sum,
+            has_sum=has_sum,
+            name=f"{self._name} {label}",
+            source=DOMAIN,
+            statistic_id=stat_id,
+            unit_of_measurement=unit,
+        )
+        for position in range(0, len(rows), STATISTICS_IMPORT_BATCH):
+            async_add_external_statistics(self._hass, metadata, rows[position:position + STATISTICS_IMPORT_BATCH])
+        return len(rows)
@@ -0,0 +1,132 @@
+"""COSA Weather Platform."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.weather import (
+    Forecast,
+    WeatherEntity,
+    WeatherEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfPressure, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.start import async_at_started
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, WEATHER_ICONS
+from .entity import CosaEntity
+from .forecast import CosaPlaceForecast
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Weather platformunu kur."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+
+    # Tahmin kritik değil; başlangıçtan sonra eklenir
+    @callback
+    def _async_add_deferred(_hass: HomeAssistant) -> None:
+        async_add_entities([CosaWeather(coordinator, config_entry)])
+
+    config_entry.async_on_unload(async_at_started(hass, _async_add_deferred))
+
+
+def _forecast(item: dict[str, Any], daily: bool) -> Forecast:
+    """Önbellekteki tahmin satırını HA Forecast sözlüğüne çevir."""
+    probability = item.get("precipProbability")
+    if probability is not None and probability <= 1:
+        probability *= 100
+    forecast = Forecast(
+        datetime=dt_util.utc_from_timestamp(item["time"]).isoformat(),
+        condition=WEATHER_ICONS.get(item.get("icon")),
+        native_temperature=item.get("temperature"),
+        native_apparent_temperature=item.get("apparentTemperature"),
+        humidity=item.get("humidity"),
+        native_pressure=item.get("pressure"),
+        precipitation_probability=None if probability is None else round(probability),
+    )
+    if daily:
+        high = item.get("temperatureHigh", item.get("temperatureMax"))
+        if high is not None:
+            forecast["native_temperature"] = high
+        forecast["native_templow"] = item.get("temperatureLow", item.get("temperatureMin"))
+    return forecast
+
+
+class CosaWeather(CosaEntity, WeatherEntity):
+    """Önbellekteki tahminden hava durumu; yalnızca tahmin yenilenince yazılır."""
+
+    _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_native_pressure_unit = UnitOfPressure.HPA
+    _attr_supported_features = WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_HOURLY
+
+    def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
+        super().__init__(coordinator, config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_weather"
+        self._attr_name = "Hava Tahmini"
+        self._written: float | None = None
+
+    @property
+    def _place(self) -> CosaPlaceForecast | None:
+        """Paylaşılan önbellekte bu cihazın yerine ait kayıt."""
+        return self.coordinator.forecast_cache.get(self.coordinator.data["endpoint"].get("place"))
+
+    @property
+    def _series(self) -> dict[str, Any]:
+        place = self._place
+        return place.series if place else {}
+
+    @property
+    def _current(self) -> dict[str, Any]:
+        hourly = self._series.get("hourly")
+        return hourly[0] if hourly else {}
+
+    @property
+    def available(self) -> bool:
+        return super().available and bool(self._current)
+
+    @property
+    def condition(self) -> str | None:
+        return WEATHER_ICONS.get(self._current.get("icon"))
+
+    @property
+    def native_temperature(self) -> float | None:
+        return self._current.get("temperature")
+
+    @property
+    def native_apparent_temperature(self) -> float | None:
+        return self._current.get("apparentTemperature")
+
+    @property
+    def humidity(self) -> float | None:
+        return self._current.get("humidity")
+
+    @property
+    def native_pressure(self) -> float | None:
+        return self._current.get("pressure")
+
+    async def async_forecast_hourly(self) -> list[Forecast] | None:
+        return [_forecast(item, False) for item in self._series.get("hourly", ())]
+
+    async def async_forecast_daily(self) -> list[Forecast] | None:
+        return [_forecast(item, True) for item in self._series.get("daily", ())]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        place = self._place
+        fetched_at = place.fetched_at if place else None
+        if self._availability_changed() or fetched_at != self._written:
+            self._written = fetched_at
+            self.async_write_ha_state()
+            self.hass.async_create_task(self.async_update_listeners(("daily", "hourly")))
+        else:
+            self.coordinator.metrics.write_suppressed()
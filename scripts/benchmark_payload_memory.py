@@ -0,0 +1,130 @@
+"""COSA yanıt projeksiyonu bellek ölçümü.
+
+Entry başına bellekte kalan bayt miktarını ham API yanıtlarıyla ve
+projeksiyon sonrası verilerle karşılaştırır.
+
+Kullanım:
+    python scripts/benchmark_payload_memory.py [--entries 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import tracemalloc
+
+# Paket __init__'i Home Assistant gerektirdiği için modül dosyadan yüklenir
+_PROJECTION_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "cosa" / "projection.py"
+_spec = importlib.util.spec_from_file_location("cosa_projection", _PROJECTION_PATH)
+projection = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(projection)
+
+
+def _sample_payloads() -> tuple[str, str, str]:
+    """Gerçek yanıtlara benzer boyutta örnek JSON metinleri."""
+    endpoint = {
+        "id": "endpoint-id",
+        "name": "Salon",
+        "place": "place-id",
+        "temperature": 21.4,
+        "humidity": 48.2,
+        "targetTemperature": 22,
+        "homeTemperature": 22,
+        "awayTemperature": 17,
+        "sleepTemperature": 19,
+        "customTemperature": 21,
+        "mode": "manual",
+        "option": "home",
+        "combiState": "on",
+        "batteryVoltage": 2.95,
+        "powerState": "level3",
+        "rssi": -61,
+        "calibration": 0.0,
+        "openWindowEnable": True,
+        "openWindowState": False,
+        "childLock": False,
+        "device": {"version": "1.4.2", "isConnected": True, "mac": "00:00:00:00:00:00", "model": "cosa"},
+        "schedule": {
+            day: [{"start": "07:00", "option": "home"}, {"start": "23:00", "option": "sleep"}]
+            for day in ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+        },
+    }
+    hour = {
+        "time": 1700000000,
+        "summary": "Parçalı bulutlu",
+        "icon": "partly-cloudy-day",
+        "temperature": 8.3,
+        "apparentTemperature": 6.1,
+        "humidity": 71,
+        "pressure": 1015.2,
+        "windSpeed": 3.4,
+        "windBearing": 220,
+        "cloudCover": 0.54,
+        "precipProbability": 0.1,
+    }
+    forecast = {
+        "place": "place-id",
+        "currently": dict(hour),
+        "hourly": [dict(hour, time=hour["time"] + i * 3600) for i in range(48)],
+        "daily": [dict(hour, temperatureHigh=12.0, temperatureLow=4.0) for _ in range(8)],
+        "ok": 1,
+    }
+    reports = {
+        "data": [
+            {"time": 1700000000 + i * 300, "temperature": 21.0, "humidity": 48.0, "targetTemperature": 22, "combiState": "on"}
+            for i in range(288)
+        ],
+        "stats": {
+            "maxTemperature": 22.1,
+            "minTemperature": 19.8,
+            "maxHumidity": 55,
+            "minHumidity": 41,
+            "placeAverageTemperature": 20.54,
+            "networkQuality": 4,
+            "offlineFor": 0,
+        },
+        "summary": {
+            "runtimes": {"total": 14400, "home": 9000, "sleep": 5400, "away": 0, "custom": 0, "frozen": 0},
+            "averageTemperatures": {"home": 21.3, "sleep": 19.9},
+        },
+    }
+    return json.dumps(endpoint), json.dumps(forecast), json.dumps(reports)
+
+
+def _retained(entries: int, project: bool) -> int:
+    """Her entry için bir poll sonucu bellekte tutulduğunda ayrılan bayt."""
+    endpoint_text, forecast_text, reports_text = _sample_payloads()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    retained = []
+    for _ in range(entries):
+        endpoint = json.loads(endpoint_text)
+        forecast = json.loads(forecast_text)
+        reports = json.loads(reports_text)
+        if project:
+            endpoint = projection.project_endpoint(endpoint)
+            forecast = projection.project_forecast(forecast)
+            reports = projection.project_reports(reports)
+        retained.append({"endpoint": endpoint, "forecast": forecast, "reports": reports})
+    current = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50)
+    args = parser.parse_args()
+
+    raw = _retained(args.entries, project=False)
+    projected = _retained(args.entries, project=True)
+    print(f"Entry sayısı     : {args.entries}")
+    print(f"Ham (entry başı) : {raw / args.entries:,.0f} bayt")
+    print(f"Projeksiyon      : {projected / args.entries:,.0f} bayt")
+    print(f"Azalma           : %{100 * (1 - projected / raw):.1f}")
+
+
+if __name__ == "__main__":
+    main()
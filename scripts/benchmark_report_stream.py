@@ -0,0 +1,118 @@
+"""COSA rapor yanıtı ayrıştırma bellek ölçümü.
+
+getReportsAnalyzed yanıtını tek seferde `json.loads` ile çözmekle akış
+ayrıştırıcısını (report_stream.parse_report) en yüksek bellek ve süre
+açısından karşılaştırır. Akış belleği düşürür ama CPU süresini artırır;
+REPORT_STREAM_THRESHOLD bu ölçüme göre seçilmiştir. ijson kurulu olmalıdır.
+
+Kullanım:
+    python scripts/benchmark_report_stream.py [--samples 2016] [--chunk 8192]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+import time
+import tracemalloc
+
+# Paket __init__'i Home Assistant gerektirdiği için modül dosyadan yüklenir
+_STREAM_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "cosa" / "report_stream.py"
+_spec = importlib.util.spec_from_file_location("cosa_report_stream", _STREAM_PATH)
+report_stream = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(report_stream)
+
+_FIELDS = ("time", "temperature", "humidity", "targetTemperature", "combiState")
+
+
+class _BytesStream:
+    """aiohttp StreamReader gibi parça parça okunan bellek içi gövde."""
+
+    def __init__(self, body: bytes, chunk: int) -> None:
+        self._body = memoryview(body)
+        self._chunk = chunk
+        self._position = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        size = self._chunk if n < 0 else min(n, self._chunk)
+        chunk = self._body[self._position:self._position + size].tobytes()
+        self._position += len(chunk)
+        return chunk
+
+
+def _sample_body(samples: int) -> bytes:
+    """Gerçek yanıta benzer rapor gövdesi (5 dakikalık örnekler)."""
+    report = {
+        "data": [
+            {
+                "time": 1700000000 + i * 300,
+                "temperature": 21.0 + (i % 7) / 10,
+                "humidity": 48.0,
+                "targetTemperature": 22,
+                "combiState": "on" if i % 3 else "off",
+                "option": "home",
+                "outdoorTemperature": 6.5,
+                "powerState": "level3",
+            }
+            for i in range(samples)
+        ],
+        "stats": {"maxTemperature": 22.1, "minTemperature": 19.8, "networkQuality": 4, "offlineFor": 0},
+        "summary": {
+            "runtimes": {"total": 14400, "home": 9000, "sleep": 5400},
+            "averageTemperatures": {"home": 21.3, "sleep": 19.9},
+        },
+    }
+    return json.dumps({"report": report, "ok": 1}).encode()
+
+
+def _measure(run) -> tuple[int, float, int]:
+    """(en yüksek bellek, süre, tutulan örnek sayısı)."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = run()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, elapsed, kept
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=2016)
+    parser.add_argument("--chunk", type=int, default=8192)
+    args = parser.parse_args()
+    body = _sample_body(args.samples)
+    # Geçmişte son yarım saat hariç her şey var: yalnızca son 6 örnek yeni
+    after = 1700000000 + (args.samples - 7) * 300
+
+    def full() -> int:
+        kept = []
+
+        def on_sample(sample):
+            if sample["time"] > after:
+                kept.append({key: sample[key] for key in _FIELDS})
+
+        report_stream.split_report(json.loads(body), on_sample)
+        return len(kept)
+
+    def streamed() -> int:
+        kept = []
+
+        def on_sample(sample):
+            if sample["time"] > after:
+                kept.append({key: sample[key] for key in _FIELDS})
+
+        asyncio.run(report_stream.parse_report(_BytesStream(body, args.chunk), on_sample))
+        return len(kept)
+
+    for label, run in (("json.loads", full), ("akış", streamed)):
+        peak, elapsed, kept = _measure(run)
+        print(f"{label:<11}: en yüksek {peak / 1024:,.0f} kB, {elapsed * 1000:,.1f} ms, {kept} yeni örnek")
+    print(f"Gövde      : {len(body) / 1024:,.0f} kB, {args.samples} örnek")
+
+
+if __name__ == "__main__":
+    main()
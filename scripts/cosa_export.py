@@ -0,0 +1,251 @@
+"""COSA veri dışa aktarma aracı.
+
+Home Assistant olmadan çalışır. İki kaynak desteklenir:
+
+* `cloud`: bir kez giriş yapar, hesaptaki tüm cihazları listeler ve her
+  biri için cihaz anlık görüntüsünü ve raporu sınırlı eşzamanlılıkla çeker.
+  Rapor serisi akış halinde ayrıştırılıp örnek örnek yazılır.
+* `history`: entegrasyonun yerel geçmiş deposundan (`.storage/cosa_history`)
+  dilimler halinde okur; ağ bağlantısı gerekmez.
+
+Çıktı JSONL (her satır bir kayıt) veya CSV'dir ve kayıtlar geldikçe
+yazılır, bellekte biriktirilmez.
+
+Kullanım:
+    COSA_EMAIL=... COSA_PASSWORD=... python scripts/cosa_export.py -o fleet.jsonl cloud --series
+    python scripts/cosa_export.py --format csv history --storage /config/.storage --start 2024-01-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+from datetime import datetime, timezone
+import importlib
+import json
+import math
+import os
+from pathlib import Path
+import sys
+import time
+import types
+from typing import Any, Iterable, Optional, TextIO
+
+# Paket __init__'i Home Assistant gerektirdiği için yalnızca HA'dan bağımsız
+# modüller, __init__ çalıştırılmadan yüklenir
+_PACKAGE = "cosa_export_pkg"
+_package = types.ModuleType(_PACKAGE)
+_package.__path__ = [str(Path(__file__).resolve().parent.parent / "custom_components" / "cosa")]
+sys.modules[_PACKAGE] = _package
+const = importlib.import_module(f"{_PACKAGE}.const")
+history_module = importlib.import_module(f"{_PACKAGE}.history")
+schedule = importlib.import_module(f"{_PACKAGE}.schedule")
+
+CSV_FIELDS = (
+    "record",
+    "endpoint_id",
+    "time",
+    "temperature",
+    "humidity",
+    "targetTemperature",
+    "combiState",
+    "mode",
+    "option",
+    "outdoor_temperature",
+)
+
+
+class _JsonlWriter:
+    def __init__(self, output: TextIO) -> None:
+        self._output = output
+        self.count = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._output.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._output.write("\n")
+        self.count += 1
+
+
+class _CsvWriter:
+    """Sabit sütunlu CSV; özet/istatistik kayıtları yalnızca JSONL'de yer alır."""
+
+    def __init__(self, output: TextIO) -> None:
+        self._writer = csv.DictWriter(output, CSV_FIELDS, extrasaction="ignore")
+        self._writer.writeheader()
+        self.count = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        if record["record"] in ("sample", "endpoint", "history", "observation"):
+            self._writer.writerow(record)
+            self.count += 1
+
+
+def _parse_time(value: Optional[str], default: int) -> int:
+    """Epoch saniyesi veya ISO tarih."""
+    if value is None:
+        return default
+    if value.isdigit():
+        return int(value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+# ===== BULUT =====
+
+def _api() -> types.ModuleType:
+    """API istemcisi (aiohttp/ijson yalnızca bulut kaynağı için gerekli)."""
+    return importlib.import_module(f"{_PACKAGE}.api")
+
+
+async def _export_endpoint(
+    api: Any, token: str, endpoint: dict[str, Any], writer: Any, series: bool, semaphore: asyncio.Semaphore
+) -> bool:
+    endpoint_id = endpoint.get("id")
+    async with semaphore:
+        def on_sample(sample: dict[str, Any]) -> None:
+            if series:
+                writer.write({"record": "sample", "endpoint_id": endpoint_id, **sample})
+
+        # Tek cihazın hatası/zaman aşımı diğer cihazların aktarımını durdurmaz
+        try:
+            detail = await api.get_endpoint_detail(endpoint_id, token)
+            writer.write({"record": "endpoint", "endpoint_id": endpoint_id, "time": int(time.time()), **detail})
+            report = await api.get_reports(endpoint_id, token, on_sample=on_sample)
+        except (_api().CosaAPIError, asyncio.TimeoutError) as err:
+            _log(f"{endpoint_id}: veri alınamadı ({err or 'zaman aşımı'})")
+            return False
+        if report:
+            writer.write({
+                "record": "report",
+                "endpoint_id": endpoint_id,
+                "summary": report.get("summary"),
+                "stats": report.get("stats"),
+            })
+        return bool(report)
+
+
+async def _export_cloud(args: argparse.Namespace, writer: Any) -> int:
+    email = args.email or os.environ.get("COSA_EMAIL")
+    password = args.password or os.environ.get("COSA_PASSWORD")
+    if not email or not password:
+        _log("E-posta ve şifre gerekli (--email/--password veya COSA_EMAIL/COSA_PASSWORD)")
+        return 2
+
+    api = _api().CosaAPI()
+    try:
+        try:
+            login = await api.login(email, password)
+            if not login.get("ok"):
+                _log(f"Giriş başarısız: {login.get('code')}")
+                return 1
+            token = login["token"]
+            endpoints = await api.get_endpoints(token)
+        except (_api().CosaAPIError, asyncio.TimeoutError) as err:
+            # Kimlik doğrulama / bağlantı hataları (CosaAuthError, CosaConnectionError)
+            _log(f"COSA bulutuna bağlanılamadı: {err or 'zaman aşımı'}")
+            return 1
+        if args.endpoint:
+            endpoints = [endpoint for endpoint in endpoints if endpoint.get("id") in args.endpoint]
+        _log(f"{len(endpoints)} cihaz dışa aktarılıyor (eşzamanlılık {args.concurrency})")
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        results = await asyncio.gather(*(
+            _export_endpoint(api, token, endpoint, writer, args.series, semaphore)
+            for endpoint in endpoints
+        ))
+    finally:
+        await api.close()
+    failed = results.count(False)
+    if failed:
+        _log(f"{failed} cihaz için veri alınamadı")
+    return 1 if failed else 0
+
+
+# ===== YEREL GEÇMİŞ =====
+
+def _history_rows(
+    store: Any, schema: dict[str, tuple[str, str]], endpoint_id: str, start: int, end: int, record: str
+) -> Iterable[dict[str, Any]]:
+    """Depoyu dilimler halinde okuyarak satır üret (CSV sütunları rapor alan adlarıyla aynı)."""
+    for window in store.iter_query(endpoint_id, start, end):
+        for index, timestamp in enumerate(window[history_module.TIME_COLUMN]):
+            row: dict[str, Any] = {"record": record, "endpoint_id": endpoint_id, "time": timestamp}
+            for name, (kind, key) in schema.items():
+                value = window[name][index]
+                if kind == "b":
+                    value = None if value < 0 else value
+                    if name == "option" and value is not None:
+                        value = schedule.OPTION_CODES[value]
+                elif math.isnan(value):
+                    value = None
+                else:
+                    value = round(value, 2)
+                row[key] = value
+            yield row
+
+
+def _export_history(args: argparse.Namespace, writer: Any) -> int:
+    now = int(time.time())
+    start = _parse_time(args.start, 0)
+    end = _parse_time(args.end, now)
+    sources = [(const.HISTORY_DIRECTORY, history_module.COLUMNS, "history")]
+    if args.observations:
+        sources.append((const.OBSERVATION_DIRECTORY, history_module.OBSERVATION_COLUMNS, "observation"))
+
+    written = writer.count
+    for directory_name, schema, record in sources:
+        directory = Path(args.storage) / directory_name
+        if not directory.is_dir():
+            _log(f"Geçmiş dizini bulunamadı: {directory}")
+            continue
+        store = history_module.CosaHistoryStore(str(directory), schema)
+        endpoint_ids = args.endpoint or sorted(path.name for path in directory.iterdir() if path.is_dir())
+        for endpoint_id in endpoint_ids:
+            for row in _history_rows(store, schema, endpoint_id, start, end, record):
+                writer.write(row)
+    return 0 if writer.count > written else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan: stdout)")
+    parser.add_argument("--endpoint", action="append", help="Yalnızca bu cihaz(lar)")
+    sources = parser.add_subparsers(dest="source", required=True)
+
+    cloud = sources.add_parser("cloud", help="COSA bulutundan cihaz ve rapor verisi")
+    cloud.add_argument("--email")
+    cloud.add_argument("--password")
+    cloud.add_argument("--concurrency", type=int, default=const.FLEET_MAX_CONCURRENCY)
+    cloud.add_argument("--series", action="store_true", help="Rapor serisi örneklerini de yaz")
+
+    history = sources.add_parser("history", help="Yerel geçmiş deposundan (çevrimdışı)")
+    history.add_argument("--storage", required=True, help="Home Assistant .storage dizini")
+    history.add_argument("--start", help="Başlangıç (epoch veya ISO)")
+    history.add_argument("--end", help="Bitiş (epoch veya ISO)")
+    history.add_argument("--observations", action="store_true", help="Dış sıcaklık/seçenek gözlemlerini de yaz")
+
+    args = parser.parse_args()
+    output = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        writer = (_CsvWriter if args.format == "csv" else _JsonlWriter)(output)
+        if args.source == "cloud":
+            status = asyncio.run(_export_cloud(args, writer))
+        else:
+            status = _export_history(args, writer)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    _log(f"{writer.count} kayıt yazıldı")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
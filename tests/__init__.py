@@ -0,0 +1 @@
+"""COSA entegrasyonu testleri."""
@@ -0,0 +1,120 @@
+"""COSA testleri için ortak fixture'lar."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cosa.api import CosaConnectionError
+from custom_components.cosa.const import CONF_ENDPOINT_ID, DOMAIN
+from custom_components.cosa.metrics import CosaRequestStats
+
+ENDPOINT_ID = "endpoint-1"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """custom_components altındaki entegrasyonu yükle."""
+    yield
+
+
+class FakeCosaAPI:
+    """Bellek içi COSA bulutu; `online` False iken yazma komutları bağlantı hatası verir."""
+
+    def __init__(self, session: Any = None) -> None:
+        self.online = True
+        self.stats = CosaRequestStats()
+        self.response_count = 0
+        self.last_response_at: Optional[float] = None
+        self.sent: list[tuple[str, dict[str, Any]]] = []
+        self.endpoint: dict[str, Any] = {
+            "id": ENDPOINT_ID,
+            "name": "Salon",
+            "temperature": 20.5,
+            "humidity": 45,
+            "targetTemperature": 21,
+            "homeTemperature": 21,
+            "awayTemperature": 15,
+            "sleepTemperature": 19,
+            "customTemperature": 20,
+            "mode": "manual",
+            "option": "home",
+            "combiState": "off",
+        }
+
+    async def login(self, email: str, password: str) -> dict[str, Any]:
+        return {"ok": 1, "token": "token"}
+
+    async def get_endpoints(self, token: Optional[str] = None) -> list[dict[str, Any]]:
+        return [dict(self.endpoint)]
+
+    async def get_endpoint_detail(self, endpoint_id: str, token: Optional[str] = None) -> dict[str, Any]:
+        return dict(self.endpoint)
+
+    async def get_forecast(self, place_id: str, token: Optional[str] = None) -> dict[str, Any]:
+        return {}
+
+    async def get_reports(self, endpoint_id: str, token: Optional[str] = None, on_sample=None) -> dict[str, Any]:
+        return {}
+
+    def _write(self, command: str, payload: dict[str, Any]) -> bool:
+        if not self.online:
+            raise CosaConnectionError(f"{command} bağlantı hatası")
+        self.sent.append((command, payload))
+        return True
+
+    async def set_target_temperatures(
+        self, endpoint_id: str, home: float, away: float, sleep: float, custom: float, token: Optional[str] = None
+    ) -> bool:
+        if not self._write("set_target_temperatures", {"home": home, "away": away, "sleep": sleep, "custom": custom}):
+            return False
+        self.endpoint.update(
+            homeTemperature=home, awayTemperature=away, sleepTemperature=sleep, customTemperature=custom
+        )
+        return True
+
+    async def set_device_settings(
+        self, endpoint_id: str, calibration: float, open_window_enable: Optional[bool] = None,
+        open_window_duration: int = 30, token: Optional[str] = None,
+    ) -> bool:
+        return self._write("set_device_settings", {
+            "calibration": calibration,
+            "open_window_enable": open_window_enable,
+            "open_window_duration": open_window_duration,
+        })
+
+    async def set_mode(
+        self, endpoint_id: str, mode: str, option: Optional[str] = None, token: Optional[str] = None
+    ) -> bool:
+        return self._write("set_mode", {"mode": mode, "option": option})
+
+    async def set_schedule(self, endpoint_id: str, schedule: dict[str, Any], token: Optional[str] = None) -> bool:
+        return self._write("set_schedule", schedule)
+
+    async def close(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_api():
+    """Entegrasyonun kullandığı istemciyi sahtesiyle değiştir."""
+    api = FakeCosaAPI()
+    with patch("custom_components.cosa.CosaAPI", return_value=api):
+        yield api
+
+
+@pytest.fixture
+async def config_entry(hass, fake_api) -> MockConfigEntry:
+    """Kurulmuş COSA config entry'si."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Salon",
+        data={"email": "user@example.com", "password": "secret", CONF_ENDPOINT_ID: ENDPOINT_ID},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
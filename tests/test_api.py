@@ -0,0 +1,91 @@
+"""API istemcisi testleri."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from custom_components.cosa.api import CosaAPI
+from custom_components.cosa.const import ENDPOINT_GET_REPORTS, REPORT_STREAM_THRESHOLD
+
+REPORT = {
+    "report": {
+        "data": [
+            # Gerçek yanıttaki gibi 5 dakikalık, 24 saatlik örnekler
+            {
+                "time": 1700000000 + index * 300,
+                "temperature": 21.5,
+                "humidity": 45.0,
+                "targetTemperature": 22,
+                "combiState": "on" if index % 3 else "off",
+                "option": "home",
+                "outdoorTemperature": 6.5,
+                "powerState": "level3",
+            }
+            for index in range(288)
+        ],
+        "stats": {"maxTemperature": 22.1, "minTemperature": 19.8},
+        "summary": {"runtimes": {"total": 14400}},
+    },
+    "ok": 1,
+}
+
+
+async def _report_server(chunked: bool) -> TestServer:
+    body = json.dumps(REPORT).encode()
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        if not chunked:
+            return web.Response(body=body, content_type="application/json")
+        # Content-Length olmadan parça parça gönder
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for position in range(0, len(body), 4096):
+            await response.write(body[position:position + 4096])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post(ENDPOINT_GET_REPORTS, handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def _get_reports(chunked: bool) -> tuple[dict, list[dict], CosaAPI]:
+    server = await _report_server(chunked)
+    samples: list[dict] = []
+    try:
+        async with ClientSession() as session:
+            api = CosaAPI(session)
+            with patch("custom_components.cosa.api.API_BASE_URL", str(server.make_url("")).rstrip("/")):
+                report = await api.get_reports("endpoint-1", "token", on_sample=samples.append)
+    finally:
+        await server.close()
+    return report, samples, api
+
+
+async def test_get_reports_streams_chunked_body(socket_enabled) -> None:
+    """Boyutu bilinmeyen gövde akış halinde ayrıştırılır, seri rapora eklenmez."""
+    with patch("custom_components.cosa.api.split_report") as split_report:
+        report, samples, api = await _get_reports(chunked=True)
+
+    split_report.assert_not_called()
+    assert report == {"stats": REPORT["report"]["stats"], "summary": REPORT["report"]["summary"]}
+    assert samples == REPORT["report"]["data"]
+    assert api.response_count == 1
+
+
+async def test_get_reports_full_day_body_takes_streaming_path(socket_enabled) -> None:
+    """Tam günlük rapor eşiği aşar ve akışla ayrıştırılır."""
+    assert len(json.dumps(REPORT)) > REPORT_STREAM_THRESHOLD
+    with patch("custom_components.cosa.api.split_report") as split_report:
+        report, samples, _ = await _get_reports(chunked=False)
+
+    split_report.assert_not_called()
+    assert report == {"stats": REPORT["report"]["stats"], "summary": REPORT["report"]["summary"]}
+    assert len(samples) == 288
@@ -0,0 +1,31 @@
+"""Tanı (diagnostics) çıktısı testleri."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.cosa.const import DOMAIN, FLEET_MAX_CONCURRENCY
+from custom_components.cosa.diagnostics import async_get_config_entry_diagnostics
+from custom_components.cosa.services import SERVICE_APPLY_TO_FLEET
+
+from .conftest import ENDPOINT_ID
+
+
+async def test_diagnostics_include_fleet_budget(hass, fake_api, config_entry) -> None:
+    """Filo servisi çağrılmadan bütçe yoktur; çağrıdan sonra hesap bütçesi raporlanır."""
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert diagnostics["fleet_budget"] is None
+
+    with patch("custom_components.cosa.services.FLEET_REFRESH_DELAY", 0):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_APPLY_TO_FLEET,
+            {"endpoint_ids": [ENDPOINT_ID], "mode": "auto"},
+            blocking=True,
+            return_response=True,
+        )
+
+    budget = (await async_get_config_entry_diagnostics(hass, config_entry))["fleet_budget"]
+    assert budget["in_flight"] == 0
+    assert budget["available"] == FLEET_MAX_CONCURRENCY
+    assert budget["last_request_ago"] is not None
@@ -0,0 +1,27 @@
+"""cosa_endpoint_changed olayı testleri."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.cosa.const import DOMAIN, EVENT_ENDPOINT_CHANGED
+
+
+async def test_event_fires_only_for_mode_and_preset_transitions(hass, fake_api, config_entry) -> None:
+    """Ölçüm değişimleri olay üretmez; mod/preset geçişi yalnızca ilgili alanlarla yayınlanır."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    events = async_capture_events(hass, EVENT_ENDPOINT_CHANGED)
+
+    fake_api.endpoint.update(temperature=21.5, humidity=50, combiState="on")
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert events == []
+
+    fake_api.endpoint.update(temperature=22.0, option="away")
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    changes = events[0].data["changes"]
+    assert set(changes) == {"option", "preset"}
+    assert changes["option"] == {"old": "home", "new": "away"}
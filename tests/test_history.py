@@ -0,0 +1,21 @@
+"""Yerel geçmiş deposu testleri."""
+
+from __future__ import annotations
+
+from custom_components.cosa.history import OBSERVATION_COLUMNS, CosaHistoryStore
+
+
+def test_cached_last_time_follows_ingest_and_reload(tmp_path) -> None:
+    """Son örnek zamanı bellekte tutulur ve diskten yüklenirken doldurulur."""
+    store = CosaHistoryStore(str(tmp_path), OBSERVATION_COLUMNS)
+    assert store.last_time("endpoint-1") is None
+    assert store.cached_last_time("endpoint-1") is None
+
+    store.ingest("endpoint-1", [{"time": 1700000300, "outdoor_temperature": 6.5, "option": 0}])
+    store.ingest("endpoint-1", [{"time": 1700000000, "outdoor_temperature": 6.0, "option": 0}])
+    assert store.cached_last_time("endpoint-1") == 1700000300
+
+    reloaded = CosaHistoryStore(str(tmp_path), OBSERVATION_COLUMNS)
+    assert reloaded.cached_last_time("endpoint-1") is None
+    assert reloaded.last_time("endpoint-1") == 1700000300
+    assert reloaded.cached_last_time("endpoint-1") == 1700000300
@@ -0,0 +1,44 @@
+"""Çevrimdışı komut günlüğü testleri."""
+
+from __future__ import annotations
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.cosa.const import DOMAIN, JOURNAL_SETTING_TARGET_TEMPERATURES
+from custom_components.cosa.journal import CosaWriteResult
+
+from .conftest import ENDPOINT_ID
+
+
+async def test_offline_writes_merge_into_one_replayed_payload(hass, fake_api, config_entry) -> None:
+    """Çevrimdışı preset değişikliği, ardından gelen hedef sıcaklık yazımıyla kaybolmaz."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    climate_id = er.async_get(hass).async_get_entity_id(
+        CLIMATE_DOMAIN, DOMAIN, f"{DOMAIN}_{config_entry.entry_id}_climate"
+    )
+    fake_api.online = False
+
+    assert await coordinator.async_set_preset_temperature("sleep", 17.0) is CosaWriteResult.QUEUED
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {ATTR_ENTITY_ID: climate_id, ATTR_TEMPERATURE: 23.0},
+        blocking=True,
+    )
+    assert fake_api.sent == []
+    assert coordinator.journal.pending_payload(ENDPOINT_ID, JOURNAL_SETTING_TARGET_TEMPERATURES) == {
+        "home": 23.0, "away": 15, "sleep": 17.0, "custom": 20,
+    }
+    # Günlükte beklerken iyimser hedef sıcaklık korunur
+    assert hass.states.get(climate_id).attributes[ATTR_TEMPERATURE] == 23.0
+
+    fake_api.online = True
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert fake_api.sent == [
+        ("set_target_temperatures", {"home": 23.0, "away": 15, "sleep": 17.0, "custom": 20}),
+    ]
+    assert len(coordinator.journal) == 0
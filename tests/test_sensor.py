@@ -0,0 +1,48 @@
+"""Gürültülü sensörlerin ölü bant / heartbeat davranışı testleri."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.cosa.const import CONF_DEADBAND_PREFIX, DOMAIN, SENSOR_HEARTBEAT_INTERVAL
+
+
+def _humidity(hass, config_entry):
+    entity_id = er.async_get(hass).async_get_entity_id(
+        SENSOR_DOMAIN, DOMAIN, f"{DOMAIN}_{config_entry.entry_id}_humidity"
+    )
+    return entity_id, hass.data[SENSOR_DOMAIN].get_entity(entity_id)
+
+
+async def _refresh(hass, config_entry) -> None:
+    await hass.data[DOMAIN][config_entry.entry_id]["coordinator"].async_refresh()
+    await hass.async_block_till_done()
+
+
+async def test_zero_deadband_publishes_every_change(hass, fake_api, config_entry) -> None:
+    """Ölü bant 0 iken en az yayın aralığı beklenmez."""
+    hass.config_entries.async_update_entry(config_entry, options={f"{CONF_DEADBAND_PREFIX}humidity": 0.0})
+    entity_id, _ = _humidity(hass, config_entry)
+    await _refresh(hass, config_entry)
+
+    fake_api.endpoint["humidity"] = 45.4
+    await _refresh(hass, config_entry)
+    assert hass.states.get(entity_id).state == "45.4"
+
+
+async def test_in_band_value_is_republished_on_heartbeat(hass, fake_api, config_entry) -> None:
+    """Bant içinde kalan değer yazılmaz, heartbeat zamanında yazılır."""
+    entity_id, entity = _humidity(hass, config_entry)
+    await _refresh(hass, config_entry)
+
+    fake_api.endpoint["humidity"] = 45.4
+    await _refresh(hass, config_entry)
+    assert hass.states.get(entity_id).state == "45"
+
+    # Yenileme gelmese de heartbeat zamanlayıcısı değeri yazar
+    entity._published_at -= SENSOR_HEARTBEAT_INTERVAL
+    entity._async_heartbeat(dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "45.4"